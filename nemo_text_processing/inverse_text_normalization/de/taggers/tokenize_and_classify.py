@@ -30,6 +30,7 @@ from nemo_text_processing.inverse_text_normalization.de.taggers.time import Time
 from nemo_text_processing.inverse_text_normalization.de.taggers.whitelist import WhiteListFst
 from nemo_text_processing.inverse_text_normalization.en.taggers.punctuation import PunctuationFst
 from nemo_text_processing.inverse_text_normalization.en.taggers.word import WordFst
+from nemo_text_processing.text_normalization.cache_utils import content_addressed_far_file
 from nemo_text_processing.text_normalization.de.taggers.cardinal import CardinalFst as TNCardinalTagger
 from nemo_text_processing.text_normalization.de.taggers.date import DateFst as TNDateTagger
 from nemo_text_processing.text_normalization.de.taggers.decimal import DecimalFst as TNDecimalTagger
@@ -77,6 +78,7 @@ class ClassifyFst(GraphFst):
         if cache_dir is not None and cache_dir != 'None':
             os.makedirs(cache_dir, exist_ok=True)
             far_file = os.path.join(cache_dir, f"de_itn_{input_case}.far")
+            far_file = content_addressed_far_file(far_file, __file__, whitelist)
         if not overwrite_cache and far_file and os.path.exists(far_file):
             self.fst = pynini.Far(far_file, mode="r")["tokenize_and_classify"]
             logger.info(f"ClassifyFst.fst was restored from {far_file}.")
@@ -41,6 +41,8 @@ class CardinalFst(GraphFst):
         input_case: accepting either "lower_cased" or "cased" input.
     """
 
+    field_order = ["negative", "integer"]
+
     def __init__(self, input_case: str = INPUT_LOWER_CASED):
         super().__init__(name="cardinal", kind="classify")
         self.input_case = input_case
@@ -147,6 +147,8 @@ class DateFst(GraphFst):
         input_case: accepting either "lower_cased" or "cased" input.
     """
 
+    field_order = ["text", "month", "day", "year"]
+
     def __init__(self, ordinal: GraphFst, input_case: str):
         super().__init__(name="date", kind="classify")
 
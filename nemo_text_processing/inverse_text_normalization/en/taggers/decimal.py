@@ -83,6 +83,8 @@ class DecimalFst(GraphFst):
         input_case: accepting either "lower_cased" or "cased" input.
     """
 
+    field_order = ["negative", "integer_part", "fractional_part", "quantity"]
+
     def __init__(self, cardinal: GraphFst, input_case: str = INPUT_LOWER_CASED):
         super().__init__(name="decimal", kind="classify")
 
@@ -38,6 +38,8 @@ class ElectronicFst(GraphFst):
         input_case: accepting either "lower_cased" or "cased" input.
     """
 
+    field_order = ["protocol", "username", "domain"]
+
     def __init__(self, input_case: str = INPUT_LOWER_CASED):
         super().__init__(name="electronic", kind="classify")
 
@@ -42,6 +42,8 @@ class MeasureFst(GraphFst):
         input_case: accepting either "lower_cased" or "cased" input.
     """
 
+    field_order = ["cardinal", "decimal", "units"]
+
     def __init__(self, cardinal: GraphFst, decimal: GraphFst, input_case: str = INPUT_LOWER_CASED):
         super().__init__(name="measure", kind="classify")
 
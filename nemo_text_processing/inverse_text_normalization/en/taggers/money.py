@@ -44,6 +44,8 @@ class MoneyFst(GraphFst):
         input_case: accepting either "lower_cased" or "cased" input.
     """
 
+    field_order = ["currency", "integer_part", "fractional_part", "quantity"]
+
     def __init__(self, cardinal: GraphFst, decimal: GraphFst, input_case: str = INPUT_LOWER_CASED):
         super().__init__(name="money", kind="classify")
         # quantity, integer_part, fractional_part, currency
@@ -75,6 +75,8 @@ class TelephoneFst(GraphFst):
         input_case: accepting either "lower_cased" or "cased" input.
     """
 
+    field_order = ["country_code", "number_part"]
+
     def __init__(self, cardinal: GraphFst, input_case: str = INPUT_LOWER_CASED):
         super().__init__(name="telephone", kind="classify")
         # country code, number_part, extension
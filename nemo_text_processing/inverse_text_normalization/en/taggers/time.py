@@ -42,6 +42,8 @@ class TimeFst(GraphFst):
         e.g. half past two -> time { hours: "2" minutes: "30" }
     """
 
+    field_order = ["hours", "minutes", "suffix", "zone"]
+
     def __init__(self, input_case: str = INPUT_LOWER_CASED):
         super().__init__(name="time", kind="classify")
         # hours, minutes, seconds, suffix, zone, style, speak_period
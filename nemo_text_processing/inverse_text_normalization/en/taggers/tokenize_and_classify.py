@@ -30,6 +30,7 @@ from nemo_text_processing.inverse_text_normalization.en.taggers.telephone import
 from nemo_text_processing.inverse_text_normalization.en.taggers.time import TimeFst
 from nemo_text_processing.inverse_text_normalization.en.taggers.whitelist import WhiteListFst
 from nemo_text_processing.inverse_text_normalization.en.taggers.word import WordFst
+from nemo_text_processing.text_normalization.cache_utils import content_addressed_far_file
 from nemo_text_processing.text_normalization.en.graph_utils import (
     INPUT_LOWER_CASED,
     GraphFst,
@@ -61,11 +62,22 @@ class ClassifyFst(GraphFst):
         whitelist: str = None,
     ):
         super().__init__(name="tokenize_and_classify", kind="classify")
+        self.field_order = {
+            "cardinal": CardinalFst.field_order,
+            "decimal": DecimalFst.field_order,
+            "measure": MeasureFst.field_order,
+            "money": MoneyFst.field_order,
+            "date": DateFst.field_order,
+            "time": TimeFst.field_order,
+            "telephone": TelephoneFst.field_order,
+            "electronic": ElectronicFst.field_order,
+        }
 
         far_file = None
         if cache_dir is not None and cache_dir != "None":
             os.makedirs(cache_dir, exist_ok=True)
             far_file = os.path.join(cache_dir, f"en_itn_{input_case}.far")
+            far_file = content_addressed_far_file(far_file, __file__, whitelist)
         if not overwrite_cache and far_file and os.path.exists(far_file):
             self.fst = pynini.Far(far_file, mode="r")["tokenize_and_classify"]
             logger.info(f"ClassifyFst.fst was restored from {far_file}.")
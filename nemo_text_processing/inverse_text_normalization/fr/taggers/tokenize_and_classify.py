@@ -36,6 +36,7 @@ from nemo_text_processing.inverse_text_normalization.fr.taggers.telephone import
 from nemo_text_processing.inverse_text_normalization.fr.taggers.time import TimeFst
 from nemo_text_processing.inverse_text_normalization.fr.taggers.whitelist import WhiteListFst
 from nemo_text_processing.inverse_text_normalization.fr.taggers.word import WordFst
+from nemo_text_processing.text_normalization.cache_utils import content_addressed_far_file
 from nemo_text_processing.text_normalization.en.graph_utils import INPUT_LOWER_CASED
 from nemo_text_processing.utils.logging import logger
 
@@ -66,6 +67,7 @@ class ClassifyFst(GraphFst):
         if cache_dir is not None and cache_dir != "None":
             os.makedirs(cache_dir, exist_ok=True)
             far_file = os.path.join(cache_dir, f"fr_itn_{input_case}.far")
+            far_file = content_addressed_far_file(far_file, __file__, whitelist)
         if not overwrite_cache and far_file and os.path.exists(far_file):
             self.fst = pynini.Far(far_file, mode="r")["tokenize_and_classify"]
             logger.info(f"ClassifyFst.fst was restored from {far_file}.")
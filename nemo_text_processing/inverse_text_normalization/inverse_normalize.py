@@ -15,12 +15,11 @@
 import os
 from argparse import ArgumentParser
 from time import perf_counter
-from typing import List
+from typing import List, Optional
 
 from nemo_text_processing.text_normalization.data_loader_utils import load_file, write_file
 from nemo_text_processing.text_normalization.en.graph_utils import INPUT_CASED, INPUT_LOWER_CASED
 from nemo_text_processing.text_normalization.normalize import Normalizer
-from nemo_text_processing.text_normalization.token_parser import TokenParser
 
 
 class InverseNormalizer(Normalizer):
@@ -38,6 +37,13 @@ class InverseNormalizer(Normalizer):
         overwrite_cache: set to True to overwrite .far files
         max_number_of_permutations_per_split: a maximum number
             of permutations which can be generated from input sequence of tokens.
+        cache_size: maximum number of inverse normalized inputs to keep in the in-memory LRU cache,
+            set to 0 to disable caching
+        token_cache_size: maximum number of verbalized tokens to memoize, set to 0 to disable memoization
+        canonical_field_order: if True, token fields are first serialized in the canonical order declared by the tagger
+            classes and the permutation search is used only if the verbalizer rejects it
+        arcsort_grammars: if True, arcs of the tagger and verbalizer graphs are sorted by input label once at
+            load time, see Normalizer.sort_grammars()
     """
 
     def __init__(
@@ -48,10 +54,19 @@ class InverseNormalizer(Normalizer):
         cache_dir: str = None,
         overwrite_cache: bool = False,
         max_number_of_permutations_per_split: int = 729,
+        cache_size: int = 0,
+        token_cache_size: int = 0,
+        canonical_field_order: bool = False,
+        arcsort_grammars: bool = True,
     ):
 
         assert input_case in ["lower_cased", "cased"]
 
+        # constructor arguments to re-create the normalizer from the .far cache in NormalizerPool workers
+        self._init_kwargs = (
+            {k: v for k, v in locals().items() if k != "self"} if type(self) is InverseNormalizer else None
+        )
+
         if lang == 'en':  # English
             from nemo_text_processing.inverse_text_normalization.en.taggers.tokenize_and_classify import ClassifyFst
             from nemo_text_processing.inverse_text_normalization.en.verbalizers.verbalize_final import (
@@ -141,9 +156,20 @@ class InverseNormalizer(Normalizer):
             cache_dir=cache_dir, whitelist=whitelist, overwrite_cache=overwrite_cache, input_case=input_case
         )
         self.verbalizer = VerbalizeFinalFst()
-        self.parser = TokenParser()
-        self.lang = lang
-        self.max_number_of_permutations_per_split = max_number_of_permutations_per_split
+        self._grammar_key = ("itn", lang, input_case, whitelist)
+        self._whitelist = whitelist
+        # ITN taggers are always loaded at once, see Normalizer.find_tags(). Spoken form of semiotic classes
+        # consists of plain words, e.g. "gmail dot com", no fast path for ITN
+        self._init_runtime_state(
+            lang=lang,
+            max_number_of_permutations_per_split=max_number_of_permutations_per_split,
+            cache_size=cache_size,
+            token_cache_size=token_cache_size,
+            fast_path=False,
+            canonical_field_order=canonical_field_order,
+            lazy_tagger=False,
+            arcsort_grammars=arcsort_grammars,
+        )
 
     def inverse_normalize_list(self, texts: List[str], verbose=False) -> List[str]:
         """
@@ -170,6 +196,34 @@ class InverseNormalizer(Normalizer):
         """
         return self.normalize(text=text, verbose=verbose)
 
+    async def ainverse_normalize_list(
+        self, texts: List[str], verbose: bool = False, timeout: Optional[float] = None
+    ) -> List[str]:
+        """
+        Coroutine version of inverse_normalize_list(), see Normalizer.anormalize_list()
+
+        Args:
+            texts: list of input strings
+            verbose: whether to print intermediate meta information
+            timeout: time in seconds to wait for all results, asyncio.TimeoutError is raised after it
+
+        Returns converted list of input strings
+        """
+        return await self.anormalize_list(texts, verbose=verbose, timeout=timeout)
+
+    async def ainverse_normalize(self, text: str, verbose: bool = False, timeout: Optional[float] = None) -> str:
+        """
+        Coroutine version of inverse_normalize(), see Normalizer.anormalize()
+
+        Args:
+            text: string that may include semiotic classes
+            verbose: whether to print intermediate meta information
+            timeout: time in seconds to wait for the result, asyncio.TimeoutError is raised after it
+
+        Returns: written form
+        """
+        return await self.anormalize(text, verbose=verbose, timeout=timeout)
+
 
 def parse_args():
     parser = ArgumentParser()
@@ -34,6 +34,7 @@ from nemo_text_processing.inverse_text_normalization.ja.taggers.punctuation impo
 from nemo_text_processing.inverse_text_normalization.ja.taggers.time import TimeFst
 from nemo_text_processing.inverse_text_normalization.ja.taggers.whitelist import WhiteListFst
 from nemo_text_processing.inverse_text_normalization.ja.taggers.word import WordFst
+from nemo_text_processing.text_normalization.cache_utils import content_addressed_far_file
 
 
 class ClassifyFst(GraphFst):
@@ -62,6 +63,7 @@ class ClassifyFst(GraphFst):
         if cache_dir is not None and cache_dir != "None":
             os.makedirs(cache_dir, exist_ok=True)
             far_file = os.path.join(cache_dir, f"jp_itn_{input_case}.far")
+            far_file = content_addressed_far_file(far_file, __file__, whitelist)
         if not overwrite_cache and far_file and os.path.exists(far_file):
             self.fst = pynini.Far(far_file, mode="r")["tokenize_and_classify"]
             logging.info(f"ClassifyFst.fst was restored from {far_file}.")
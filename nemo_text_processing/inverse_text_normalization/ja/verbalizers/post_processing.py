@@ -26,6 +26,7 @@ from nemo_text_processing.inverse_text_normalization.ja.graph_utils import (
     NEMO_SPACE,
     generator_main,
 )
+from nemo_text_processing.text_normalization.cache_utils import content_addressed_far_file
 from nemo_text_processing.utils.logging import logger
 
 
@@ -45,6 +46,7 @@ class PostProcessingFst:
         if cache_dir is not None and cache_dir != "None":
             os.makedirs(cache_dir, exist_ok=True)
             far_file = os.path.join(cache_dir, "zh_tn_post_processing.far")
+            far_file = content_addressed_far_file(far_file, __file__)
         if not overwrite_cache and far_file and os.path.exists(far_file):
             self.fst = pynini.Far(far_file, mode="r")["post_process_graph"]
             logger.info(f'Post processing graph was restored from {far_file}.')
@@ -21,6 +21,7 @@ from pynini.lib import pynutil
 from nemo_text_processing.inverse_text_normalization.ja.graph_utils import GraphFst, delete_space, generator_main
 from nemo_text_processing.inverse_text_normalization.ja.verbalizers.postprocessor import PostProcessor
 from nemo_text_processing.inverse_text_normalization.ja.verbalizers.verbalize import VerbalizeFst
+from nemo_text_processing.text_normalization.cache_utils import content_addressed_far_file
 
 # from nemo.utils import logging
 
@@ -34,6 +35,7 @@ class VerbalizeFinalFst(GraphFst):
         if cache_dir is not None and cache_dir != "None":
             os.makedirs(cache_dir, exist_ok=True)
             far_file = os.path.join(cache_dir, f"ja_tn_{deterministic}_deterministic_verbalizer.far")
+            far_file = content_addressed_far_file(far_file, __file__)
         if not overwrite_cache and far_file and os.path.exists(far_file):
             self.fst = pynini.Far(far_file, mode="r")["verbalize"]
         else:
@@ -31,6 +31,7 @@ from nemo_text_processing.text_normalization.ar.taggers.fraction import Fraction
 from nemo_text_processing.text_normalization.ar.taggers.measure import MeasureFst
 from nemo_text_processing.text_normalization.ar.taggers.money import MoneyFst
 from nemo_text_processing.text_normalization.ar.taggers.word import WordFst
+from nemo_text_processing.text_normalization.cache_utils import content_addressed_far_file
 from nemo_text_processing.text_normalization.en.taggers.punctuation import PunctuationFst
 from nemo_text_processing.utils.logging import logger
 
@@ -66,6 +67,7 @@ class ClassifyFst(GraphFst):
             far_file = os.path.join(
                 cache_dir, f"_{input_case}_ar_tn_{deterministic}_deterministic{whitelist_file}.far"
             )
+            far_file = content_addressed_far_file(far_file, __file__, whitelist)
         if not overwrite_cache and far_file and os.path.exists(far_file):
             self.fst = pynini.Far(far_file, mode="r")["tokenize_and_classify"]
             no_digits = pynini.closure(pynini.difference(NEMO_CHAR, NEMO_DIGIT))
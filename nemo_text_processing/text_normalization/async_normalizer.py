@@ -0,0 +1,187 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, List, Optional
+
+from nemo_text_processing.text_normalization.worker_pool import NormalizerPool, _process_requests
+
+EXECUTORS = ["thread", "process"]
+
+
+class _Batch:
+    """
+    Requests waiting for the batch window to close
+
+    Args:
+        handle: timer that submits the batch
+    """
+
+    def __init__(self, handle: asyncio.TimerHandle):
+        self.handle = handle
+        self.inputs = []
+        self.futures = []
+
+
+class AsyncNormalizer:
+    """
+    Runs normalizer methods for asyncio code without blocking the event loop.
+    With executor="thread" the normalizer is shared by the threads and every request is sent to the executor
+    at once, so up to max_workers requests are normalized concurrently (see Normalizer.normalize()).
+    With executor="process" a NormalizerPool is started and requests with the same method and keyword arguments
+    that arrive within batch_window seconds are sent to a worker process as one batch, which saves the
+    inter-process round trips. A cancelled or timed out request is removed from its batch if the batch wasn't
+    submitted yet, otherwise its result is discarded; a submitted batch is cancelled if all its requests are
+    cancelled before it starts. An error of one request is passed only to this request.
+
+    Args:
+        normalizer: normalizer, e.g. Normalizer or InverseNormalizer
+        executor: "thread" or "process"
+        max_workers: the number of threads or worker processes, by default the executor default
+        batch_window: time in seconds to wait for concurrent requests to join a batch, 0 to submit requests
+            of one event loop iteration together. Used with executor="process" only.
+        max_batch_size: the maximum number of requests per batch, a full batch is submitted at once.
+            Used with executor="process" only.
+        share_memory: set to True to share the grammars with the forked worker processes, see NormalizerPool
+    """
+
+    def __init__(
+        self,
+        normalizer: 'Normalizer',
+        executor: str = "thread",
+        max_workers: Optional[int] = None,
+        batch_window: float = 0.005,
+        max_batch_size: int = 32,
+        share_memory: bool = False,
+    ):
+        if executor not in EXECUTORS:
+            raise ValueError(f"executor should be one of {EXECUTORS}, got {executor}")
+        if max_batch_size <= 0:
+            raise ValueError(f"max_batch_size should be positive, got {max_batch_size}")
+        self.normalizer = normalizer
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.num_requests = 0
+        # the number of batches sent to the worker processes
+        self.num_batches = 0
+        # batches waiting for the window to close by event loop, method and keyword arguments
+        self._batches = {}
+
+        self._pool = None
+        if executor == "thread":
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="normalizer")
+        else:
+            self._pool = NormalizerPool(normalizer, n_jobs=max_workers or -1, share_memory=share_memory)
+            self._executor = self._pool._executor
+
+    async def submit(self, method: str, x: Any, timeout: Optional[float] = None, **kwargs) -> Any:
+        """
+        Applies normalizer method to the input in the executor
+
+        Args:
+            method: name of the normalizer method, e.g. "normalize"
+            x: input of the method, e.g. text
+            timeout: time in seconds to wait for the result, asyncio.TimeoutError is raised after it
+            kwargs: keyword arguments of the method, e.g. punct_post_process=True
+
+        Returns: output of the method
+        """
+        loop = asyncio.get_running_loop()
+        self.num_requests += 1
+        if self._pool is None:
+            # executor threads share the normalizer, a request doesn't wait for others
+            job = loop.run_in_executor(self._executor, partial(getattr(self.normalizer, method), x, **kwargs))
+            return await asyncio.wait_for(job, timeout)
+
+        key = (loop, method, tuple(sorted(kwargs.items())))
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = _Batch(loop.call_later(self.batch_window, self._submit_batch, key))
+
+        future = loop.create_future()
+        batch.inputs.append(x)
+        batch.futures.append(future)
+        if len(batch.futures) >= self.max_batch_size:
+            self._submit_batch(key)
+        return await asyncio.wait_for(future, timeout)
+
+    def _submit_batch(self, key: tuple):
+        """
+        Sends the requests of the batch that are still awaited to the executor
+        """
+        batch = self._batches.pop(key, None)
+        if batch is None:
+            return
+        batch.handle.cancel()
+        requests = [(x, future) for x, future in zip(batch.inputs, batch.futures) if not future.done()]
+        if not requests:
+            return
+
+        loop, method, kwargs = key
+        futures = [future for _, future in requests]
+        job = loop.run_in_executor(self._executor, _process_requests, method, [x for x, _ in requests], dict(kwargs))
+        job.add_done_callback(partial(_set_results, futures))
+        for future in futures:
+            future.add_done_callback(partial(_cancel_job, job, futures))
+        self.num_batches += 1
+
+    def close(self):
+        """
+        Shuts down the executor, requests waiting for their batch are cancelled
+        """
+        for key in list(self._batches):
+            batch = self._batches.pop(key)
+            batch.handle.cancel()
+            for future in batch.futures:
+                future.cancel()
+        if self._pool is not None:
+            self._pool.close()
+        else:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _set_results(futures: List[asyncio.Future], job: asyncio.Future):
+    """
+    Passes output or error of every request of the finished batch to the request if it's still awaited,
+    an error of the whole batch, e.g. a crashed worker process, is passed to all requests
+    """
+    if job.cancelled():
+        for future in futures:
+            future.cancel()
+        return
+    batch_error = job.exception()
+    results = job.result() if batch_error is None else [(None, batch_error)] * len(futures)
+    for future, (output, error) in zip(futures, results):
+        if future.done():
+            continue
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(output)
+
+
+def _cancel_job(job: asyncio.Future, futures: List[asyncio.Future], _: asyncio.Future):
+    """
+    Cancels the batch if none of its requests is awaited, a running batch can't be cancelled
+    """
+    if all(future.cancelled() for future in futures):
+        job.cancel()
@@ -0,0 +1,398 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import ast
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+from typing import Any, Hashable, List, Optional, Tuple
+
+from nemo_text_processing.utils.logging import logger
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses evictions maxsize currsize')
+
+# directory of the nemo_text_processing package
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_NAME = os.path.basename(PACKAGE_DIR)
+# language packages of these directories, e.g. text_normalization/en, keep grammar data in the "data" subdirectory
+GRAMMAR_DIRS = ["text_normalization", "inverse_text_normalization"]
+DATA_DIR = "data"
+FINGERPRINT_LEN = 16
+
+
+class LRUCache:
+    """
+    Bounded least-recently-used cache with hit/miss/eviction counters.
+    Used by Normalizer to store results of previously seen inputs, e.g. repeated TTS prompts.
+
+    Args:
+        maxsize: maximum number of entries to keep, the least recently used entry is evicted when the cache is full
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        if maxsize <= 0:
+            raise ValueError(f"maxsize should be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns cached value for the key and marks it as the most recently used one
+
+        Args:
+            key: cache key
+            default: value to return if the key is not in the cache
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """
+        Adds value to the cache, evicts the least recently used entry if the cache is full
+
+        Args:
+            key: cache key
+            value: value to store
+        """
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self._data[key] = value
+                return
+            self._data[key] = value
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Removes all entries and resets the counters
+        """
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Returns cache statistics: hits, misses, evictions, maxsize and current size
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._data))
+
+    def __getstate__(self):
+        # locks can't be pickled, e.g. when Normalizer is sent to joblib workers
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+def _module_file(module: str) -> Optional[str]:
+    """
+    Returns path to the source file of a nemo_text_processing module or None if it's not a module of the package
+
+    Args:
+        module: module name, e.g. "nemo_text_processing.text_normalization.en.graph_utils"
+    """
+    parts = module.split(".")
+    if parts[0] != PACKAGE_NAME:
+        return None
+    path = os.path.join(PACKAGE_DIR, *parts[1:])
+    for candidate in [path + ".py", os.path.join(path, "__init__.py")]:
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def _module_name(path: str) -> str:
+    """
+    Returns module name of a source file of the package, e.g. "nemo_text_processing.text_normalization.en"
+    for .../text_normalization/en/__init__.py
+    """
+    rel_path = os.path.splitext(os.path.relpath(path, PACKAGE_DIR))[0]
+    parts = [PACKAGE_NAME] + rel_path.split(os.sep)
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    return ".".join(parts)
+
+
+def _file_stat(path: str) -> Tuple[int, int]:
+    """
+    Returns modification time and size of the file, used to invalidate cached results of parsing the file
+    """
+    file_stat = os.stat(path)
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+@lru_cache(maxsize=None)
+def _imported_files(path: str, mtime_ns: int, size: int) -> List[str]:
+    """
+    Returns source files of the package modules imported by the file, including imports inside functions.
+    The modification time and the size invalidate the cached result, e.g. after an edit adds an import.
+
+    Args:
+        path: path to a source file of the package
+        mtime_ns: modification time of the file in nanoseconds
+        size: size of the file in bytes
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    package = _module_name(path)
+    if not path.endswith("__init__.py"):
+        package = package.rsplit(".", 1)[0]
+
+    modules = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level > 0:
+                base = package.rsplit(".", node.level - 1)[0] if node.level > 1 else package
+                module = f"{base}.{node.module}" if node.module else base
+            else:
+                module = node.module
+            modules.append(module)
+            # "from package import module"
+            modules.extend(f"{module}.{alias.name}" for alias in node.names)
+
+    files = [_module_file(module) for module in modules]
+    return sorted(set(f for f in files if f is not None))
+
+
+def _language_dir(path: str) -> Optional[str]:
+    """
+    Returns directory of the language package of a source file, e.g. .../text_normalization/en for
+    .../text_normalization/en/taggers/cardinal.py, None for files outside of language packages
+    """
+    parts = os.path.relpath(path, PACKAGE_DIR).split(os.sep)
+    if len(parts) > 2 and parts[0] in GRAMMAR_DIRS:
+        return os.path.join(PACKAGE_DIR, parts[0], parts[1])
+    return None
+
+
+def _data_files(lang_dir: str, prefix: str = DATA_DIR) -> List[str]:
+    """
+    Returns files of the data directory of the language package, the relative path of which starts with prefix
+    """
+    files = []
+    for root, dirs, file_names in os.walk(os.path.join(lang_dir, DATA_DIR)):
+        dirs[:] = [d for d in dirs if d != "__pycache__"]
+        for file_name in file_names:
+            path = os.path.join(root, file_name)
+            if os.path.relpath(path, lang_dir).replace(os.sep, "/").startswith(prefix):
+                files.append(path)
+    return files
+
+
+@lru_cache(maxsize=None)
+def _data_references(path: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, ...], Optional[Tuple[str, ...]]]:
+    """
+    Returns language packages the source file loads data from and prefixes of the data files it loads: string
+    literals of the file, e.g. get_abs_path("data/numbers/digit.tsv") or f"data/whitelist/{name}.tsv".
+    Prefixes are None if the file passes a computed path to get_abs_path(), e.g. get_abs_path(file).
+    The modification time and the size invalidate the cached result.
+
+    Args:
+        path: path to a source file of a language package
+        mtime_ns: modification time of the file in nanoseconds
+        size: size of the file in bytes
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    # get_abs_path() could be imported from another language package, e.g. ITN grammars load TN data
+    lang_dirs = {_language_dir(path)}
+    package = _module_name(path)
+    if not path.endswith("__init__.py"):
+        package = package.rsplit(".", 1)[0]
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and any(alias.name == "get_abs_path" for alias in node.names):
+            base = package.rsplit(".", node.level - 1)[0] if node.level > 1 else package
+            module = (f"{base}.{node.module}" if node.module else base) if node.level > 0 else node.module
+            module_file = _module_file(module)
+            if module_file is not None and _language_dir(module_file) is not None:
+                lang_dirs.add(_language_dir(module_file))
+
+    prefixes = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and getattr(node.func, "id", getattr(node.func, "attr", None)) == "get_abs_path":
+            arg = node.args[0] if node.args else None
+            if isinstance(arg, ast.JoinedStr) and arg.values:
+                arg = arg.values[0]
+            if not (isinstance(arg, ast.Constant) and isinstance(arg.value, str)):
+                return tuple(sorted(lang_dirs)), None
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            value = node.value.lstrip("/")
+            if value == DATA_DIR or value.startswith(DATA_DIR + "/"):
+                prefixes.add(value)
+    return tuple(sorted(lang_dirs)), tuple(sorted(prefixes))
+
+
+def _referenced_data_files(path: str) -> List[str]:
+    """
+    Returns data files the source file loads, see _data_references(). If the file passes a computed path to
+    get_abs_path(), all data files of its language are returned. The data directories are listed on every call,
+    so that a data file added since the last call is not missed.
+
+    Args:
+        path: path to a source file of the package
+    """
+    if _language_dir(path) is None:
+        return []
+    lang_dirs, prefixes = _data_references(path, *_file_stat(path))
+    if prefixes is None:
+        return sorted(f for lang_dir in lang_dirs for f in _data_files(lang_dir))
+    return sorted(set(f for lang_dir in lang_dirs for prefix in prefixes for f in _data_files(lang_dir, prefix)))
+
+
+def _dependency_files(source_file: str) -> List[str]:
+    """
+    Returns the source file, all package modules it imports (transitively) and the data files they load
+
+    Args:
+        source_file: path to the grammar source file, e.g. .../en/taggers/tokenize_and_classify.py
+    """
+    files = set()
+    queue = [os.path.abspath(source_file)]
+    while queue:
+        path = queue.pop()
+        if path in files:
+            continue
+        files.add(path)
+        queue.extend(_imported_files(path, *_file_stat(path)))
+    for path in list(files):
+        files.update(_referenced_data_files(path))
+    return sorted(files)
+
+
+@lru_cache(maxsize=None)
+def _file_digest(path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Returns hash of the file content, the modification time and the size invalidate the cached hash
+    """
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+def _sources_fingerprint(source_file: str) -> str:
+    """
+    Returns hash of the source file, of all package modules it imports (transitively), of the data files these
+    modules load and of the pynini version
+
+    Args:
+        source_file: path to the grammar source file, e.g. .../en/taggers/tokenize_and_classify.py
+    """
+    try:
+        import pynini
+
+        pynini_version = pynini.__version__
+    except (ImportError, AttributeError):
+        pynini_version = ""
+
+    h = hashlib.sha256(pynini_version.encode("utf-8"))
+    for path in _dependency_files(source_file):
+        h.update(os.path.relpath(path, PACKAGE_DIR).encode("utf-8"))
+        h.update(_file_digest(path, *_file_stat(path)))
+    return h.hexdigest()
+
+
+def grammar_fingerprint(source_file: str, whitelist: Optional[str] = None) -> str:
+    """
+    Returns hash of everything a cached grammar depends on: grammar source files, data files they load, whitelist
+    content and pynini version. The hash changes only if one of them is edited.
+
+    Args:
+        source_file: path to the source file of the grammar class, e.g. __file__ of tokenize_and_classify.py
+        whitelist: path to a file with whitelist replacements
+    """
+    h = hashlib.sha256(_sources_fingerprint(os.path.abspath(source_file)).encode("utf-8"))
+    if whitelist and os.path.isfile(whitelist):
+        with open(whitelist, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()[:FINGERPRINT_LEN]
+
+
+def prune_stale_far_files(far_file: str) -> List[str]:
+    """
+    Removes .far files cached for previous versions of the grammar: files that differ from far_file only in the
+    grammar fingerprint, and files derived from them, e.g. en_tn_classes_<old hash>_numeric.far
+
+    Args:
+        far_file: path to the content-addressed .far file of the current grammar, see content_addressed_far_file()
+
+    Returns: paths of the removed files
+    """
+    cache_dir, file_name = os.path.split(far_file)
+    base, ext = os.path.splitext(file_name)
+    prefix, fingerprint = base[: -FINGERPRINT_LEN - 1], base[-FINGERPRINT_LEN:]
+    pattern = re.compile(
+        rf"{re.escape(prefix)}_(?!{fingerprint})[0-9a-f]{{{FINGERPRINT_LEN}}}(_[^.]+)?{re.escape(ext)}"
+    )
+    removed = []
+    for name in os.listdir(cache_dir or "."):
+        if pattern.fullmatch(name):
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except FileNotFoundError:
+                # removed by another process
+                continue
+            removed.append(os.path.join(cache_dir, name))
+    return removed
+
+
+def content_addressed_far_file(far_file: str, source_file: str, whitelist: Optional[str] = None) -> str:
+    """
+    Adds grammar fingerprint to the .far cache file name, e.g. en_tn_verbalizer.far -> en_tn_verbalizer_<hash>.far,
+    so that a stale .far file is not restored after grammar sources, data or whitelist were changed.
+    If there is no .far file for the current grammar yet, the files of its previous versions are removed.
+
+    Args:
+        far_file: path to .far file
+        source_file: path to the source file of the grammar class, e.g. __file__
+        whitelist: path to a file with whitelist replacements
+    """
+    base, ext = os.path.splitext(far_file)
+    far_file = f"{base}_{grammar_fingerprint(source_file, whitelist)}{ext}"
+    if not os.path.exists(far_file) and os.path.isdir(os.path.dirname(far_file) or "."):
+        for path in prune_stale_far_files(far_file):
+            logger.info(f"Removed stale cached grammar {path}")
+    return far_file
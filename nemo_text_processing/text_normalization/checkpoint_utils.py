@@ -0,0 +1,154 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import json
+import os
+import shutil
+import stat
+from contextlib import contextmanager
+from typing import Set
+
+from nemo_text_processing.utils.logging import logger
+
+STATE_FILE = "state.json"
+COMPLETED_FILE = "completed.txt"
+
+
+def replace_file(tmp_path: str, path: str):
+    """
+    Moves a temporary file to path like os.replace(). The file gets the permissions of the replaced file or
+    the default permissions of a new file, files created by tempfile.mkstemp() are readable only by the owner.
+
+    Args:
+        tmp_path: path to the temporary file
+        path: destination path
+    """
+    if os.path.exists(path):
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    else:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    os.chmod(tmp_path, mode)
+    os.replace(tmp_path, path)
+
+
+def manifest_fingerprint(manifest: str, config: dict) -> str:
+    """
+    Returns hash of the manifest content and of the normalization configuration
+
+    Args:
+        manifest: path to .json manifest file
+        config: normalization configuration, e.g. normalizer class, language, batch size
+    """
+    h = hashlib.sha256()
+    with open(manifest, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    h.update(json.dumps(config, sort_keys=True, default=str).encode("utf-8"))
+    return h.hexdigest()
+
+
+class ManifestCheckpoint:
+    """
+    Directory with normalized shards of a manifest, used to resume interrupted normalize_manifest() runs.
+    Every shard is written to a separate file and its index is appended to completed.txt once the file is complete.
+    Shards of a previous run are reused only if the manifest and the configuration fingerprint match.
+
+    Args:
+        checkpoint_dir: path to the directory with shards
+        fingerprint: hash of the manifest and normalization configuration, see manifest_fingerprint()
+    """
+
+    def __init__(self, checkpoint_dir: str, fingerprint: str):
+        self.checkpoint_dir = checkpoint_dir
+        self.fingerprint = fingerprint
+        self.completed = set()
+
+        state_file = os.path.join(checkpoint_dir, STATE_FILE)
+        if os.path.exists(state_file):
+            with open(state_file, "r") as f:
+                state = json.load(f)
+            if state.get("fingerprint") == fingerprint:
+                self.completed = self._load_completed()
+                logger.warning(f"Resuming from {checkpoint_dir}, {len(self.completed)} shard(s) are complete")
+            else:
+                logger.warning(f"Manifest or configuration changed since {checkpoint_dir} was created, starting over")
+                shutil.rmtree(checkpoint_dir)
+
+        if not os.path.exists(state_file):
+            os.makedirs(checkpoint_dir, exist_ok=True)
+            with open(state_file, "w") as f:
+                json.dump({"fingerprint": fingerprint}, f)
+
+    def _load_completed(self) -> Set[int]:
+        """
+        Reads indices of complete shards, ignores a partially written last line
+        """
+        completed = set()
+        completed_file = os.path.join(self.checkpoint_dir, COMPLETED_FILE)
+        if not os.path.exists(completed_file):
+            return completed
+        with open(completed_file, "r") as f:
+            for line in f:
+                if line.endswith("\n"):
+                    idx = int(line)
+                    if os.path.exists(self.shard_path(idx)):
+                        completed.add(idx)
+        return completed
+
+    def shard_path(self, idx: int) -> str:
+        """
+        Returns path to the shard file
+
+        Args:
+            idx: shard index
+        """
+        return os.path.join(self.checkpoint_dir, f"{idx:06}.json")
+
+    @contextmanager
+    def open_shard(self, idx: int):
+        """
+        Opens shard file for writing, the shard is marked as complete only if the block exits without an exception
+
+        Args:
+            idx: shard index
+        """
+        tmp_path = self.shard_path(idx) + ".tmp"
+        with open(tmp_path, "w") as f_out:
+            yield f_out
+        os.replace(tmp_path, self.shard_path(idx))
+        with open(os.path.join(self.checkpoint_dir, COMPLETED_FILE), "a") as f:
+            f.write(f"{idx}\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.completed.add(idx)
+
+    def merge(self, f_out):
+        """
+        Writes all shards to the output file in order, should be called once all shards are complete
+
+        Args:
+            f_out: output file
+        """
+        for idx in range(len(self.completed)):
+            with open(self.shard_path(idx), "r") as f_in:
+                shutil.copyfileobj(f_in, f_out)
+
+    def remove(self):
+        """
+        Removes the checkpoint directory
+        """
+        shutil.rmtree(self.checkpoint_dir, ignore_errors=True)
@@ -16,9 +16,9 @@
 import json
 import re
 import string
-import sys
 import unicodedata
 from collections import defaultdict, namedtuple
+from functools import lru_cache
 from typing import Dict, List, Optional, Set, Tuple
 from unicodedata import category
 
@@ -295,67 +295,86 @@ def post_process_punct(input: str, normalized_text: str, add_unicode_punct: bool
     but it doesn't match the input and can cause issues during TTS voice generation.)
     The current function will match the punctuation and spaces of the normalized text with the input sequence.
     "12 test' example" -> "twelve test 'example" -> "twelve test' example" (the quote was shifted to match the input).
+    The occurrences of every punctuation mark are found with one scan of both texts, so that the time is linear
+    in the text length.
 
     Args:
         input: input text (original input to the NN, before normalization or tokenization)
         normalized_text: output text (output of the TN NN model)
-        add_unicode_punct: set to True to handle unicode punctuation marks as well as default string.punctuation (increases post processing time)
+        add_unicode_punct: set to True to handle unicode punctuation marks as well as default string.punctuation
     """
     # in the post-processing WFST graph "``" are repalced with '"" quotes (otherwise single quotes "`" won't be handled correctly)
     # this function fixes spaces around them based on input sequence, so here we're making the same double quote replacement
     # to make sure these new double quotes work with this function
     if "``" in input and "``" not in normalized_text:
         input = input.replace("``", '"')
-    input = [x for x in input]
-    normalized_text = [x for x in normalized_text]
-    punct_marks = [x for x in string.punctuation if x in input]
+    input_chars = set(input)
+    punct_marks = [x for x in string.punctuation if x in input_chars]
 
     if add_unicode_punct:
-        punct_unicode = [
-            chr(i)
-            for i in range(sys.maxunicode)
-            if category(chr(i)).startswith("P") and chr(i) not in punct_marks and chr(i) in input
-        ]
-        punct_marks = punct_marks.extend(punct_unicode)
+        punct_unicode = sorted(x for x in input_chars if x not in punct_marks and _is_unicode_punct(x))
+        punct_marks.extend(punct_unicode)
 
+    original_normalized_text = normalized_text
+    normalized_text = [x for x in normalized_text]
     for punct in punct_marks:
-        try:
-            equal = True
-            if input.count(punct) != normalized_text.count(punct):
-                equal = False
-            idx_in, idx_out = 0, 0
-            while punct in input[idx_in:]:
-                idx_out = normalized_text.index(punct, idx_out)
-                idx_in = input.index(punct, idx_in)
-
-                def _is_valid(idx_out, idx_in, normalized_text, input):
-                    """Check if previous or next word match (for cases when punctuation marks are part of
-                    semiotic token, i.e. some punctuation can be missing in the normalized text)"""
-                    return (idx_out > 0 and idx_in > 0 and normalized_text[idx_out - 1] == input[idx_in - 1]) or (
-                        idx_out < len(normalized_text) - 1
-                        and idx_in < len(input) - 1
-                        and normalized_text[idx_out + 1] == input[idx_in + 1]
-                    )
-
-                if not equal and not _is_valid(idx_out, idx_in, normalized_text, input):
-                    idx_in += 1
-                    continue
-                if idx_in > 0 and idx_out > 0:
-                    if normalized_text[idx_out - 1] == " " and input[idx_in - 1] != " ":
-                        normalized_text[idx_out - 1] = ""
-
-                    elif normalized_text[idx_out - 1] != " " and input[idx_in - 1] == " ":
-                        normalized_text[idx_out - 1] += " "
-
-                if idx_in < len(input) - 1 and idx_out < len(normalized_text) - 1:
-                    if normalized_text[idx_out + 1] == " " and input[idx_in + 1] != " ":
-                        normalized_text[idx_out + 1] = ""
-                    elif normalized_text[idx_out + 1] != " " and input[idx_in + 1] == " ":
-                        normalized_text[idx_out] = normalized_text[idx_out] + " "
-                idx_out += 1
-                idx_in += 1
-        except:
-            logger.info(f"Skipping post-processing of {''.join(normalized_text)} for '{punct}'")
+        input_positions = _find_all(input, punct)
+        # characters next to the already processed punctuation marks could have been changed
+        output_positions = [idx for idx in _find_all(original_normalized_text, punct) if normalized_text[idx] == punct]
+        equal = len(input_positions) == len(output_positions)
+        num_matched = 0
+        for idx_in in input_positions:
+            if num_matched == len(output_positions):
+                logger.info(f"Skipping post-processing of {''.join(normalized_text)} for '{punct}'")
+                break
+            idx_out = output_positions[num_matched]
+            if not equal and not _is_valid_punct_match(idx_out, idx_in, normalized_text, input):
+                continue
+            if idx_in > 0 and idx_out > 0:
+                if normalized_text[idx_out - 1] == " " and input[idx_in - 1] != " ":
+                    normalized_text[idx_out - 1] = ""
+
+                elif normalized_text[idx_out - 1] != " " and input[idx_in - 1] == " ":
+                    normalized_text[idx_out - 1] += " "
+
+            if idx_in < len(input) - 1 and idx_out < len(normalized_text) - 1:
+                if normalized_text[idx_out + 1] == " " and input[idx_in + 1] != " ":
+                    normalized_text[idx_out + 1] = ""
+                elif normalized_text[idx_out + 1] != " " and input[idx_in + 1] == " ":
+                    normalized_text[idx_out] = normalized_text[idx_out] + " "
+            num_matched += 1
 
     normalized_text = "".join(normalized_text)
     return re.sub(r' +', ' ', normalized_text)
+
+
+def _find_all(text: str, char: str) -> List[int]:
+    """
+    Returns positions of all occurrences of the character in the text
+    """
+    positions = []
+    idx = text.find(char)
+    while idx != -1:
+        positions.append(idx)
+        idx = text.find(char, idx + 1)
+    return positions
+
+
+def _is_valid_punct_match(idx_out: int, idx_in: int, normalized_text: List[str], input: str) -> bool:
+    """
+    Check if previous or next word match (for cases when punctuation marks are part of
+    semiotic token, i.e. some punctuation can be missing in the normalized text)
+    """
+    return (idx_out > 0 and idx_in > 0 and normalized_text[idx_out - 1] == input[idx_in - 1]) or (
+        idx_out < len(normalized_text) - 1
+        and idx_in < len(input) - 1
+        and normalized_text[idx_out + 1] == input[idx_in + 1]
+    )
+
+
+@lru_cache(maxsize=None)
+def _is_unicode_punct(char: str) -> bool:
+    """
+    Checks if the character belongs to a unicode punctuation category
+    """
+    return category(char).startswith("P")
@@ -17,6 +17,7 @@ import os
 import pynini
 from pynini.lib import pynutil
 
+from nemo_text_processing.text_normalization.cache_utils import content_addressed_far_file
 from nemo_text_processing.text_normalization.de.taggers.cardinal import CardinalFst
 from nemo_text_processing.text_normalization.de.taggers.date import DateFst
 from nemo_text_processing.text_normalization.de.taggers.decimal import DecimalFst
@@ -73,6 +74,7 @@ class ClassifyFst(GraphFst):
                 cache_dir,
                 f"_{input_case}_de_tn_{deterministic}_deterministic{whitelist_file}.far",
             )
+            far_file = content_addressed_far_file(far_file, __file__, whitelist)
         if not overwrite_cache and far_file and os.path.exists(far_file):
             self.fst = pynini.Far(far_file, mode="r")["tokenize_and_classify"]
             no_digits = pynini.closure(pynini.difference(NEMO_CHAR, NEMO_DIGIT))
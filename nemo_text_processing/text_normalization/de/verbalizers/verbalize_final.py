@@ -17,6 +17,7 @@ import os
 import pynini
 from pynini.lib import pynutil
 
+from nemo_text_processing.text_normalization.cache_utils import content_addressed_far_file
 from nemo_text_processing.text_normalization.de.verbalizers.verbalize import VerbalizeFst
 from nemo_text_processing.text_normalization.en.graph_utils import (
     GraphFst,
@@ -46,6 +47,7 @@ class VerbalizeFinalFst(GraphFst):
         if cache_dir is not None and cache_dir != "None":
             os.makedirs(cache_dir, exist_ok=True)
             far_file = os.path.join(cache_dir, f"de_tn_{deterministic}_deterministic_verbalizer.far")
+            far_file = content_addressed_far_file(far_file, __file__)
         if not overwrite_cache and far_file and os.path.exists(far_file):
             self.fst = pynini.Far(far_file, mode="r")["verbalize"]
             logger.info(f'VerbalizeFinalFst graph was restored from {far_file}.')
@@ -279,6 +279,10 @@ class GraphFst:
             for False multiple transduction are generated (used for audio-based normalization)
     """
 
+    # canonical order of the token fields expected by the verbalizer, e.g. ["integer_part", "currency_maj"],
+    # the order is tried first before permutations when Normalizer is created with canonical_field_order=True
+    field_order = None
+
     def __init__(self, name: str, kind: str, deterministic: bool = True):
         self.name = name
         self.kind = kind
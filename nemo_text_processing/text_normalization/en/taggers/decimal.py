@@ -70,6 +70,8 @@ class DecimalFst(GraphFst):
     cardinal: CardinalFst
     """
 
+    field_order = ["negative", "integer_part", "fractional_part", "quantity"]
+
     def __init__(self, cardinal: GraphFst, deterministic: bool):
         super().__init__(name="decimal", kind="classify", deterministic=deterministic)
 
@@ -41,6 +41,8 @@ class ElectronicFst(GraphFst):
             for False multiple transduction are generated (used for audio-based normalization)
     """
 
+    field_order = ["protocol", "username", "domain"]
+
     def __init__(self, cardinal: GraphFst, deterministic: bool = True):
         super().__init__(name="electronic", kind="classify", deterministic=deterministic)
 
@@ -52,6 +52,8 @@ class MeasureFst(GraphFst):
             for False multiple transduction are generated (used for audio-based normalization)
     """
 
+    field_order = ["negative", "cardinal", "decimal", "fraction", "units"]
+
     def __init__(
         self,
         cardinal: GraphFst,
@@ -51,6 +51,15 @@ class MoneyFst(GraphFst):
             for False multiple transduction are generated (used for audio-based normalization)
     """
 
+    field_order = [
+        "integer_part",
+        "fractional_part",
+        "quantity",
+        "currency_maj",
+        "currency_min",
+        "morphosyntactic_features",
+    ]
+
     def __init__(self, cardinal: GraphFst, decimal: GraphFst, deterministic: bool = True):
         super().__init__(name="money", kind="classify", deterministic=deterministic)
         cardinal_graph = cardinal.graph_with_and
@@ -48,6 +48,8 @@ class TimeFst(GraphFst):
             for False multiple transduction are generated (used for audio-based normalization)
     """
 
+    field_order = ["hours", "minutes", "seconds", "suffix", "zone"]
+
     def __init__(self, cardinal: GraphFst, deterministic: bool = True):
         super().__init__(name="time", kind="classify", deterministic=deterministic)
         suffix_labels = load_labels(get_abs_path("data/time/suffix.tsv"))
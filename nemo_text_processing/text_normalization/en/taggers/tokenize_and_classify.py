@@ -12,12 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import os
-import time
+import string
+from typing import Dict, FrozenSet, List, Optional
 
 import pynini
 from pynini.lib import pynutil
 
+from nemo_text_processing.text_normalization.cache_utils import content_addressed_far_file
 from nemo_text_processing.text_normalization.en.graph_utils import (
     NEMO_WHITE_SPACE,
     GraphFst,
@@ -45,14 +48,197 @@ from nemo_text_processing.text_normalization.en.taggers.word import WordFst
 from nemo_text_processing.text_normalization.en.verbalizers.date import DateFst as vDateFst
 from nemo_text_processing.text_normalization.en.verbalizers.ordinal import OrdinalFst as vOrdinalFst
 from nemo_text_processing.text_normalization.en.verbalizers.time import TimeFst as vTimeFst
+from nemo_text_processing.text_normalization.parallel_build import GraphTask, build_graphs
 from nemo_text_processing.utils.logging import logger
 
+# characters of the inputs that could skip the grammars, see get_plain_text_triggers()
+PLAIN_TEXT_CHARS = string.ascii_letters
+
+
+def _range_fst(
+    time: GraphFst, date: GraphFst, v_time: GraphFst, v_date: GraphFst, cardinal: GraphFst, deterministic: bool
+) -> RangeFst:
+    """
+    Creates RangeFst from the time and date taggers composed with their verbalizers
+    """
+    time_final = pynini.compose(time.fst, v_time.fst)
+    date_final = pynini.compose(date.fst, v_date.fst)
+    return RangeFst(time=time_final, date=date_final, cardinal=cardinal, deterministic=deterministic)
+
+
+def get_classify_tasks(input_case: str, deterministic: bool = True, whitelist: str = None) -> Dict[str, GraphTask]:
+    """
+    Returns build tasks of the sub-grammars of ClassifyFst, see build_graphs()
+
+    Args:
+        input_case: accepting either "lower_cased" or "cased" input.
+        deterministic: if True will provide a single transduction option,
+            for False multiple options (used for audio-based normalization)
+        whitelist: path to a file with whitelist replacements
+    """
+    d = {"deterministic": deterministic}
+    tasks = {
+        "cardinal": GraphTask(CardinalFst, {}, d),
+        "ordinal": GraphTask(OrdinalFst, {"cardinal": "cardinal"}, d),
+        "decimal": GraphTask(DecimalFst, {"cardinal": "cardinal"}, d),
+        "fraction": GraphTask(FractionFst, {"cardinal": "cardinal"}, d),
+        "measure": GraphTask(MeasureFst, {"cardinal": "cardinal", "decimal": "decimal", "fraction": "fraction"}, d),
+        "date": GraphTask(DateFst, {"cardinal": "cardinal"}, d),
+        "time": GraphTask(TimeFst, {"cardinal": "cardinal"}, d),
+        "telephone": GraphTask(TelephoneFst, {}, d),
+        "electronic": GraphTask(ElectronicFst, {"cardinal": "cardinal"}, d),
+        "money": GraphTask(MoneyFst, {"cardinal": "cardinal", "decimal": "decimal"}, d),
+        "whitelist": GraphTask(WhiteListFst, {}, dict(d, input_case=input_case, input_file=whitelist)),
+        "punct": GraphTask(PunctuationFst, {}, d),
+        "word": GraphTask(WordFst, {"punctuation": "punct"}, d),
+        "serial": GraphTask(SerialFst, {"cardinal": "cardinal", "ordinal": "ordinal"}, d),
+        "v_time": GraphTask(vTimeFst, {}, d),
+        "v_ordinal": GraphTask(vOrdinalFst, {}, d),
+        "v_date": GraphTask(vDateFst, {"ordinal": "v_ordinal"}, d),
+        "range": GraphTask(
+            _range_fst,
+            {"time": "time", "date": "date", "v_time": "v_time", "v_date": "v_date", "cardinal": "cardinal"},
+            d,
+        ),
+    }
+    if not deterministic:
+        tasks["abbreviation"] = GraphTask(AbbreviationFst, {}, d)
+    return tasks
+
+
+def get_weighted_classes(graphs: Dict[str, GraphFst], deterministic: bool = True) -> Dict[str, "pynini.FstLike"]:
+    """
+    Returns weighted semiotic class graphs by name in the order of their union in ClassifyFst
+
+    Args:
+        graphs: built sub-grammars, see get_classify_tasks()
+        deterministic: if True will provide a single transduction option,
+            for False multiple options (used for audio-based normalization)
+    """
+    money_graph = graphs["money"].fst
+
+    # A quick fix to address money ranges:
+    # $150-$200 -> one hundred and fifty dollars to two hundred dollars
+
+    dash = (pynutil.insert('name: "') + pynini.cross("-", "to") + pynutil.insert('"')).optimize()
+
+    graph_range_money = pynini.closure(
+        money_graph
+        + pynutil.insert(" }")
+        + pynutil.insert(" tokens { ")
+        + dash
+        + pynutil.insert(" } ")
+        + pynutil.insert("tokens { ")
+        + money_graph,
+        1,
+    )
+
+    classes = {
+        "whitelist": pynutil.add_weight(graphs["whitelist"].fst, 1.01),
+        "time": pynutil.add_weight(graphs["time"].fst, 1.1),
+        "date": pynutil.add_weight(graphs["date"].fst, 1.09),
+        "decimal": pynutil.add_weight(graphs["decimal"].fst, 1.1),
+        "measure": pynutil.add_weight(graphs["measure"].fst, 1.1),
+        "cardinal": pynutil.add_weight(graphs["cardinal"].fst, 1.1),
+        "ordinal": pynutil.add_weight(graphs["ordinal"].fst, 1.1),
+        "money": pynutil.add_weight(money_graph, 1.1),
+        "telephone": pynutil.add_weight(graphs["telephone"].fst, 1.1),
+        "electronic": pynutil.add_weight(graphs["electronic"].fst, 1.11),
+        "fraction": pynutil.add_weight(graphs["fraction"].fst, 1.1),
+        "range": pynutil.add_weight(graphs["range"].fst, 1.1),
+        "serial": pynutil.add_weight(graphs["serial"].fst, 1.12),  # should be higher than the rest of the classes
+        "range_money": pynutil.add_weight(graph_range_money, 1.1),
+    }
+
+    # roman_graph = RomanFst(deterministic=deterministic).fst
+    # classes["roman"] = pynutil.add_weight(roman_graph, 1.1)
+
+    if not deterministic:
+        classes["abbreviation"] = pynutil.add_weight(graphs["abbreviation"].fst, 100)
+
+    classes["word"] = pynutil.add_weight(graphs["word"].fst, 100)
+    return classes
+
+
+def get_tokenize_and_classify_graph(
+    classes: List["pynini.FstLike"], punct_graph: "pynini.FstLike"
+) -> "pynini.FstLike":
+    """
+    Returns the optimized sentence-level tagger graph: the union of the weighted semiotic class graphs
+    wrapped into tokens and interleaved with punctuation and spaces
+
+    Args:
+        classes: weighted semiotic class graphs, see get_weighted_classes()
+        punct_graph: punctuation graph
+    """
+    classify = functools.reduce(lambda graph, class_graph: graph | class_graph, classes)
+
+    punct = pynutil.insert("tokens { ") + pynutil.add_weight(punct_graph, weight=2.1) + pynutil.insert(" }")
+    punct = pynini.closure(
+        pynini.compose(pynini.closure(NEMO_WHITE_SPACE, 1), delete_extra_space)
+        | (pynutil.insert(" ") + punct)
+        | punct,
+        1,
+    )
+
+    token = pynutil.insert("tokens { ") + classify + pynutil.insert(" }")
+    token_plus_punct = (
+        pynini.closure(punct + pynutil.insert(" ")) + token + pynini.closure(pynutil.insert(" ") + punct)
+    )
+
+    graph = token_plus_punct + pynini.closure(
+        (
+            pynini.compose(pynini.closure(NEMO_WHITE_SPACE, 1), delete_extra_space)
+            | (pynutil.insert(" ") + punct + pynutil.insert(" "))
+        )
+        + token_plus_punct
+    )
+
+    graph = delete_space + graph + delete_space
+    graph |= punct
+    return graph.optimize()
+
+
+def get_plain_text_triggers(classes: Dict[str, "pynini.FstLike"]) -> Optional["pynini.FstLike"]:
+    """
+    Returns acceptor of the phrases made of PLAIN_TEXT_CHARS and single spaces that the semiotic classes other than
+    word accept, e.g. whitelist entries "World War II" or "St Mary", or None if the classes accept an unbounded number
+    of such phrases. A text of PLAIN_TEXT_CHARS and spaces that doesn't contain any of the phrases as a sequence of
+    whole words is tagged as plain words, i.e. normalized to itself.
+
+    Args:
+        classes: weighted semiotic class graphs, see get_weighted_classes()
+    """
+    letters = pynini.union(*PLAIN_TEXT_CHARS)
+    plain_text = (pynini.closure(letters, 1) + pynini.closure(" " + pynini.closure(letters, 1))).optimize()
+    triggers = pynini.Fst()
+    for name, class_graph in classes.items():
+        if name != "word":
+            triggers |= pynini.compose(plain_text, class_graph).project("input")
+    triggers = triggers.rmepsilon().optimize()
+    if triggers.properties(pynini.CYCLIC, True) == pynini.CYCLIC:
+        return None
+    return triggers
+
+
+def plain_text_trigger_phrases(triggers: Optional["pynini.FstLike"]) -> Optional[FrozenSet[str]]:
+    """
+    Returns the phrases accepted by the acceptor returned by get_plain_text_triggers()
+    """
+    if triggers is None:
+        return None
+    if triggers.num_states() == 0:
+        return frozenset()
+    return frozenset(triggers.paths().istrings())
+
 
 class ClassifyFst(GraphFst):
     """
     Final class that composes all other classification grammars. This class can process an entire sentence including punctuation.
     For deployment, this grammar will be compiled and exported to OpenFst Finite State Archive (FAR) File.
     More details to deployment at NeMo/tools/text_processing_deployment.
+    With cache_dir every sub-grammar is also cached separately, so that e.g. a whitelist edit only rebuilds the
+    whitelist grammar and the final union.
 
     Args:
         input_case: accepting either "lower_cased" or "cased" input.
@@ -61,8 +247,25 @@ class ClassifyFst(GraphFst):
         cache_dir: path to a dir with .far grammar file. Set to None to avoid using cache.
         overwrite_cache: set to True to overwrite .far files
         whitelist: path to a file with whitelist replacements
+        n_jobs: the number of processes to build independent sub-grammars in parallel, e.g. ordinal and decimal
+            after cardinal, see build_graphs()
     """
 
+    # phrases that could change plain text, see get_plain_text_triggers(), None if unknown
+    plain_text_triggers = None
+
+    field_order = {
+        "cardinal": CardinalFst.field_order,
+        "decimal": DecimalFst.field_order,
+        "fraction": FractionFst.field_order,
+        "measure": MeasureFst.field_order,
+        "money": MoneyFst.field_order,
+        "date": DateFst.field_order,
+        "time": TimeFst.field_order,
+        "telephone": TelephoneFst.field_order,
+        "electronic": ElectronicFst.field_order,
+    }
+
     def __init__(
         self,
         input_case: str,
@@ -70,6 +273,7 @@ class ClassifyFst(GraphFst):
         cache_dir: str = None,
         overwrite_cache: bool = False,
         whitelist: str = None,
+        n_jobs: int = 1,
     ):
         super().__init__(name="tokenize_and_classify", kind="classify", deterministic=deterministic)
 
@@ -81,161 +285,26 @@ class ClassifyFst(GraphFst):
                 cache_dir,
                 f"en_tn_{deterministic}_deterministic_{input_case}_{whitelist_file}_tokenize.far",
             )
+            far_file = content_addressed_far_file(far_file, __file__, whitelist)
         if not overwrite_cache and far_file and os.path.exists(far_file):
-            self.fst = pynini.Far(far_file, mode="r")["tokenize_and_classify"]
+            far = pynini.Far(far_file, mode="r")
+            self.fst = far["tokenize_and_classify"]
+            if deterministic and far.find("plain_text_triggers"):
+                self.plain_text_triggers = plain_text_trigger_phrases(far.get_fst())
             logger.info(f"ClassifyFst.fst was restored from {far_file}.")
         else:
             logger.info(f"Creating ClassifyFst grammars.")
 
-            start_time = time.time()
-            cardinal = CardinalFst(deterministic=deterministic)
-            cardinal_graph = cardinal.fst
-            logger.debug(f"cardinal: {time.time() - start_time: .2f}s -- {cardinal_graph.num_states()} nodes")
-
-            start_time = time.time()
-            ordinal = OrdinalFst(cardinal=cardinal, deterministic=deterministic)
-            ordinal_graph = ordinal.fst
-            logger.debug(f"ordinal: {time.time() - start_time: .2f}s -- {ordinal_graph.num_states()} nodes")
-
-            start_time = time.time()
-            decimal = DecimalFst(cardinal=cardinal, deterministic=deterministic)
-            decimal_graph = decimal.fst
-            logger.debug(f"decimal: {time.time() - start_time: .2f}s -- {decimal_graph.num_states()} nodes")
-
-            start_time = time.time()
-            fraction = FractionFst(deterministic=deterministic, cardinal=cardinal)
-            fraction_graph = fraction.fst
-            logger.debug(f"fraction: {time.time() - start_time: .2f}s -- {fraction_graph.num_states()} nodes")
-
-            start_time = time.time()
-            measure = MeasureFst(
-                cardinal=cardinal,
-                decimal=decimal,
-                fraction=fraction,
-                deterministic=deterministic,
-            )
-            measure_graph = measure.fst
-            logger.debug(f"measure: {time.time() - start_time: .2f}s -- {measure_graph.num_states()} nodes")
-
-            start_time = time.time()
-            date_graph = DateFst(cardinal=cardinal, deterministic=deterministic).fst
-            logger.debug(f"date: {time.time() - start_time: .2f}s -- {date_graph.num_states()} nodes")
-
-            start_time = time.time()
-            time_graph = TimeFst(cardinal=cardinal, deterministic=deterministic).fst
-            logger.debug(f"time: {time.time() - start_time: .2f}s -- {time_graph.num_states()} nodes")
-
-            start_time = time.time()
-            telephone_graph = TelephoneFst(deterministic=deterministic).fst
-            logger.debug(f"telephone: {time.time() - start_time: .2f}s -- {telephone_graph.num_states()} nodes")
-
-            start_time = time.time()
-            electonic_graph = ElectronicFst(cardinal=cardinal, deterministic=deterministic).fst
-            logger.debug(f"electronic: {time.time() - start_time: .2f}s -- {electonic_graph.num_states()} nodes")
-
-            start_time = time.time()
-            money_graph = MoneyFst(cardinal=cardinal, decimal=decimal, deterministic=deterministic).fst
-            logger.debug(f"money: {time.time() - start_time: .2f}s -- {money_graph.num_states()} nodes")
-
-            start_time = time.time()
-            whitelist_graph = WhiteListFst(
-                input_case=input_case, deterministic=deterministic, input_file=whitelist
-            ).fst
-            logger.debug(f"whitelist: {time.time() - start_time: .2f}s -- {whitelist_graph.num_states()} nodes")
-
-            start_time = time.time()
-            punctuation = PunctuationFst(deterministic=deterministic)
-            punct_graph = punctuation.fst
-            logger.debug(f"punct: {time.time() - start_time: .2f}s -- {punct_graph.num_states()} nodes")
-
-            start_time = time.time()
-            word_graph = WordFst(punctuation=punctuation, deterministic=deterministic).fst
-            logger.debug(f"word: {time.time() - start_time: .2f}s -- {word_graph.num_states()} nodes")
-
-            start_time = time.time()
-            serial_graph = SerialFst(cardinal=cardinal, ordinal=ordinal, deterministic=deterministic).fst
-            logger.debug(f"serial: {time.time() - start_time: .2f}s -- {serial_graph.num_states()} nodes")
-
-            start_time = time.time()
-            v_time_graph = vTimeFst(deterministic=deterministic).fst
-            v_ordinal_graph = vOrdinalFst(deterministic=deterministic)
-            v_date_graph = vDateFst(ordinal=v_ordinal_graph, deterministic=deterministic).fst
-            time_final = pynini.compose(time_graph, v_time_graph)
-            date_final = pynini.compose(date_graph, v_date_graph)
-            range_graph = RangeFst(
-                time=time_final,
-                date=date_final,
-                cardinal=cardinal,
-                deterministic=deterministic,
-            ).fst
-            logger.debug(f"range: {time.time() - start_time: .2f}s -- {range_graph.num_states()} nodes")
-
-            # A quick fix to address money ranges:
-            # $150-$200 -> one hundred and fifty dollars to two hundred dollars
-
-            dash = (pynutil.insert('name: "') + pynini.cross("-", "to") + pynutil.insert('"')).optimize()
-
-            graph_range_money = pynini.closure(
-                money_graph
-                + pynutil.insert(" }")
-                + pynutil.insert(" tokens { ")
-                + dash
-                + pynutil.insert(" } ")
-                + pynutil.insert("tokens { ")
-                + money_graph,
-                1,
-            )
-
-            classify = (
-                pynutil.add_weight(whitelist_graph, 1.01)
-                | pynutil.add_weight(time_graph, 1.1)
-                | pynutil.add_weight(date_graph, 1.09)
-                | pynutil.add_weight(decimal_graph, 1.1)
-                | pynutil.add_weight(measure_graph, 1.1)
-                | pynutil.add_weight(cardinal_graph, 1.1)
-                | pynutil.add_weight(ordinal_graph, 1.1)
-                | pynutil.add_weight(money_graph, 1.1)
-                | pynutil.add_weight(telephone_graph, 1.1)
-                | pynutil.add_weight(electonic_graph, 1.11)
-                | pynutil.add_weight(fraction_graph, 1.1)
-                | pynutil.add_weight(range_graph, 1.1)
-                | pynutil.add_weight(serial_graph, 1.12)  # should be higher than the rest of the classes
-                | pynutil.add_weight(graph_range_money, 1.1)
-            )
-
-            # roman_graph = RomanFst(deterministic=deterministic).fst
-            # classify |= pynutil.add_weight(roman_graph, 1.1)
-
-            if not deterministic:
-                abbreviation_graph = AbbreviationFst(deterministic=deterministic).fst
-                classify |= pynutil.add_weight(abbreviation_graph, 100)
-
-            punct = pynutil.insert("tokens { ") + pynutil.add_weight(punct_graph, weight=2.1) + pynutil.insert(" }")
-            punct = pynini.closure(
-                pynini.compose(pynini.closure(NEMO_WHITE_SPACE, 1), delete_extra_space)
-                | (pynutil.insert(" ") + punct)
-                | punct,
-                1,
-            )
-
-            classify |= pynutil.add_weight(word_graph, 100)
-            token = pynutil.insert("tokens { ") + classify + pynutil.insert(" }")
-            token_plus_punct = (
-                pynini.closure(punct + pynutil.insert(" ")) + token + pynini.closure(pynutil.insert(" ") + punct)
-            )
-
-            graph = token_plus_punct + pynini.closure(
-                (
-                    pynini.compose(pynini.closure(NEMO_WHITE_SPACE, 1), delete_extra_space)
-                    | (pynutil.insert(" ") + punct + pynutil.insert(" "))
-                )
-                + token_plus_punct
-            )
-
-            graph = delete_space + graph + delete_space
-            graph |= punct
-
-            self.fst = graph.optimize()
+            tasks = get_classify_tasks(input_case=input_case, deterministic=deterministic, whitelist=whitelist)
+            graphs = build_graphs(tasks, n_jobs=n_jobs, cache_dir=cache_dir, overwrite_cache=overwrite_cache)
+            classes = get_weighted_classes(graphs, deterministic=deterministic)
+            self.fst = get_tokenize_and_classify_graph(list(classes.values()), graphs["punct"].fst)
+            # non-deterministic grammars give several normalization options of plain words too
+            triggers = get_plain_text_triggers(classes) if deterministic else None
+            self.plain_text_triggers = plain_text_trigger_phrases(triggers)
 
             if far_file:
-                generator_main(far_file, {"tokenize_and_classify": self.fst})
+                far_graphs = {"tokenize_and_classify": self.fst}
+                if triggers is not None:
+                    far_graphs["plain_text_triggers"] = triggers
+                generator_main(far_file, far_graphs)
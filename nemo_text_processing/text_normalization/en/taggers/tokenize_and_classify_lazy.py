@@ -0,0 +1,245 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import re
+import tempfile
+import threading
+from typing import Dict, FrozenSet
+
+import pynini
+
+from nemo_text_processing.text_normalization.cache_utils import content_addressed_far_file
+from nemo_text_processing.text_normalization.en.graph_utils import GraphFst, generator_main
+from nemo_text_processing.text_normalization.en.taggers.tokenize_and_classify import (
+    ClassifyFst,
+    get_classify_tasks,
+    get_plain_text_triggers,
+    get_tokenize_and_classify_graph,
+    get_weighted_classes,
+    plain_text_trigger_phrases,
+)
+from nemo_text_processing.text_normalization.en.utils import get_abs_path, load_labels
+from nemo_text_processing.text_normalization.parallel_build import build_graphs
+from nemo_text_processing.utils.logging import logger
+
+# semiotic classes that are always loaded
+CORE_CLASSES = ["whitelist", "cardinal", "word"]
+
+# groups of semiotic classes that are loaded on first need, a group is used for a sentence only if its trigger matches
+LAZY_CLASS_GROUPS = {
+    "numeric": [
+        "time",
+        "date",
+        "decimal",
+        "measure",
+        "ordinal",
+        "money",
+        "telephone",
+        "fraction",
+        "range",
+        "range_money",
+    ],
+    "electronic": ["electronic"],
+    "serial": ["serial"],
+}
+
+# triggers of the lazy groups, they are conservative: a group is included whenever its classes could match
+GROUP_TRIGGERS = {
+    # digits and vulgar fractions, e.g. "½"
+    "numeric": re.compile(r"\d|[\u00bc-\u00be\u2150-\u215e]"),
+    # e-mails, urls, domain names, slash-separated words and credit card cues followed by digits,
+    # e.g. "nvidia.com", "upgrade/update" or "card ending in 8876", see ElectronicFst
+    "electronic": re.compile(
+        r"@|://|www\.|\w\.\w|/|"
+        + "|".join(re.escape(cue) + r"\d" for cue, *_ in load_labels(get_abs_path("data/electronic/cc_cues.tsv")))
+    ),
+    # alphanumeric strings and strings with symbols handled by SerialFst, e.g. "B2", "f++" or "#hashtag"
+    "serial": re.compile(r"\d|[^\w\s.,!?;:'\"()\[\]\-]"),
+}
+
+
+def _write_far(far_file: str, graphs: Dict[str, "pynini.FstLike"]):
+    """
+    Writes .far file atomically, so that other threads and processes never read a partially written file
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(far_file), suffix=".tmp")
+    os.close(fd)
+    try:
+        generator_main(tmp_path, graphs)
+        os.replace(tmp_path, far_file)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def detect_groups(text: str) -> FrozenSet[str]:
+    """
+    Returns names of the lazy class groups whose triggers match the text, see LAZY_CLASS_GROUPS
+
+    Args:
+        text: input text
+    """
+    return frozenset(group for group, trigger in GROUP_TRIGGERS.items() if trigger.search(text))
+
+
+class LazyClassifyFst(GraphFst):
+    """
+    Two-level version of ClassifyFst for deterministic English TN. Only the core classes (whitelist, cardinal,
+    word and punctuation) are loaded at startup, rarely used classes are read from the .far file on first need.
+    A sentence is tagged with the union of the core classes and of the lazy class groups whose triggers match the
+    sentence (see detect_groups()), e.g. a sentence without digits is never composed with the date or money graphs.
+    Sentence-level graphs are built once per combination of groups and cached in memory and in cache_dir.
+
+    Args:
+        input_case: accepting either "lower_cased" or "cased" input.
+        deterministic: only deterministic grammars are supported
+        cache_dir: path to a dir with .far grammar files. Set to None to avoid using cache,
+            all classes are kept in memory in this case.
+        overwrite_cache: set to True to overwrite .far files
+        whitelist: path to a file with whitelist replacements
+        n_jobs: the number of processes to build independent sub-grammars in parallel, see build_graphs()
+    """
+
+    field_order = ClassifyFst.field_order
+    plain_text_triggers = None
+
+    def __init__(
+        self,
+        input_case: str,
+        deterministic: bool = True,
+        cache_dir: str = None,
+        overwrite_cache: bool = False,
+        whitelist: str = None,
+        n_jobs: int = 1,
+    ):
+        if not deterministic:
+            raise ValueError("LazyClassifyFst only supports deterministic grammars")
+        super().__init__(name="tokenize_and_classify", kind="classify", deterministic=True)
+        self.overwrite_cache = overwrite_cache
+
+        self.far_file = None
+        if cache_dir is not None and cache_dir != "None":
+            os.makedirs(cache_dir, exist_ok=True)
+            whitelist_file = os.path.basename(whitelist) if whitelist else ""
+            far_file = os.path.join(cache_dir, f"en_tn_True_deterministic_{input_case}_{whitelist_file}_classes.far")
+            self.far_file = content_addressed_far_file(far_file, __file__, whitelist)
+
+        lazy_classes = set(name for classes in LAZY_CLASS_GROUPS.values() for name in classes)
+        if not overwrite_cache and self.far_file and os.path.exists(self.far_file):
+            far = pynini.Far(self.far_file, mode="r")
+            self.class_order = far["class_order"].string().split()
+            self.classes = {name: far[name] for name in CORE_CLASSES + ["punct"]}
+            if far.find("plain_text_triggers"):
+                self.plain_text_triggers = plain_text_trigger_phrases(far.get_fst())
+            logger.info(f"LazyClassifyFst core classes were restored from {self.far_file}.")
+        else:
+            logger.info(f"Creating LazyClassifyFst grammars.")
+            tasks = get_classify_tasks(input_case=input_case, deterministic=True, whitelist=whitelist)
+            graphs = build_graphs(tasks, n_jobs=n_jobs, cache_dir=cache_dir, overwrite_cache=overwrite_cache)
+            self.classes = get_weighted_classes(graphs, deterministic=True)
+            self.classes["punct"] = graphs["punct"].fst
+            self.class_order = [name for name in self.classes if name != "punct"]
+            unknown = set(self.class_order) - lazy_classes - set(CORE_CLASSES)
+            if unknown:
+                raise ValueError(f"Semiotic classes {unknown} are neither core nor lazy classes")
+            triggers = get_plain_text_triggers(self.classes)
+            self.plain_text_triggers = plain_text_trigger_phrases(triggers)
+
+            if self.far_file:
+                classes = dict(self.classes, class_order=pynini.accep(" ".join(self.class_order)))
+                if triggers is not None:
+                    classes["plain_text_triggers"] = triggers
+                _write_far(self.far_file, classes)
+                # lazy classes are read from the .far file on first need
+                self.classes = {name: self.classes[name] for name in CORE_CLASSES + ["punct"]}
+
+        # sentence-level graphs by combination of lazy groups
+        self.graphs = {}
+        # normalize() is reentrant, graphs and classes are loaded once under the lock
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _load_class(self, name: str) -> "pynini.FstLike":
+        """
+        Returns weighted semiotic class graph, reads it from the .far file if it's not loaded yet.
+        Called with the lock held.
+        """
+        if name not in self.classes:
+            self.classes[name] = pynini.Far(self.far_file, mode="r")[name]
+            logger.debug(f"{name} was loaded from {self.far_file}")
+        return self.classes[name]
+
+    def get_graph(self, groups: FrozenSet[str]) -> "pynini.FstLike":
+        """
+        Returns sentence-level tagger graph with the core classes and the classes of the given lazy groups
+
+        Args:
+            groups: names of lazy class groups, see LAZY_CLASS_GROUPS
+        """
+        graph = self.graphs.get(groups)
+        if graph is not None:
+            return graph
+        with self._lock:
+            if groups not in self.graphs:
+                self.graphs[groups] = self._build_graph(groups)
+            return self.graphs[groups]
+
+    def _build_graph(self, groups: FrozenSet[str]) -> "pynini.FstLike":
+        """
+        Reads sentence-level tagger graph of the combination of groups from cache_dir or builds it.
+        Called with the lock held.
+        """
+        far_file = None
+        if self.far_file:
+            base, ext = os.path.splitext(self.far_file)
+            far_file = f"{base}_{'_'.join(['core'] + sorted(groups))}{ext}"
+        if not self.overwrite_cache and far_file and os.path.exists(far_file):
+            graph = pynini.Far(far_file, mode="r")["tokenize_and_classify"]
+        else:
+            names = set(CORE_CLASSES)
+            for group in groups:
+                names.update(LAZY_CLASS_GROUPS[group])
+            classes = [self._load_class(name) for name in self.class_order if name in names]
+            graph = get_tokenize_and_classify_graph(classes, self.classes["punct"])
+            if far_file:
+                _write_far(far_file, {"tokenize_and_classify": graph})
+        # the graph is the right operand of composition with the input string, see Normalizer.sort_grammars()
+        return graph.arcsort(sort_type="ilabel")
+
+    def get_fst(self, text: str) -> "pynini.FstLike":
+        """
+        Returns tagger graph for the text, see detect_groups()
+
+        Args:
+            text: input text
+        """
+        return self.get_graph(detect_groups(text))
+
+    @property
+    def fst(self) -> "pynini.FstLike":
+        # the full tagger, equivalent to ClassifyFst.fst
+        return self.get_graph(frozenset(LAZY_CLASS_GROUPS))
+
+    @fst.setter
+    def fst(self, fst):
+        self._fst = fst
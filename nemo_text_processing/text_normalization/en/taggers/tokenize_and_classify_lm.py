@@ -18,6 +18,7 @@ import pynini
 from pynini.examples import plurals
 from pynini.lib import pynutil
 
+from nemo_text_processing.text_normalization.cache_utils import content_addressed_far_file
 from nemo_text_processing.text_normalization.en.graph_utils import (
     NEMO_CHAR,
     NEMO_DIGIT,
@@ -92,6 +93,7 @@ class ClassifyFst(GraphFst):
             far_file = os.path.join(
                 cache_dir, f"_{input_case}_en_tn_{deterministic}_deterministic{whitelist_file}_lm.far"
             )
+            far_file = content_addressed_far_file(far_file, __file__, whitelist)
         if not overwrite_cache and far_file and os.path.exists(far_file):
             self.fst = pynini.Far(far_file, mode='r')['tokenize_and_classify']
             no_digits = pynini.closure(pynini.difference(NEMO_CHAR, NEMO_DIGIT))
@@ -17,6 +17,7 @@ import os
 import pynini
 from pynini.lib import pynutil
 
+from nemo_text_processing.text_normalization.cache_utils import content_addressed_far_file
 from nemo_text_processing.text_normalization.en.graph_utils import (
     NEMO_CHAR,
     NEMO_DIGIT,
@@ -92,6 +93,7 @@ class ClassifyFst(GraphFst):
             far_file = os.path.join(
                 cache_dir, f"_{input_case}_en_tn_{deterministic}_deterministic{whitelist_file}.far"
             )
+            far_file = content_addressed_far_file(far_file, __file__, whitelist)
         if not overwrite_cache and far_file and os.path.exists(far_file):
             self.fst = pynini.Far(far_file, mode='r')['tokenize_and_classify']
             logger.info(f'ClassifyFst.fst was restored from {far_file}.')
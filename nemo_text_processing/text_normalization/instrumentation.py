@@ -0,0 +1,317 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import bisect
+import heapq
+import itertools
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+# upper bounds of the histogram buckets of stage timings in milliseconds
+TIME_BUCKETS_MS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+# upper bounds of the histogram buckets of counters, e.g. lattice states or permutations
+COUNT_BUCKETS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000, 100000]
+
+
+class Histogram:
+    """
+    Histogram with fixed buckets, the last bucket collects values above the last upper bound
+
+    Args:
+        buckets: sorted upper bounds of the buckets
+    """
+
+    def __init__(self, buckets: List[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def add(self, value: float):
+        """
+        Adds value to the histogram
+
+        Args:
+            value: value to add
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def percentile(self, p: float) -> float:
+        """
+        Returns upper bound of the bucket of the p-th percentile, the maximum value for the last bucket
+
+        Args:
+            p: percentile, e.g. 95
+        """
+        rank = p / 100 * self.count
+        for bound, total in zip(self.buckets + [self.max], itertools.accumulate(self.counts)):
+            if total >= rank and total > 0:
+                return min(bound, self.max)
+        return 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "buckets": dict(zip([str(b) for b in self.buckets] + ["inf"], self.counts)),
+        }
+
+
+class ClassStats:
+    """
+    Aggregated verbalization cost of a semiotic class, e.g. "date", with the most expensive examples
+
+    Args:
+        num_worst: number of the most expensive examples to keep
+    """
+
+    def __init__(self, num_worst: int = 5):
+        self.num_worst = num_worst
+        self.count = 0
+        self.total = 0.0
+        self.permutations = 0.0
+        self._worst = []
+
+    def add(self, secs: float, permutations: float, text: str, token: dict):
+        """
+        Adds verbalization cost of a token of the class
+
+        Args:
+            secs: verbalization time attributed to the token
+            permutations: number of permutations attributed to the token
+            text: input text the token comes from
+            token: parsed token
+        """
+        self.count += 1
+        self.total += secs
+        self.permutations += permutations
+        # the count breaks ties, tokens are not comparable
+        item = (secs, self.count, text, token, permutations)
+        if len(self._worst) < self.num_worst:
+            heapq.heappush(self._worst, item)
+        elif self.num_worst > 0:
+            heapq.heappushpop(self._worst, item)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total * 1000 / self.count if self.count else 0.0,
+            "permutations": self.permutations,
+            "mean_permutations": self.permutations / self.count if self.count else 0.0,
+            "worst": [
+                {"text": text, "token": token, "ms": secs * 1000, "permutations": permutations}
+                for secs, _, text, token, permutations in sorted(self._worst, key=lambda x: x[:2], reverse=True)
+            ],
+        }
+
+
+class NormalizationTrace:
+    """
+    Per-call record of a normalize() call: exclusive time of every stage and counters, e.g. lattice sizes
+
+    Args:
+        text: input text
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.timings = defaultdict(float)
+        self.counters = defaultdict(int)
+        self.total = 0.0
+        # verbalization cost of the parsed tokens: (class name, seconds, permutations, token)
+        self.classes = []
+        # time spent in the nested stages of the running stages
+        self._nested = []
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Measures time of the stage, time of the nested stages is excluded, e.g. permutation generation
+        doesn't include verbalizer composition of every permutation
+
+        Args:
+            name: stage name, e.g. "find_tags"
+        """
+        start_time = perf_counter()
+        self._nested.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - start_time
+            self.timings[name] += elapsed - self._nested.pop()
+            if self._nested:
+                self._nested[-1] += elapsed
+
+    def count(self, name: str, value: int = 1):
+        """
+        Increments the counter
+
+        Args:
+            name: counter name, e.g. "permutations"
+            value: value to add
+        """
+        self.counters[name] += value
+
+    def add_class(self, name: str, secs: float, permutations: float, token: dict):
+        """
+        Attributes verbalization cost to a semiotic class
+
+        Args:
+            name: class name, e.g. "date"
+            secs: verbalization time
+            permutations: number of tried permutations
+            token: parsed token
+        """
+        self.classes.append((name, secs, permutations, token))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "text": self.text,
+            "total_ms": self.total * 1000,
+            "timings_ms": {name: value * 1000 for name, value in self.timings.items()},
+            "counters": dict(self.counters),
+        }
+
+
+class Instrumentation:
+    """
+    Collects per-stage timings, lattice sizes and the number of tried permutations of normalize() calls
+    and aggregates them into histograms, see Normalizer.instrument().
+    Stages: pre_process, find_tags, select_tag, parse, permutations, find_verbalizer, select_verbalizer,
+    post_process, detokenize and post_process_punct.
+
+    Args:
+        callback: function called with the NormalizationTrace of every call, e.g. to log pathological inputs
+        num_slowest: number of the slowest calls to keep
+    """
+
+    def __init__(self, callback: Optional[Callable[[NormalizationTrace], None]] = None, num_slowest: int = 10):
+        self.callback = callback
+        self.num_slowest = num_slowest
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self):
+        """
+        Removes the collected statistics
+        """
+        with self._lock:
+            self.timings = defaultdict(lambda: Histogram(TIME_BUCKETS_MS))
+            self.counters = defaultdict(lambda: Histogram(COUNT_BUCKETS))
+            self.total = Histogram(TIME_BUCKETS_MS)
+            self.classes = defaultdict(ClassStats)
+            self._slowest = []
+            self._num_calls = 0
+
+    def current(self) -> Optional[NormalizationTrace]:
+        """
+        Returns trace of the normalize() call running in the current thread
+        """
+        return getattr(self._local, "trace", None)
+
+    @contextmanager
+    def trace(self, text: str):
+        """
+        Records the normalize() call of the block
+
+        Args:
+            text: input text
+        """
+        outer = self.current()
+        trace = NormalizationTrace(text)
+        self._local.trace = trace
+        start_time = perf_counter()
+        try:
+            yield trace
+        finally:
+            trace.total = perf_counter() - start_time
+            self._local.trace = outer
+            self._record(trace)
+
+    def _record(self, trace: NormalizationTrace):
+        with self._lock:
+            self.total.add(trace.total * 1000)
+            for name, value in trace.timings.items():
+                self.timings[name].add(value * 1000)
+            for name, value in trace.counters.items():
+                self.counters[name].add(value)
+            for name, secs, permutations, token in trace.classes:
+                self.classes[name].add(secs, permutations, trace.text, token)
+            self._num_calls += 1
+            # the call counter breaks ties, traces are not comparable
+            item = (trace.total, self._num_calls, trace)
+            if len(self._slowest) < self.num_slowest:
+                heapq.heappush(self._slowest, item)
+            elif self.num_slowest > 0:
+                heapq.heappushpop(self._slowest, item)
+        if self.callback is not None:
+            self.callback(trace)
+
+    def slowest(self) -> List[NormalizationTrace]:
+        """
+        Returns traces of the slowest calls, the slowest first
+        """
+        with self._lock:
+            return [trace for _, _, trace in sorted(self._slowest, key=lambda item: item[:2], reverse=True)]
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Returns aggregated histograms of the total and stage timings in milliseconds, of the counters
+        and the slowest calls
+        """
+        slowest = [trace.to_dict() for trace in self.slowest()]
+        with self._lock:
+            return {
+                "total_ms": self.total.to_dict(),
+                "timings_ms": {name: histogram.to_dict() for name, histogram in self.timings.items()},
+                "counters": {name: histogram.to_dict() for name, histogram in self.counters.items()},
+                "slowest": slowest,
+            }
+
+    def class_report(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns verbalization cost per semiotic class: number of tokens, total and mean time in milliseconds,
+        total and mean number of permutations and the most expensive examples, the most expensive classes first
+        """
+        with self._lock:
+            stats = sorted(self.classes.items(), key=lambda item: item[1].total, reverse=True)
+            return {name: class_stats.to_dict() for name, class_stats in stats}
+
+    def __getstate__(self):
+        # locks can't be pickled, e.g. when Normalizer is sent to worker processes,
+        # statistics of the workers are not collected
+        state = self.__dict__.copy()
+        for key in ["_lock", "_local", "timings", "counters", "total", "classes", "_slowest"]:
+            del state[key]
+        state["callback"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
@@ -12,35 +12,50 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import itertools
 import json
 import os
 import re
-import shutil
 import sys
+import tempfile
+import threading
 from argparse import ArgumentParser
-from collections import OrderedDict
-from glob import glob
+from collections import OrderedDict, deque
+from contextlib import contextmanager, nullcontext
 from math import factorial
 from time import perf_counter
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 
 import pynini
 import regex
 import tqdm
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, effective_n_jobs
 from pynini.lib.rewrite import top_rewrite
 from sacremoses import MosesDetokenizer
 from tqdm import tqdm
 
+from nemo_text_processing.text_normalization.async_normalizer import AsyncNormalizer
+from nemo_text_processing.text_normalization.cache_utils import CacheInfo, LRUCache, grammar_fingerprint
+from nemo_text_processing.text_normalization.checkpoint_utils import (
+    ManifestCheckpoint,
+    manifest_fingerprint,
+    replace_file,
+)
 from nemo_text_processing.text_normalization.data_loader_utils import (
     load_file,
     post_process_punct,
     pre_process,
     write_file,
 )
-from nemo_text_processing.text_normalization.preprocessing_utils import additional_split
-from nemo_text_processing.text_normalization.token_parser import PRESERVE_ORDER_KEY, TokenParser
+from nemo_text_processing.text_normalization.instrumentation import Instrumentation
+from nemo_text_processing.text_normalization.preprocessing_utils import (
+    additional_split,
+    merge_semiotic_spans,
+    pack_sentences,
+)
+from nemo_text_processing.text_normalization.token_parser import PRESERVE_ORDER_KEY, FastTokenParser, order_fields
+from nemo_text_processing.text_normalization.worker_pool import NormalizerPool, batched
 from nemo_text_processing.utils.logging import logger
 
 # this is to handle long input
@@ -48,6 +63,14 @@ sys.setrecursionlimit(3000)
 
 SPACE_DUP = re.compile(' {2,}')
 
+# final verbalizers of these languages do not join tokens with a space (or post-process the whole sequence),
+# i.e. tokens can't be verbalized independently of each other
+CONTEXT_DEPENDENT_VERBALIZER_LANGS = {"zh", "ja", "rw"}
+
+# inputs with any character except ASCII letters and space, e.g. digits, currency symbols, "@", "/", punctuation,
+# are always normalized with the grammars, see get_plain_text_triggers() of the English tagger
+FAST_PATH_TRIGGER = regex.compile(r"[^A-Za-z ]")
+
 
 """
 To normalize a single entry:
@@ -98,7 +121,25 @@ class Normalizer:
             Note: punct_post_process flag in normalize() supports all languages.
         max_number_of_permutations_per_split: a maximum number
             of permutations which can be generated from input sequence of tokens.
-        verbose: whether to print intermediate meta information
+        cache_size: maximum number of normalized inputs to keep in the in-memory LRU cache,
+            set to 0 to disable caching
+        token_cache_size: maximum number of verbalized tokens to memoize, e.g. the verbalization of
+            `tokens { money { integer_part: "twenty" currency_maj: "dollars" } }` is computed once and reused
+            across sentences. Set to 0 to disable memoization.
+        fast_path: if True, inputs made only of ASCII letters and spaces that contain none of the phrases the
+            grammars could change, e.g. whitelist entries like "World War II", are returned without running
+            the grammars. The phrases are derived from the tagger, the fast path is used only if the tagger provides
+            them (deterministic English grammars).
+        canonical_field_order: if True, token fields are first serialized in the canonical order declared by the tagger
+            classes (see GraphFst.field_order) and the permutation search is used only if the verbalizer rejects it.
+            The number of canonical hits and permutation fallbacks is stored in field_order_stats.
+        build_n_jobs: the number of processes to build independent tagger sub-grammars in parallel if the grammars
+            are not restored from cache_dir. Only deterministic English grammars support parallel build.
+        lazy_tagger: if True, only the core semiotic classes are loaded at startup and the rest are loaded on first
+            need, every sentence is tagged only with the classes its characters could trigger, see LazyClassifyFst.
+            Only deterministic English is supported.
+        arcsort_grammars: if True, arcs of the tagger, verbalizer and post-processing graphs are sorted by input
+            label once at load time, see sort_grammars()
     """
 
     def __init__(
@@ -112,9 +153,18 @@ class Normalizer:
         lm: bool = False,
         post_process: bool = True,
         max_number_of_permutations_per_split: int = 729,
+        cache_size: int = 0,
+        token_cache_size: int = 0,
+        fast_path: bool = True,
+        canonical_field_order: bool = False,
+        build_n_jobs: int = 1,
+        lazy_tagger: bool = False,
+        arcsort_grammars: bool = True,
     ):
         assert input_case in ["lower_cased", "cased"]
 
+        # constructor arguments to re-create the normalizer from the .far cache in NormalizerPool workers
+        self._init_kwargs = {k: v for k, v in locals().items() if k != "self"} if type(self) is Normalizer else None
         self.post_processor = None
 
         if lang == "en":
@@ -124,7 +174,11 @@ class Normalizer:
             if post_process:
                 self.post_processor = PostProcessingFst(cache_dir=cache_dir, overwrite_cache=overwrite_cache)
 
-            if deterministic:
+            if deterministic and lazy_tagger:
+                from nemo_text_processing.text_normalization.en.taggers.tokenize_and_classify_lazy import (
+                    LazyClassifyFst as ClassifyFst,
+                )
+            elif deterministic:
                 from nemo_text_processing.text_normalization.en.taggers.tokenize_and_classify import ClassifyFst
             else:
                 if lm:
@@ -187,6 +241,17 @@ class Normalizer:
         else:
             raise NotImplementedError(f"Language {lang} has not been supported yet.")
 
+        if lazy_tagger and not (lang == "en" and deterministic):
+            logger.warning("Lazy tagger is only supported for deterministic English, loading all grammars.")
+            lazy_tagger = False
+
+        tagger_kwargs = {}
+        if build_n_jobs != 1:
+            if lang == "en" and deterministic:
+                tagger_kwargs["n_jobs"] = build_n_jobs
+            else:
+                logger.warning(f"Parallel grammar build is not supported for {lang}, building sequentially.")
+
         self.input_case = input_case
         self.tagger = ClassifyFst(
             input_case=self.input_case,
@@ -194,15 +259,281 @@ class Normalizer:
             cache_dir=cache_dir,
             overwrite_cache=overwrite_cache,
             whitelist=whitelist,
+            **tagger_kwargs,
         )
 
         self.verbalizer = VerbalizeFinalFst(
             deterministic=deterministic, cache_dir=cache_dir, overwrite_cache=overwrite_cache
         )
-        self.max_number_of_permutations_per_split = max_number_of_permutations_per_split
-        self.parser = TokenParser()
+        self._grammar_key = (lang, input_case, deterministic, lm, whitelist, post_process)
+        self._whitelist = whitelist
+        self._init_runtime_state(
+            lang=lang,
+            max_number_of_permutations_per_split=max_number_of_permutations_per_split,
+            cache_size=cache_size,
+            token_cache_size=token_cache_size,
+            fast_path=fast_path,
+            canonical_field_order=canonical_field_order,
+            lazy_tagger=lazy_tagger,
+            arcsort_grammars=arcsort_grammars,
+        )
+
+    def _init_runtime_state(
+        self,
+        lang: str,
+        max_number_of_permutations_per_split: int = 729,
+        cache_size: int = 0,
+        token_cache_size: int = 0,
+        fast_path: bool = False,
+        canonical_field_order: bool = False,
+        lazy_tagger: bool = False,
+        arcsort_grammars: bool = True,
+    ):
+        """
+        Sets up the state shared by Normalizer and InverseNormalizer once the tagger and the verbalizer are loaded:
+        caches, parser, field order, detokenizer, pool and instrumentation slots. See the constructor for args
+        description.
+        """
         self.lang = lang
+        self.lazy_tagger = lazy_tagger
+        self.max_number_of_permutations_per_split = max_number_of_permutations_per_split
+        self.parser = FastTokenParser()
         self.moses_detokenizer = MosesDetokenizer(lang=lang)
+        self.cache = LRUCache(cache_size) if cache_size > 0 else None
+        self.token_cache = self._init_token_cache(token_cache_size)
+        self._init_fast_path(fast_path)
+        self._init_field_order(canonical_field_order)
+        self.pool = None
+        self.async_normalizer = None
+        self.instrumentation = None
+        self.class_profile = None
+        if arcsort_grammars:
+            self.sort_grammars()
+
+    def sort_grammars(self):
+        """
+        Sorts arcs of the loaded tagger, verbalizer and post-processing graphs by input label. The graphs are
+        the right operand of composition with the input string, so sorted arcs let composition find the arcs
+        matching a string label with binary search instead of scanning every arc of the grammar state.
+        Graphs of the lazy tagger are sorted when they are built, see LazyClassifyFst.
+        """
+        grammars = [self.verbalizer, getattr(self, "post_processor", None)]
+        if not self.lazy_tagger:
+            grammars.append(self.tagger)
+        for grammar in grammars:
+            fst = getattr(grammar, "fst", None)
+            if isinstance(fst, pynini.Fst):
+                fst.arcsort(sort_type="ilabel")
+
+    def instrument(self, instrumentation: Optional[Instrumentation] = None) -> Instrumentation:
+        """
+        Enables recording of per-stage timings, lattice sizes and the number of tried permutations
+        of every normalize() call, e.g. to find pathological inputs
+
+        Args:
+            instrumentation: collector of the statistics, a new one is created if None
+
+        Returns: the collector, see Instrumentation.summary()
+        """
+        self.instrumentation = instrumentation if instrumentation is not None else Instrumentation()
+        return self.instrumentation
+
+    def _stage(self, name: str):
+        """
+        Returns context manager measuring the stage of the running normalize() call if instrumentation is enabled
+        """
+        trace = self.instrumentation.current() if self.instrumentation is not None else None
+        return trace.stage(name) if trace is not None else nullcontext()
+
+    def _count(self, name: str, value: int = 1):
+        """
+        Increments the counter of the running normalize() call if instrumentation is enabled
+        """
+        trace = self.instrumentation.current() if self.instrumentation is not None else None
+        if trace is not None:
+            trace.count(name, value)
+
+    @contextmanager
+    def _profile_classes(self, tokens: List[dict]):
+        """
+        Attributes verbalization time and the number of tried permutations of the block to the semiotic classes
+        of the tokens if instrumentation is enabled. The cost is split between the tokens proportionally
+        to the number of their permutations.
+
+        Args:
+            tokens: parsed tokens verbalized in the block
+        """
+        trace = self.instrumentation.current() if self.instrumentation is not None else None
+        if trace is None or not tokens:
+            yield
+            return
+
+        start_time = perf_counter()
+        num_permutations = trace.counters["permutations"]
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - start_time
+            num_permutations = trace.counters["permutations"] - num_permutations
+            weights = [self._estimate_number_of_permutations_in_nested_dict(token) for token in tokens]
+            total_weight = sum(weights)
+            for token, weight in zip(tokens, weights):
+                share = weight / total_weight
+                trace.add_class(_token_class(token), elapsed * share, num_permutations * share, token)
+
+    def start_pool(
+        self, n_jobs: int = -1, max_pending: Optional[int] = None, share_memory: bool = False
+    ) -> NormalizerPool:
+        """
+        Starts a persistent pool of worker processes used by normalize_list() and normalize_manifest()
+        instead of creating new workers on every call
+
+        Args:
+            n_jobs: the number of worker processes, see NormalizerPool
+            max_pending: the maximum number of batches in flight, see NormalizerPool
+            share_memory: set to True to share the grammars with the forked workers instead of loading
+                a copy per worker, see NormalizerPool
+
+        Returns: the started pool
+        """
+        self.close_pool()
+        self.pool = NormalizerPool(self, n_jobs=n_jobs, max_pending=max_pending, share_memory=share_memory)
+        return self.pool
+
+    def close_pool(self):
+        """
+        Shuts down the worker pool started with start_pool()
+        """
+        if self.pool is not None:
+            self.pool.close()
+            self.pool = None
+
+    def start_async(
+        self,
+        executor: str = "thread",
+        max_workers: Optional[int] = None,
+        batch_window: float = 0.005,
+        max_batch_size: int = 32,
+        share_memory: bool = False,
+    ) -> AsyncNormalizer:
+        """
+        Starts the executor used by the coroutines, e.g. anormalize(). The coroutines start a thread executor with
+        the default arguments on first use if this method wasn't called.
+
+        Args:
+            executor: "thread" to share the normalizer with the executor threads or "process" to start
+                a NormalizerPool, see AsyncNormalizer
+            max_workers: the number of threads or worker processes
+            batch_window: time in seconds to wait for concurrent requests to join a batch, used with executor="process"
+            max_batch_size: the maximum number of requests per batch, used with executor="process"
+            share_memory: set to True to share the grammars with the forked worker processes, see NormalizerPool
+
+        Returns: the started executor
+        """
+        self.close_async()
+        self.async_normalizer = AsyncNormalizer(
+            self,
+            executor=executor,
+            max_workers=max_workers,
+            batch_window=batch_window,
+            max_batch_size=max_batch_size,
+            share_memory=share_memory,
+        )
+        return self.async_normalizer
+
+    def close_async(self):
+        """
+        Shuts down the executor started with start_async()
+        """
+        if self.async_normalizer is not None:
+            self.async_normalizer.close()
+            self.async_normalizer = None
+
+    async def anormalize(
+        self,
+        text: str,
+        verbose: bool = False,
+        punct_pre_process: bool = False,
+        punct_post_process: bool = False,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """
+        Coroutine version of normalize(), the text is normalized in the executor started with start_async()
+        together with the concurrent requests. Cancelling the awaiting task cancels the request.
+
+        Args:
+            text: string that may include semiotic classes
+            verbose: whether to print intermediate meta information
+            punct_pre_process: whether to perform punctuation pre-processing, for example, [25] -> [ 25 ]
+            punct_post_process: whether to normalize punctuation
+            timeout: time in seconds to wait for the result, asyncio.TimeoutError is raised after it
+
+        Returns: spoken form
+        """
+        if self.async_normalizer is None:
+            self.start_async()
+        return await self.async_normalizer.submit(
+            "normalize",
+            text,
+            timeout=timeout,
+            verbose=verbose,
+            punct_pre_process=punct_pre_process,
+            punct_post_process=punct_post_process,
+        )
+
+    async def anormalize_list(
+        self,
+        texts: List[str],
+        verbose: bool = False,
+        punct_pre_process: bool = False,
+        punct_post_process: bool = False,
+        timeout: Optional[float] = None,
+    ) -> List[str]:
+        """
+        Coroutine version of normalize_list(), the texts are batched with the concurrent requests, see anormalize()
+
+        Args:
+            texts: list of input strings
+            verbose: whether to print intermediate meta information
+            punct_pre_process: whether to do punctuation pre-processing
+            punct_post_process: whether to do punctuation post-processing
+            timeout: time in seconds to wait for all results, asyncio.TimeoutError is raised after it
+
+        Returns converted list input strings
+        """
+        requests = asyncio.gather(
+            *[
+                self.anormalize(
+                    text, verbose=verbose, punct_pre_process=punct_pre_process, punct_post_process=punct_post_process
+                )
+                for text in texts
+            ]
+        )
+        return await asyncio.wait_for(requests, timeout)
+
+    def _grammar_fingerprint(self) -> str:
+        """
+        Returns content hash of the grammars of the normalizer, i.e. of their source files, the data files they load
+        and the whitelist, see grammar_fingerprint(). Unlike _grammar_key, it changes after a grammar or data edit.
+        """
+        fingerprints = []
+        for grammar in [self.tagger, self.verbalizer, getattr(self, "post_processor", None)]:
+            if grammar is not None:
+                source_file = sys.modules[type(grammar).__module__].__file__
+                fingerprints.append(grammar_fingerprint(source_file, self._whitelist))
+        return "_".join(fingerprints)
+
+    def __getstate__(self):
+        # worker processes and threads can't be pickled, e.g. when Normalizer is sent to joblib workers
+        state = self.__dict__.copy()
+        state['pool'] = None
+        state['async_normalizer'] = None
+        state.pop('_field_order_lock', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._field_order_lock = threading.Lock()
 
     def normalize_list(
         self,
@@ -212,10 +543,12 @@ class Normalizer:
         punct_post_process: bool = False,
         batch_size: int = 1,
         n_jobs: int = 1,
+        profile: bool = False,
         **kwargs,
     ):
         """
-        NeMo text normalizer
+        NeMo text normalizer. If the worker pool was started with start_pool(), its workers are used
+        and n_jobs is ignored.
 
         Args:
             texts: list of input strings
@@ -226,9 +559,29 @@ class Normalizer:
                 no parallel computing code is used at all, which is useful for debugging. For n_jobs below -1,
                 (n_cpus + 1 + n_jobs) are used. Thus for n_jobs = -2, all CPUs but one are used.
             batch_size: Number of examples for each process
+            profile: set to True to attribute verbalization time and the number of tried permutations to the
+                semiotic classes of the parsed tokens and to log the hotspot report,
+                see Instrumentation.class_report().
+                The texts are normalized in the current process without the result cache, the report is stored
+                in self.class_profile.
 
         Returns converted list input strings
         """
+        if profile:
+            return self._profile_list(
+                texts, verbose=verbose, punct_pre_process=punct_pre_process, punct_post_process=punct_post_process
+            )
+
+        if self.pool is not None:
+            return self.pool.map(
+                "normalize",
+                texts,
+                batch_size=batch_size,
+                verbose=verbose,
+                punct_pre_process=punct_pre_process,
+                punct_post_process=punct_post_process,
+                **kwargs,
+            )
 
         def _process_batch(batch, verbose, punct_pre_process, punct_post_process, **kwargs):
             """
@@ -265,6 +618,43 @@ class Normalizer:
         normalized_texts = list(itertools.chain(*normalized_texts))
         return normalized_texts
 
+    def _profile_list(
+        self,
+        texts: List[str],
+        verbose: bool = False,
+        punct_pre_process: bool = False,
+        punct_post_process: bool = False,
+    ) -> List[str]:
+        """
+        Normalizes texts in the current process and reports verbalization cost per semiotic class,
+        see normalize_list() for args description
+        """
+        if self.pool is not None:
+            logger.warning("Worker pool is not used when profiling")
+        previous = self.instrumentation
+        instrumentation = self.instrument()
+        try:
+            # the result cache is bypassed, cached texts wouldn't be attributed to their classes
+            normalized_texts = [
+                self._normalize(
+                    text, verbose=verbose, punct_pre_process=punct_pre_process, punct_post_process=punct_post_process
+                )
+                for text in tqdm(texts)
+            ]
+        finally:
+            self.instrumentation = previous
+        self.class_profile = instrumentation.class_report()
+
+        logger.info("Verbalization cost per semiotic class:")
+        for name, stats in self.class_profile.items():
+            logger.info(
+                f"{name}: {stats['count']} tokens, total {stats['total_ms']:.1f} ms, mean {stats['mean_ms']:.2f} ms, "
+                f"mean permutations {stats['mean_permutations']:.1f}"
+            )
+            for example in stats["worst"][:1]:
+                logger.info(f"    worst: {example['ms']:.2f} ms, {example['text']}")
+        return normalized_texts
+
     def _estimate_number_of_permutations_in_nested_dict(
         self, token_group: Dict[str, Union[OrderedDict, str, bool]]
     ) -> int:
@@ -334,6 +724,7 @@ class Normalizer:
         """
         Main function. Normalizes tokens from written to spoken form
             e.g. 12 kg -> twelve kilograms
+        Can be called concurrently from multiple threads, the grammars are shared and the call state is local.
 
         Args:
             text: string that may include semiotic classes
@@ -343,56 +734,158 @@ class Normalizer:
 
         Returns: spoken form
         """
-        logger.setLevel('DEBUG' if verbose else 'INFO')
+        if self.cache is None:
+            return self._normalize(
+                text, verbose=verbose, punct_pre_process=punct_pre_process, punct_post_process=punct_post_process
+            )
+
+        cache_key = (text, punct_pre_process, punct_post_process, self._grammar_key)
+        output = self.cache.get(cache_key)
+        if output is None:
+            output = self._normalize(
+                text, verbose=verbose, punct_pre_process=punct_pre_process, punct_post_process=punct_post_process
+            )
+            self.cache.put(cache_key, output)
+        return output
+
+    def _normalize(
+        self, text: str, verbose: bool = False, punct_pre_process: bool = False, punct_post_process: bool = False
+    ) -> str:
+        """
+        Normalizes text without looking up the result cache, see normalize() for args description
+        """
+        if self.instrumentation is not None:
+            with self.instrumentation.trace(text):
+                return self._normalize_text(text, verbose, punct_pre_process, punct_post_process)
+        return self._normalize_text(text, verbose, punct_pre_process, punct_post_process)
+
+    def _normalize_text(
+        self, text: str, verbose: bool = False, punct_pre_process: bool = False, punct_post_process: bool = False
+    ) -> str:
+        # the logger level is not changed, the same logger is shared by concurrent calls
+        log = logger.info if verbose else logger.debug
         if len(text.split()) > 500:
             logger.warning(
                 "Your input is too long and could take a long time to normalize. "
-                "Use split_text_into_sentences() to make the input shorter and then call normalize_list()."
+                "Use normalize_document() or split_text_into_sentences() to make the input shorter and then call "
+                "normalize_list()."
             )
         original_text = text
         if punct_pre_process:
-            text = pre_process(text)
+            with self._stage("pre_process"):
+                text = pre_process(text)
         text = text.strip()
         if not text:
-            logger.debug(text)
+            log(text)
             return text
-        text = pynini.escape(text)
-        tagged_lattice = self.find_tags(text)
-        tagged_text = Normalizer.select_tag(tagged_lattice)
-        logger.debug(tagged_text)
-
-        self.parser(tagged_text)
-        tokens = self.parser.parse()
-        split_tokens = self._split_tokens_to_reduce_number_of_permutations(tokens)
-        output = ""
-        for s in split_tokens:
-            try:
-                tags_reordered = self.generate_permutations(s)
-                verbalizer_lattice = None
-                for tagged_text in tags_reordered:
-                    tagged_text = pynini.escape(tagged_text)
-
-                    verbalizer_lattice = self.find_verbalizer(tagged_text)
-                    if verbalizer_lattice.num_states() != 0:
-                        break
-                if verbalizer_lattice is None:
-                    logger.warning(f"No permutations were generated from tokens {s}")
-                    return text
-                output += ' ' + Normalizer.select_verbalizer(verbalizer_lattice)
-            except Exception as e:
-                logger.warning("Failed text: " + text + str(e))
-                return text
-        output = SPACE_DUP.sub(' ', output[1:])
+        plain_words = self._split_plain_text(text) if self.fast_path else None
+        if plain_words is not None and not self._has_trigger_phrase(plain_words):
+            log(f"Fast path: {text}")
+            output = " ".join(plain_words)
+        else:
+            text = escape(text)
+            with self._stage("find_tags"):
+                tagged_lattice = self.find_tags(text)
+            self._count("tag_lattice_states", tagged_lattice.num_states())
+            with self._stage("select_tag"):
+                tagged_text = Normalizer.select_tag(tagged_lattice)
+            log(tagged_text)
+
+            with self._stage("parse"):
+                tokens = self.parse_tokens(tagged_text)
+            self._count("tokens", len(tokens))
+            split_tokens = self._split_tokens_to_reduce_number_of_permutations(tokens)
+            outputs = []
+            for s in split_tokens:
+                with self._profile_classes(s):
+                    try:
+                        if self.token_cache is not None:
+                            outputs.append(' '.join([self._verbalize_token(token) for token in s]))
+                            continue
+
+                        verbalizer_lattice = self._find_verbalizer_for_permutations(s)
+                        if verbalizer_lattice is None:
+                            logger.warning(f"No permutations were generated from tokens {s}")
+                            return text
+                        with self._stage("select_verbalizer"):
+                            outputs.append(Normalizer.select_verbalizer(verbalizer_lattice))
+                    except Exception as e:
+                        logger.warning("Failed text: " + text + str(e))
+                        return text
+            output = ' '.join(outputs)
+            if '  ' in output:
+                output = SPACE_DUP.sub(' ', output)
 
         if self.lang in ["en", "vi"] and hasattr(self, 'post_processor'):
-            output = self.post_process(output)
+            with self._stage("post_process"):
+                output = self.post_process(output)
 
         if punct_post_process:
             # do post-processing based on Moses detokenizer
-            output = self.moses_detokenizer.detokenize([output], unescape=False)
-            output = post_process_punct(input=original_text, normalized_text=output)
+            with self._stage("detokenize"):
+                output = self.moses_detokenizer.detokenize([output], unescape=False)
+            with self._stage("post_process_punct"):
+                output = post_process_punct(input=original_text, normalized_text=output)
         return output
 
+    def _init_fast_path(self, fast_path: bool):
+        """
+        Indexes the phrases that could change plain text by their first word, see get_plain_text_triggers()
+        of the English tagger. The fast path is disabled if the tagger doesn't provide the phrases.
+
+        Args:
+            fast_path: whether to return plain text without running the grammars
+        """
+        triggers = getattr(self.tagger, "plain_text_triggers", None) if fast_path else None
+        self.fast_path = triggers is not None
+        # first word of the trigger phrases -> the maximum number of words of the phrases
+        self._trigger_first_words = {}
+        self._trigger_phrases = triggers or frozenset()
+        for phrase in self._trigger_phrases:
+            words = phrase.split(" ")
+            self._trigger_first_words[words[0]] = max(self._trigger_first_words.get(words[0], 0), len(words))
+
+    def _split_plain_text(self, text: str) -> Optional[List[str]]:
+        """
+        Splits text into words if it contains only ASCII letters and spaces, i.e. no characters that could trigger
+        a semiotic class
+
+        Args:
+            text: input text
+
+        Returns: list of words or None if the text contains trigger characters
+        """
+        if FAST_PATH_TRIGGER.search(text):
+            return None
+        return text.split()
+
+    def _has_trigger_phrase(self, words: List[str]) -> bool:
+        """
+        Checks if a sequence of the words is one of the phrases that the grammars could change, e.g. "World War II"
+
+        Args:
+            words: list of words
+        """
+        for i, word in enumerate(words):
+            max_len = self._trigger_first_words.get(word, 0)
+            for n in range(1, min(max_len, len(words) - i) + 1):
+                if " ".join(words[i : i + n]) in self._trigger_phrases:
+                    return True
+        return False
+
+    def cache_info(self) -> Optional[CacheInfo]:
+        """
+        Returns statistics of the result cache (hits, misses, evictions, maxsize, currsize) or None if caching is disabled
+        """
+        return self.cache.info() if self.cache is not None else None
+
+    def clear_cache(self):
+        """
+        Removes all entries from the result cache
+        """
+        if self.cache is not None:
+            self.cache.clear()
+
     def normalize_line(
         self,
         line: str,
@@ -436,104 +929,140 @@ class Normalizer:
         output_filename: Optional[str] = None,
         text_field: str = "text",
         verbose: bool = False,
+        max_pending: Optional[int] = None,
+        resume: bool = False,
+        checkpoint_dir: Optional[str] = None,
         **kwargs,
     ):
         """
         Normalizes "text_field" from .json manifest.
+        The manifest is read lazily, batches are normalized by the worker pool and written to the output file in order
+        as they complete, so at most max_pending batches are kept in memory. Results are written to a private
+        temporary file in the output directory which replaces output_filename once all lines are normalized.
 
         Args:
             manifest: path to .json manifest file
             n_jobs: the maximum number of concurrently running jobs. If -1 all CPUs are used. If 1 is given,
                 no parallel computing code is used at all, which is useful for debugging. For n_jobs below -1,
                 (n_cpus + 1 + n_jobs) are used. Thus for n_jobs = -2, all CPUs but one are used.
+                Ignored if the worker pool was started with start_pool().
             punct_pre_process: set to True to do punctuation pre-processing
             punct_post_process: set to True to do punctuation post-processing
             batch_size: number of samples to process per iteration (int)
             output_filename: path to .json file to save normalized text
             text_field: name of the field in the manifest to normalize
+            verbose: set to True to see intermediate output of normalization
+            max_pending: the maximum number of batches in flight, by default 2 * n_jobs, see NormalizerPool
+            resume: if True, every normalized batch is saved to checkpoint_dir as a separate shard, and shards
+                completed by a previous interrupted run with the same manifest and configuration are skipped.
+                The checkpoint directory is removed once the output file is saved.
+            checkpoint_dir: directory to save shards in the resume mode, by default "<output_filename>.checkpoint"
             **kwargs are need for audio-based normalization that requires extra args
         """
+        if output_filename is None:
+            output_filename = manifest.replace('.json', '_normalized.json')
+        output_field = kwargs.get("output_field", "normalized")
+        line_kwargs = dict(
+            punct_pre_process=punct_pre_process, punct_post_process=punct_post_process, text_field=text_field, **kwargs
+        )
 
-        def _process_batch(
-            batch_idx: int,
-            batch: List[str],
-            dir_name: str,
-            verbose=verbose,
-            punct_pre_process=False,
-            punct_post_process=True,
-            text_field: str = "text",
-            output_field: str = "normalized",
-            **kwargs,
-        ):
-            """
-            Normalizes batch of text sequences
-            Args:
-                batch: list of texts
-                batch_idx: batch index
-                dir_name: path to output directory to save results
-            """
-            normalized_lines = [
-                self.normalize_line(
-                    line=line,
-                    verbose=verbose,
-                    punct_post_process=punct_post_process,
-                    punct_pre_process=punct_pre_process,
-                    text_field=text_field,
-                    output_field=output_field,
-                    **kwargs,
-                )
-                for line in tqdm(batch)
-            ]
-
-            with open(f"{dir_name}/{batch_idx:06}.json", "w") as f_out:
-                for line in normalized_lines:
-                    if isinstance(line[output_field], set):
-                        if len(line[output_field]) > 1:
-                            logger.warning("Len of " + str(line[output_field]) + " > 1 ")
-                        line[output_field] = line[output_field].pop()
+        checkpoint = None
+        if resume:
+            config = dict(
+                normalizer=type(self).__name__,
+                grammar=self._grammar_key,
+                grammar_fingerprint=self._grammar_fingerprint(),
+                batch_size=batch_size,
+                **line_kwargs,
+            )
+            checkpoint = ManifestCheckpoint(
+                checkpoint_dir or f"{output_filename}.checkpoint", manifest_fingerprint(manifest, config)
+            )
 
-                    f_out.write(json.dumps(line, ensure_ascii=False) + '\n')
+        pool = self.pool
+        if pool is None and effective_n_jobs(n_jobs) > 1:
+            pool = NormalizerPool(self, n_jobs=n_jobs, max_pending=max_pending)
 
-            logger.info(f"Batch -- {batch_idx} -- is complete")
+        logger.warning(f'Normalizing {manifest}...')
+        fd, tmp_filename = tempfile.mkstemp(
+            prefix=".normalize_manifest_", suffix=".json", dir=os.path.dirname(os.path.abspath(output_filename))
+        )
+        num_lines = 0
+        try:
+            with open(manifest, 'r') as f, open(fd, "w") as f_out:
+                shards = enumerate(batched(f, batch_size))
+                if checkpoint is not None:
+                    shards = ((idx, batch) for idx, batch in shards if idx not in checkpoint.completed)
+
+                # indices of the shards sent to normalization, results come back in the same order
+                shard_indices = deque()
+
+                def _pending_batches():
+                    for idx, batch in shards:
+                        shard_indices.append(idx)
+                        yield batch
+
+                batches = self._normalize_batches(_pending_batches(), pool, verbose=verbose, **line_kwargs)
+                for normalized_lines in batches:
+                    idx = shard_indices.popleft()
+                    if checkpoint is None:
+                        Normalizer._write_normalized_lines(f_out, normalized_lines, output_field)
+                    else:
+                        with checkpoint.open_shard(idx) as f_shard:
+                            Normalizer._write_normalized_lines(f_shard, normalized_lines, output_field)
+                    num_lines += len(normalized_lines)
+                    logger.info(f"Batch -- {idx} -- is complete")
+
+                if checkpoint is not None:
+                    checkpoint.merge(f_out)
+            replace_file(tmp_filename, output_filename)
+            if checkpoint is not None:
+                checkpoint.remove()
+        finally:
+            if pool is not None and pool is not self.pool:
+                pool.close()
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+
+        logger.warning(f'Normalized {num_lines} line(s), normalized version saved at {output_filename}')
+
+    def _normalize_batches(
+        self, batches: Iterable[List[str]], pool: Optional[NormalizerPool], **kwargs
+    ) -> Iterator[List[dict]]:
+        """
+        Lazily normalizes batches of .json manifest lines, in the worker pool if given
 
-        if output_filename is None:
-            output_filename = manifest.replace('.json', '_normalized.json')
+        Args:
+            batches: lists of .json manifest lines
+            pool: worker pool, if None lines are normalized in the current process
+            kwargs: arguments of normalize_line()
 
-        with open(manifest, 'r') as f:
-            lines = f.readlines()
+        Returns: iterator over lists of normalized lines, one list per batch
+        """
+        if pool is not None:
+            yield from pool.imap_batches("normalize_line", batches, **kwargs)
+            return
 
-        logger.warning(f'Normalizing {len(lines)} line(s) of {manifest}...')
+        for batch in batches:
+            yield [self.normalize_line(line, **kwargs) for line in batch]
 
-        # to save intermediate results to a file
-        batch = min(len(lines), batch_size)
-
-        tmp_dir = "/tmp/parts"
-        if os.path.exists(tmp_dir):
-            shutil.rmtree(tmp_dir)
-        os.makedirs(tmp_dir)
-
-        Parallel(n_jobs=n_jobs)(
-            delayed(_process_batch)(
-                idx,
-                lines[i : i + batch],
-                tmp_dir,
-                text_field=text_field,
-                verbose=verbose,
-                punct_pre_process=punct_pre_process,
-                punct_post_process=punct_post_process,
-                **kwargs,
-            )
-            for idx, i in enumerate(range(0, len(lines), batch))
-        )
+    @staticmethod
+    def _write_normalized_lines(f_out, lines: List[dict], output_field: str):
+        """
+        Writes normalized manifest lines, only the first normalization option is kept for audio-based normalization
 
-        # aggregate all intermediate files
-        with open(output_filename, "w") as f_out:
-            for batch_f in sorted(glob(f"{tmp_dir}/*.json")):
-                with open(batch_f, "r") as f_in:
-                    lines = f_in.read()
-                    f_out.write(lines)
+        Args:
+            f_out: output file
+            lines: normalized lines of a .json manifest
+            output_field: name of the field with normalized text
+        """
+        for line in lines:
+            if isinstance(line[output_field], set):
+                if len(line[output_field]) > 1:
+                    logger.warning("Len of " + str(line[output_field]) + " > 1 ")
+                line[output_field] = line[output_field].pop()
 
-        logger.warning(f'Normalized version saved at {output_filename}')
+            f_out.write(json.dumps(line, ensure_ascii=False) + '\n')
 
     def split_text_into_sentences(self, text: str, additional_split_symbols: str = "") -> List[str]:
         r"""
@@ -570,6 +1099,171 @@ class Normalizer:
         sentences = additional_split(sentences, additional_split_symbols)
         return sentences
 
+    def _init_token_cache(self, token_cache_size: int) -> Optional[LRUCache]:
+        """
+        Creates token verbalization memo, returns None if memoization is disabled or not supported for the language
+
+        Args:
+            token_cache_size: maximum number of verbalized tokens to memoize
+        """
+        if token_cache_size <= 0:
+            return None
+        if self.lang in CONTEXT_DEPENDENT_VERBALIZER_LANGS:
+            logger.warning(f"Token verbalization memoization is not supported for {self.lang}, disabling it.")
+            return None
+        return LRUCache(token_cache_size)
+
+    def _init_field_order(self, canonical_field_order: bool):
+        """
+        Collects canonical field order of semiotic classes from the tagger
+
+        Args:
+            canonical_field_order: whether to try the canonical field order before permutations
+        """
+        self.field_order = None
+        if canonical_field_order:
+            self.field_order = getattr(self.tagger, "field_order", None) or {}
+        self.field_order_stats = {"canonical": 0, "fallback": 0}
+        # normalize() is reentrant, the counters are shared between threads
+        self._field_order_lock = threading.Lock()
+
+    def _find_verbalizer_for_permutations(self, tokens: List[dict]) -> Optional['pynini.FstLike']:
+        """
+        Composes permutations of the tokens serialization with the verbalizer until a non-empty lattice is found.
+        If canonical field order is enabled, the serialization in the canonical order is tried first.
+
+        Args:
+            tokens: list of dictionaries
+
+        Returns: verbalization lattice of the first permutation accepted by the verbalizer (or the last tried one),
+            None if no permutations were generated
+        """
+        if self.field_order is not None:
+            with self._stage("permutations"):
+                tagged_text = escape("".join([self._serialize(token, self.field_order) for token in tokens]))
+                self._count("permutations")
+                with self._stage("find_verbalizer"):
+                    verbalizer_lattice = self.find_verbalizer(tagged_text)
+            self._count("verbalizer_lattice_states", verbalizer_lattice.num_states())
+            canonical = verbalizer_lattice.num_states() != 0
+            with self._field_order_lock:
+                self.field_order_stats["canonical" if canonical else "fallback"] += 1
+            if canonical:
+                return verbalizer_lattice
+
+        verbalizer_lattice = None
+        # time of the permutation generation excludes verbalizer composition
+        with self._stage("permutations"):
+            for tagged_text in self.generate_permutations(tokens):
+                tagged_text = escape(tagged_text)
+                self._count("permutations")
+
+                with self._stage("find_verbalizer"):
+                    verbalizer_lattice = self.find_verbalizer(tagged_text)
+                if verbalizer_lattice.num_states() != 0:
+                    break
+        if verbalizer_lattice is not None:
+            self._count("verbalizer_lattice_states", verbalizer_lattice.num_states())
+        return verbalizer_lattice
+
+    def _verbalize_token(self, token: OrderedDict) -> str:
+        """
+        Verbalizes a single token, the result is memoized by the token serialization
+
+        Args:
+            token: parsed token, e.g. {"tokens": {"money": {"integer_part": "twenty", "currency_maj": "dollars"}}}
+
+        Returns: verbalized token
+        """
+        key = self._serialize(token)
+        output = self.token_cache.get(key)
+        if output is None:
+            verbalizer_lattice = self._find_verbalizer_for_permutations([token])
+            if verbalizer_lattice is None:
+                raise ValueError(f"No permutations were generated from token {token}")
+            output = Normalizer.select_verbalizer(verbalizer_lattice)
+            self.token_cache.put(key, output)
+        return output
+
+    def _serialize(
+        self, d: OrderedDict, field_order: Optional[Dict[str, List[str]]] = None, name: Optional[str] = None
+    ) -> str:
+        """
+        Serializes (nested) dictionary of key value pairs, uses the same format as _permute()
+
+        Args:
+            d: (nested) dictionary of key value pairs
+            field_order: canonical field order of semiotic classes, e.g. {"money": ["integer_part", "currency_maj"]},
+                if None the parsed order is used
+            name: name of the class the dictionary belongs to, e.g. "money"
+
+        Returns string serialization of key value pairs
+        """
+        items = order_fields(d, field_order.get(name)) if field_order else d.items()
+        l = []
+        for k, v in items:
+            if isinstance(v, str):
+                l.append(f"{k}: \"{v}\" ")
+            elif isinstance(v, OrderedDict):
+                l.append(f" {k} {{ {self._serialize(v, field_order, k)} }} ")
+            elif isinstance(v, bool):
+                l.append(f"{k}: true ")
+            else:
+                raise ValueError("Key: " + str(k) + " Value: " + str(v))
+        return "".join(l)
+
+    def normalize_document(
+        self,
+        text: str,
+        max_window_len: int = 1000,
+        additional_split_symbols: str = ";|:|,| ",
+        verbose: bool = False,
+        punct_pre_process: bool = False,
+        punct_post_process: bool = False,
+        batch_size: int = 1,
+        n_jobs: int = 1,
+        **kwargs,
+    ) -> str:
+        r"""
+        Normalizes a long document. The document is split into sentences, sentences longer than max_window_len are
+        split further by additional_split_symbols, and consecutive sentences are combined into windows of at most
+        max_window_len symbols. A sentence is not split next to a word with digits or symbols, e.g. inside
+        "12 : 30 pm" or "$ 5 million", see merge_semiotic_spans(). Windows are normalized independently and joined
+        with a space, so the normalization time grows linearly with the document length.
+
+        Args:
+            text: document text
+            max_window_len: the maximum number of symbols in a window (a window could be longer if
+                the text can't be split by additional_split_symbols)
+            additional_split_symbols: Symbols to split sentences longer than max_window_len.
+                Use '|' as a separator between symbols, for example: ';|:'. Use ' ' to split by space.
+            verbose: whether to print intermediate meta information
+            punct_pre_process: whether to do punctuation pre-processing
+            punct_post_process: whether to do punctuation post-processing
+            batch_size: Number of windows for each process
+            n_jobs: the maximum number of concurrently running jobs, see normalize_list()
+
+        Returns: normalized document
+        """
+        sentences = []
+        for sentence in self.split_text_into_sentences(text):
+            pieces = additional_split([sentence], additional_split_symbols, max_len=max_window_len)
+            sentences.extend(merge_semiotic_spans(pieces))
+        windows = pack_sentences(sentences, max_len=max_window_len)
+        if not windows:
+            return ""
+
+        normalized_windows = self.normalize_list(
+            windows,
+            verbose=verbose,
+            punct_pre_process=punct_pre_process,
+            punct_post_process=punct_post_process,
+            batch_size=batch_size,
+            n_jobs=n_jobs,
+            **kwargs,
+        )
+        return " ".join([w for w in normalized_windows if w])
+
     def _permute(self, d: OrderedDict) -> List[str]:
         """
         Creates reorderings of dictionary elements and serializes as strings
@@ -629,6 +1323,20 @@ class Normalizer:
 
         return _helper("", tokens, 0)
 
+    def parse_tokens(self, tagged_text: str) -> List[dict]:
+        """
+        Parses tagged text with a new parser of the same type as self.parser, the parser stores the parsing position,
+        so it can't be shared by concurrent calls
+
+        Args:
+            tagged_text: tagged text, e.g. 'tokens { name: "left" }'
+
+        Returns: list of parsed tokens
+        """
+        parser = type(self.parser)()
+        parser(tagged_text)
+        return parser.parse()
+
     def find_tags(self, text: str) -> 'pynini.FstLike':
         """
         Given text use tagger Fst to tag text
@@ -638,7 +1346,8 @@ class Normalizer:
 
         Returns: tagged lattice
         """
-        lattice = text @ self.tagger.fst
+        tagger_fst = self.tagger.get_fst(text) if self.lazy_tagger else self.tagger.fst
+        lattice = text @ tagger_fst
         return lattice
 
     @staticmethod
@@ -695,13 +1404,34 @@ class Normalizer:
         normalized_text = normalized_text.strip()
         if not normalized_text:
             return normalized_text
-        normalized_text = pynini.escape(normalized_text)
+        normalized_text = escape(normalized_text)
 
         if self.post_processor is not None:
             normalized_text = top_rewrite(normalized_text, self.post_processor.fst)
         return normalized_text
 
 
+def escape(text: str) -> str:
+    """
+    Escapes brackets and backslashes like pynini.escape(), text without them is returned as is without a copy
+
+    Args:
+        text: text to compile into an FST
+    """
+    # substring checks are faster than a regular expression search
+    if "[" not in text and "]" not in text and "\\" not in text:
+        return text
+    return pynini.escape(text)
+
+
+def _token_class(token: dict) -> str:
+    """
+    Returns semiotic class name of the parsed token, e.g. "date", plain words are "name" tokens
+    """
+    classes = [name for name in token.get("tokens", token) if name != PRESERVE_ORDER_KEY]
+    return classes[0] if classes else "unknown"
+
+
 def parse_args():
     parser = ArgumentParser()
     input = parser.add_mutually_exclusive_group()
@@ -774,6 +1504,41 @@ def parse_args():
     )
     parser.add_argument("--n_jobs", default=-2, type=int, help="The maximum number of concurrently running jobs")
     parser.add_argument("--batch_size", default=200, type=int, help="Number of examples for each process")
+    parser.add_argument(
+        "--max_pending",
+        default=None,
+        type=int,
+        help="The maximum number of batches of a .json manifest kept in memory, by default 2 * n_jobs",
+    )
+    parser.add_argument(
+        "--resume",
+        help="Add this flag to save normalized batches of a .json manifest to --checkpoint_dir and to skip batches "
+        "completed by a previous interrupted run",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--checkpoint_dir",
+        help="Directory to save normalized batches with --resume, by default <output_file>.checkpoint",
+        default=None,
+        type=str,
+    )
+    parser.add_argument(
+        "--share_memory",
+        help="Add this flag to fork the workers from the main process and share the grammars between them "
+        "instead of loading a copy per worker, memory usage of the workers is logged at the end",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--lazy_tagger",
+        help="Add this flag to load rarely used semiotic classes on first need (only for deterministic English)",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--build_n_jobs",
+        default=1,
+        type=int,
+        help="The number of processes to build independent grammars in parallel (only for deterministic English)",
+    )
     parser.add_argument(
         "--max_number_of_permutations_per_split",
         default=729,
@@ -798,7 +1563,12 @@ if __name__ == "__main__":
         whitelist=whitelist,
         lang=args.language,
         max_number_of_permutations_per_split=args.max_number_of_permutations_per_split,
+        build_n_jobs=args.build_n_jobs,
+        lazy_tagger=args.lazy_tagger,
     )
+    if args.share_memory and args.input_file:
+        normalizer.start_pool(n_jobs=args.n_jobs, max_pending=args.max_pending, share_memory=True)
+
     start_time = perf_counter()
     if args.input_string:
         output = normalizer.normalize(
@@ -818,6 +1588,9 @@ if __name__ == "__main__":
                 punct_pre_process=args.punct_pre_process,
                 punct_post_process=args.punct_post_process,
                 batch_size=args.batch_size,
+                max_pending=args.max_pending,
+                resume=args.resume,
+                checkpoint_dir=args.checkpoint_dir,
                 text_field=args.manifest_text_field,
                 output_field=args.output_field,
                 output_filename=args.output_file,
@@ -841,4 +1614,7 @@ if __name__ == "__main__":
             else:
                 logger.info(normalizer_prediction)
 
+    if normalizer.pool is not None:
+        normalizer.pool.log_memory_report()
+        normalizer.close_pool()
     logger.info(f"Execution time: {perf_counter() - start_time:.02f} sec")
@@ -357,8 +357,7 @@ class NormalizerWithAudio(Normalizer):
         def get_verbalized_text(tagged_text):
             return rewrite.top_rewrites(tagged_text, self.verbalizer_non_deterministic.fst, n_tagged)
 
-        self.parser(tagged_text)
-        tokens = self.parser.parse()
+        tokens = self.parse_tokens(tagged_text)
         tags_reordered = self.generate_permutations(tokens)
         for tagged_text_reordered in tags_reordered:
             try:
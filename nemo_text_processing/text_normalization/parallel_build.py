@@ -0,0 +1,273 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import tempfile
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pynini
+from joblib import effective_n_jobs
+
+from nemo_text_processing.text_normalization.cache_utils import FINGERPRINT_LEN, PACKAGE_NAME, grammar_fingerprint
+from nemo_text_processing.utils.logging import logger
+
+# subdirectory of cache_dir with the cached sub-grammars
+GRAPHS_CACHE_DIR = "graphs"
+# .far entry of a cached sub-grammar with its class and attributes other than FSTs
+ATTRIBUTES_KEY = "__attributes__"
+
+# sub-grammar build task:
+#   builder: picklable callable that creates the sub-grammar, e.g. GraphFst subclass
+#   deps: mapping of builder argument names to names of the tasks whose results are passed as these arguments,
+#       e.g. {"cardinal": "cardinal"}
+#   kwargs: other arguments of the builder, e.g. {"deterministic": True}
+GraphTask = namedtuple('GraphTask', 'builder deps kwargs')
+
+
+def _topological_order(tasks: Dict[str, GraphTask]) -> List[str]:
+    """
+    Returns task names in an order in which every task comes after its dependencies
+
+    Args:
+        tasks: build tasks by name
+    """
+    order = []
+    state = {}
+
+    def _visit(name: str, path: Tuple[str, ...]):
+        if name not in tasks:
+            raise ValueError(f"Unknown dependency {name} of {path[-1]}")
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            raise ValueError(f"Circular dependency: {' -> '.join(path + (name,))}")
+        state[name] = "visiting"
+        for dep in tasks[name].deps.values():
+            _visit(dep, path + (name,))
+        state[name] = "done"
+        order.append(name)
+
+    for name in tasks:
+        _visit(name, ())
+    return order
+
+
+def graph_cache_keys(tasks: Dict[str, GraphTask]) -> Dict[str, str]:
+    """
+    Returns cache keys of the sub-grammars. The key of a sub-grammar is a hash of the builder sources and of the data
+    files they load (see grammar_fingerprint()), of its arguments, of the content of the files passed as arguments
+    (e.g. whitelist) and of the keys of its dependencies, so an edit of a source or a data file invalidates only
+    the sub-grammars that load it and their dependents.
+
+    Args:
+        tasks: build tasks by name
+    """
+    keys = {}
+    for name in _topological_order(tasks):
+        task = tasks[name]
+        h = hashlib.sha256(f"{name}:{task.builder.__module__}.{task.builder.__qualname__}".encode("utf-8"))
+        try:
+            h.update(grammar_fingerprint(inspect.getsourcefile(task.builder)).encode("utf-8"))
+        except TypeError:
+            # builtin builder, nothing to fingerprint
+            pass
+        h.update(json.dumps(task.kwargs, sort_keys=True, default=str).encode("utf-8"))
+        for value in task.kwargs.values():
+            if isinstance(value, str) and os.path.isfile(value):
+                with open(value, "rb") as f:
+                    h.update(hashlib.sha256(f.read()).digest())
+        for arg, dep in sorted(task.deps.items()):
+            h.update(f"{arg}={keys[dep]}".encode("utf-8"))
+        keys[name] = h.hexdigest()[:FINGERPRINT_LEN]
+    return keys
+
+
+def _cache_file(cache_dir: str, name: str, key: str) -> str:
+    return os.path.join(cache_dir, GRAPHS_CACHE_DIR, f"{name}_{key}.far")
+
+
+def _graph_entries(graph: Any) -> Dict[str, "pynini.Fst"]:
+    """
+    Returns .far entries of the sub-grammar: its FST attributes by attribute name, and its class with the other
+    attributes serialized to json under ATTRIBUTES_KEY. A sub-grammar that is an FST is stored under "fst".
+    Raises TypeError if the sub-grammar has attributes that can't be restored from json, e.g. lists of FSTs.
+    """
+    if isinstance(graph, pynini.Fst):
+        return {"fst": graph, ATTRIBUTES_KEY: pynini.accep(pynini.escape(json.dumps({"class": None})))}
+
+    graph_class = type(graph)
+    attributes = {"class": f"{graph_class.__module__}:{graph_class.__qualname__}", "values": {}, "paths": {}}
+    entries = {}
+    for attr, value in vars(graph).items():
+        if isinstance(value, pynini.Fst):
+            entries[attr] = value
+        elif isinstance(value, Path):
+            attributes["paths"][attr] = str(value)
+        elif json.loads(json.dumps(value)) == value:
+            attributes["values"][attr] = value
+        else:
+            raise TypeError(f"{attr} of {graph_class.__name__} can't be cached")
+    entries[ATTRIBUTES_KEY] = pynini.accep(pynini.escape(json.dumps(attributes)))
+    return entries
+
+
+def _graph_class(class_name: str) -> type:
+    """
+    Returns class of a cached sub-grammar by "<module>:<qualified name>", only classes of the package are allowed
+    """
+    module_name, qualname = class_name.split(":")
+    if module_name.split(".")[0] != PACKAGE_NAME:
+        raise ValueError(f"{class_name} is not a grammar class of {PACKAGE_NAME}")
+    graph_class = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        graph_class = getattr(graph_class, name)
+    if not isinstance(graph_class, type):
+        raise ValueError(f"{class_name} is not a class")
+    return graph_class
+
+
+def _load_graph(cache_file: str) -> Optional[Any]:
+    """
+    Restores cached sub-grammar, returns None if the file is missing or can't be read
+    """
+    if not os.path.exists(cache_file):
+        return None
+    try:
+        entries = {key: fst.copy() for key, fst in pynini.Far(cache_file, mode="r")}
+        attributes = json.loads(entries.pop(ATTRIBUTES_KEY).string())
+        if attributes["class"] is None:
+            return entries["fst"]
+        graph_class = _graph_class(attributes["class"])
+        # the grammar is restored without rebuilding it in __init__()
+        graph = graph_class.__new__(graph_class)
+        vars(graph).update(attributes["values"])
+        vars(graph).update({attr: Path(path) for attr, path in attributes["paths"].items()})
+        vars(graph).update(entries)
+        return graph
+    except Exception as e:
+        logger.warning(f"Failed to restore {cache_file}: {e}")
+        return None
+
+
+def _save_graph(cache_file: str, graph: Any):
+    """
+    Writes sub-grammar to the cache as a .far file atomically so that concurrent builds never read a partially
+    written file. Sub-grammars that can't be stored as a .far file (see _graph_entries()) are not cached.
+    """
+    try:
+        entries = _graph_entries(graph)
+    except TypeError as e:
+        logger.warning(f"Not caching {cache_file}: {e}")
+        return
+
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix=".tmp")
+    os.close(fd)
+    try:
+        far = pynini.Far(tmp_path, mode="w")
+        # keys of a .far file are sorted
+        for key in sorted(entries):
+            far[key] = entries[key]
+        far.close()
+        os.replace(tmp_path, cache_file)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def _build(builder: Callable, kwargs: Dict[str, Any]) -> Tuple[Any, float]:
+    """
+    Creates sub-grammar, returns it with the build time in seconds
+    """
+    start_time = time.time()
+    graph = builder(**kwargs)
+    return graph, time.time() - start_time
+
+
+def _log_build(name: str, graph: Any, build_time: float):
+    fst = getattr(graph, "fst", graph)
+    num_states = fst.num_states() if hasattr(fst, "num_states") else "-"
+    logger.debug(f"{name}: {build_time: .2f}s -- {num_states} nodes")
+
+
+def build_graphs(
+    tasks: Dict[str, GraphTask], n_jobs: int = 1, cache_dir: str = None, overwrite_cache: bool = False
+) -> Dict[str, Any]:
+    """
+    Builds sub-grammars respecting their dependencies, e.g. cardinal -> decimal -> money.
+    With n_jobs > 1 independent sub-grammars are built in separate processes as soon as their dependencies are ready,
+    the built grammars are pickled (FSTs are serialized) to be passed to the dependent tasks and back to the caller.
+    With cache_dir every sub-grammar is cached separately (see graph_cache_keys()), only the sub-grammars whose
+    sources, data or arguments changed since the previous build are rebuilt.
+
+    Args:
+        tasks: build tasks by name
+        n_jobs: the number of processes. If 1 is given, sub-grammars are built sequentially in the current process.
+            If -1 all CPUs are used. For n_jobs below -1, (n_cpus + 1 + n_jobs) are used.
+        cache_dir: path to a dir with cached sub-grammars. Set to None to avoid using cache.
+        overwrite_cache: set to True to rebuild and overwrite cached sub-grammars
+
+    Returns: built sub-grammars by task name
+    """
+    order = _topological_order(tasks)
+    results = {}
+
+    cache_files = {}
+    if cache_dir is not None and cache_dir != "None":
+        cache_files = {name: _cache_file(cache_dir, name, key) for name, key in graph_cache_keys(tasks).items()}
+        if not overwrite_cache:
+            for name in order:
+                graph = _load_graph(cache_files[name])
+                if graph is not None:
+                    results[name] = graph
+            if results:
+                logger.info(f"Restored {len(results)} of {len(tasks)} grammars from {cache_dir}")
+
+    def _kwargs(name: str) -> Dict[str, Any]:
+        task = tasks[name]
+        return dict(task.kwargs, **{arg: results[dep] for arg, dep in task.deps.items()})
+
+    def _add_result(name: str, graph: Any, build_time: float):
+        results[name] = graph
+        _log_build(name, graph, build_time)
+        if name in cache_files:
+            _save_graph(cache_files[name], graph)
+
+    waiting = [name for name in order if name not in results]
+    n_jobs = min(effective_n_jobs(n_jobs), len(waiting))
+    if n_jobs <= 1:
+        for name in waiting:
+            _add_result(name, *_build(tasks[name].builder, _kwargs(name)))
+        return results
+
+    logger.info(f"Building {len(waiting)} grammars with {n_jobs} processes")
+    running = {}
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        while waiting or running:
+            for name in [name for name in waiting if all(dep in results for dep in tasks[name].deps.values())]:
+                waiting.remove(name)
+                running[executor.submit(_build, tasks[name].builder, _kwargs(name))] = name
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                _add_result(name, *future.result())
+    return results
@@ -1,5 +1,9 @@
 from typing import List
 
+# punctuation around a word that is not a part of a semiotic token, e.g. in "(twenty,"
+TRAILING_PUNCT = ',;:!?"\')]'
+LEADING_PUNCT = '"\'(['
+
 
 def _split(sentences: List[str], delimiter: str, max_len: int, min_len: int):
     """
@@ -68,3 +72,52 @@ def additional_split(sentences: List[str], split_on_symbols: str, max_len: int =
 
     sentences = [s.strip() for s in another_sent_split if s.strip()]
     return sentences
+
+
+def pack_sentences(sentences: List[str], max_len: int = 1000) -> List[str]:
+    """
+    Combines consecutive sentences into windows of at most max_len symbols.
+    A sentence longer than max_len forms a window on its own.
+
+    Args:
+        sentences: Sentences to combine.
+        max_len: the maximum number of symbols in the output windows
+    """
+    windows = []
+    for sent in sentences:
+        if len(windows) > 0 and len(windows[-1]) + len(sent) + 1 <= max_len:
+            windows[-1] = windows[-1] + " " + sent
+        else:
+            windows.append(sent)
+    return windows
+
+
+def is_semiotic_word(word: str) -> bool:
+    """
+    Returns True if the word could be a part of a semiotic token (a token that the tagger would not leave as a plain
+    word), e.g. "12", ":", "$5", "10am", "Jan." or "U.S.A.", False for a word made only of letters and surrounding
+    punctuation, e.g. "desk," or "(the".
+
+    Args:
+        word: word without spaces
+    """
+    word = word.lstrip(LEADING_PUNCT).rstrip(TRAILING_PUNCT)
+    return not word.isalpha()
+
+
+def merge_semiotic_spans(pieces: List[str]) -> List[str]:
+    """
+    Merges consecutive pieces of a sentence, see additional_split(), if the boundary between them is next to a word
+    that could be a part of a semiotic token, e.g. ["at 12 :", "30 pm"] -> ["at 12 : 30 pm"], so that a split does
+    not cut a time, money or measure span apart and change its normalization.
+
+    Args:
+        pieces: consecutive pieces of a sentence
+    """
+    merged = []
+    for piece in pieces:
+        if merged and (is_semiotic_word(merged[-1].split()[-1]) or is_semiotic_word(piece.split()[0])):
+            merged[-1] = merged[-1] + " " + piece
+        else:
+            merged.append(piece)
+    return merged
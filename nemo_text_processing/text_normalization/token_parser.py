@@ -12,13 +12,38 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
 import string
 from collections import OrderedDict
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 PRESERVE_ORDER_KEY = "preserve_order"
 EOS = "<EOS>"
 
+# a key that can only contain ascii and '_' characters with its value: a string that ends with quote followed
+# by space, "true" of preserve_order or opening brace of nested tokens, or closing brace of nested tokens
+TOKEN = re.compile(r' *(?:([A-Za-z_]+) *(?::(?: *"(.*?)"(?= )| *(true))|(\{))|(\}))', re.DOTALL)
+SPACES = re.compile(r" *")
+
+
+def order_fields(d: Dict, field_order: Optional[List[str]] = None) -> List[Tuple]:
+    """
+    Returns key value pairs of a parsed token in the canonical field order, e.g. for
+    field_order=["integer_part", "currency_maj"]: {currency_maj: "dollars", integer_part: "five"}
+    -> [(integer_part, "five"), (currency_maj, "dollars")]
+    Tokens with "preserve_order: true" keep the parsed order, keys missing from field_order are moved to the end.
+
+    Args:
+        d: parsed token
+        field_order: canonical order of keys
+
+    Returns: list of key value pairs
+    """
+    if not field_order or PRESERVE_ORDER_KEY in d:
+        return list(d.items())
+    rank = {k: i for i, k in enumerate(field_order)}
+    return sorted(d.items(), key=lambda kv: rank.get(kv[0], len(field_order)))
+
 
 class TokenParser:
     """
@@ -191,3 +216,82 @@ class TokenParser:
             return True
         self.char = EOS
         return False
+
+
+class FastTokenParser:
+    """
+    Drop-in replacement of TokenParser with the same output. Instead of reading the tagged text character
+    by character with recursive descent, it matches a whole key and its value with one precompiled regular
+    expression and builds nested tokens with an explicit stack. Malformed text, e.g. an unclosed brace,
+    is handed over to TokenParser, so that the result or the raised error is the same.
+
+    Args
+        text: tokenized text
+    """
+
+    def __call__(self, text: str):
+        """
+        Setup function
+
+        Args:
+            text: text to be parsed
+        """
+        if not text:
+            # same as TokenParser, which cannot handle empty string
+            raise IndexError("Tagged text is empty")
+        self.text = text
+
+    def parse(self) -> List[dict]:
+        """
+        Main function, parses the tokens of the whole text
+
+        Returns list of dictionaries
+        """
+        text = self.text
+        match = TOKEN.match
+        tokens = []
+        # dictionaries of the enclosing braces, None stands for the top level
+        stack = []
+        current = None
+        index = 0
+        while True:
+            m = match(text, index)
+            if m is None:
+                break
+            index = m.end()
+            key, value, true, brace, close = m.groups()
+            if close is not None:
+                if not stack:
+                    return self._parse_slow()
+                current = stack.pop()
+                continue
+
+            if (true is not None) != (key == PRESERVE_ORDER_KEY):
+                # preserve_order can only have "true" value
+                return self._parse_slow()
+            if brace is not None:
+                value = OrderedDict()
+            elif true is not None:
+                value = True
+            elif not value:
+                value = None
+
+            if current is None:
+                tokens.append(OrderedDict([(key, value)]))
+            else:
+                current[key] = value
+            if brace is not None:
+                stack.append(current)
+                current = value
+
+        if stack or SPACES.match(text, index).end() != len(text):
+            return self._parse_slow()
+        return tokens
+
+    def _parse_slow(self) -> List[dict]:
+        """
+        Parses the text with TokenParser, e.g. to raise the same error
+        """
+        parser = TokenParser()
+        parser(self.text)
+        return parser.parse()
@@ -17,6 +17,7 @@ import os
 import pynini
 from pynini.lib import pynutil
 
+from nemo_text_processing.text_normalization.cache_utils import content_addressed_far_file
 from nemo_text_processing.text_normalization.vi.graph_utils import (
     NEMO_SPACE,
     GraphFst,
@@ -65,6 +66,7 @@ class ClassifyFst(GraphFst):
                 cache_dir,
                 f"vi_tn_{deterministic}_deterministic_{input_case}_tokenize.far",
             )
+            far_file = content_addressed_far_file(far_file, __file__, whitelist)
         if not overwrite_cache and far_file and os.path.exists(far_file):
             self.fst = pynini.Far(far_file, mode="r")["tokenize_and_classify"]
             logger.info(f"ClassifyFst.fst was restored from {far_file}.")
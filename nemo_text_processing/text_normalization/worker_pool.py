@@ -0,0 +1,294 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import itertools
+import multiprocessing
+import os
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from joblib import effective_n_jobs
+
+from nemo_text_processing.utils.logging import logger
+
+# normalizer of the current worker process, created once by _init_worker()
+_worker_normalizer = None
+# normalizers of the pools started with share_memory=True by pool id, inherited by the forked workers
+_shared_normalizers = {}
+# fields of /proc/<pid>/smaps_rollup reported by memory_usage()
+MEMORY_FIELDS = {
+    "Rss": "rss",
+    "Pss": "pss",
+    "Shared_Clean": "shared",
+    "Shared_Dirty": "shared",
+    "Private_Clean": "private",
+    "Private_Dirty": "private",
+}
+
+
+def batched(inputs: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    """
+    Lazily splits inputs into lists of batch_size elements, the last list could be shorter
+
+    Args:
+        inputs: inputs to split
+        batch_size: number of inputs per list
+    """
+    if batch_size <= 0:
+        raise ValueError(f"batch_size should be positive, got {batch_size}")
+    inputs = iter(inputs)
+    while True:
+        batch = list(itertools.islice(inputs, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def memory_usage(pid: Optional[int] = None) -> Optional[Dict[str, float]]:
+    """
+    Returns memory usage of a process in MB: resident size (rss), proportional set size (pss, shared pages are split
+    between the processes sharing them), shared and private resident memory.
+
+    Args:
+        pid: process id, by default the current process
+
+    Returns: memory usage or None if /proc/<pid>/smaps_rollup is not available (not Linux, kernel older than 4.14
+        or the process has exited)
+    """
+    usage = {"rss": 0.0, "pss": 0.0, "shared": 0.0, "private": 0.0}
+    try:
+        f = open(f"/proc/{pid or os.getpid()}/smaps_rollup", "r")
+    except FileNotFoundError:
+        return None
+    with f:
+        for line in f:
+            field, *value = line.split()
+            field = MEMORY_FIELDS.get(field.rstrip(":"))
+            if field is not None:
+                usage[field] += int(value[0]) / 1024
+    return usage
+
+
+def _init_worker(
+    normalizer_cls: Optional[type],
+    init_kwargs: Optional[dict],
+    pickled_normalizer: Optional[bytes],
+    shared_id: Optional[int] = None,
+):
+    """
+    Creates the normalizer of a worker process, either from the constructor arguments (grammars are loaded from
+    the .far cache), from the pickled normalizer or, for the forked workers, takes the normalizer of the parent process
+
+    Args:
+        normalizer_cls: normalizer class, e.g. Normalizer
+        init_kwargs: constructor arguments of the normalizer
+        pickled_normalizer: pickled normalizer, used if init_kwargs is None
+        shared_id: id of the pool in _shared_normalizers, used if given
+    """
+    global _worker_normalizer
+    if shared_id is not None:
+        _worker_normalizer = _shared_normalizers[shared_id]
+    elif init_kwargs is not None:
+        _worker_normalizer = normalizer_cls(**init_kwargs)
+    else:
+        _worker_normalizer = pickle.loads(pickled_normalizer)
+
+
+def _process_batch(method: str, batch: List[Any], kwargs: dict) -> List[Any]:
+    """
+    Applies normalizer method to every element of the batch in a worker process
+
+    Args:
+        method: name of the normalizer method, e.g. "normalize" or "normalize_line"
+        batch: list of inputs
+        kwargs: keyword arguments of the method
+    """
+    fn = getattr(_worker_normalizer, method)
+    return [fn(x, **kwargs) for x in batch]
+
+
+def _process_requests(method: str, batch: List[Any], kwargs: dict) -> List[Tuple[Any, Optional[Exception]]]:
+    """
+    Applies normalizer method to every element of the batch in a worker process. Unlike _process_batch(),
+    an error of one input doesn't fail the batch: (output, None) or (None, error) is returned for every input.
+
+    Args:
+        method: name of the normalizer method, e.g. "normalize" or "normalize_line"
+        batch: list of inputs
+        kwargs: keyword arguments of the method
+    """
+    fn = getattr(_worker_normalizer, method)
+    results = []
+    for x in batch:
+        try:
+            results.append((fn(x, **kwargs), None))
+        except Exception as e:
+            results.append((None, e))
+    return results
+
+
+class NormalizerPool:
+    """
+    Long-lived pool of worker processes each holding its own copy of the normalizer.
+    Grammars are loaded once per worker and reused across calls, so repeated small batches don't pay for
+    process startup and grammar serialization. If the normalizer was created with cache_dir, workers load grammars
+    from the .far cache, otherwise the normalizer is pickled once per worker.
+    Either way every worker holds a private copy of the grammars. With share_memory=True the workers are forked
+    from the current process and use the grammars of the parent normalizer instead: the FSTs are never written to,
+    so their pages stay shared between all workers (copy-on-write) and the grammars are held in RAM only once.
+
+    Args:
+        normalizer: normalizer to copy to the workers, e.g. Normalizer or InverseNormalizer
+        n_jobs: the number of worker processes. If -1 all CPUs are used. For n_jobs below -1,
+            (n_cpus + 1 + n_jobs) are used. Thus for n_jobs = -2, all CPUs but one are used.
+        max_pending: the maximum number of batches submitted to the workers and not yet consumed,
+            by default 2 * n_jobs
+        share_memory: set to True to fork the workers and share the grammars of the normalizer with them,
+            only supported on platforms with the "fork" start method, e.g. Linux
+    """
+
+    def __init__(
+        self,
+        normalizer: 'Normalizer',
+        n_jobs: int = -1,
+        max_pending: Optional[int] = None,
+        share_memory: bool = False,
+    ):
+        self.n_jobs = effective_n_jobs(n_jobs)
+        self.max_pending = max_pending if max_pending is not None else 2 * self.n_jobs
+        if self.max_pending <= 0:
+            raise ValueError(f"max_pending should be positive, got {self.max_pending}")
+
+        if share_memory and "fork" not in multiprocessing.get_all_start_methods():
+            logger.warning("Shared grammars require the 'fork' start method, workers will load their own copies")
+            share_memory = False
+        self.share_memory = share_memory
+
+        mp_context = None
+        init_kwargs = getattr(normalizer, "_init_kwargs", None)
+        if share_memory:
+            _shared_normalizers[id(self)] = normalizer
+            initargs = (None, None, None, id(self))
+            mp_context = multiprocessing.get_context("fork")
+            # objects tracked by the garbage collector are moved to the permanent generation, so that collections
+            # in the workers don't write to the inherited pages
+            gc.freeze()
+        elif init_kwargs is not None and init_kwargs.get("cache_dir") not in [None, "None"]:
+            init_kwargs = dict(init_kwargs, overwrite_cache=False)
+            initargs = (type(normalizer), init_kwargs, None)
+        else:
+            initargs = (None, None, pickle.dumps(normalizer))
+
+        logger.info(f"Starting normalizer pool with {self.n_jobs} worker(s)")
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.n_jobs, mp_context=mp_context, initializer=_init_worker, initargs=initargs
+        )
+
+    def imap(self, method: str, inputs: Iterable[Any], batch_size: int = 1, **kwargs) -> Iterator[List[Any]]:
+        """
+        Lazily splits inputs into batches, applies the normalizer method to them in the workers
+        and yields the results batch by batch in the input order.
+        At most max_pending batches are in flight at a time, so the inputs are consumed at the rate of the workers.
+
+        Args:
+            method: name of the normalizer method, e.g. "normalize" or "normalize_line"
+            inputs: inputs of the method, e.g. texts
+            batch_size: number of inputs sent to a worker at a time
+            kwargs: keyword arguments of the method, e.g. punct_post_process=True
+
+        Returns: iterator over lists of outputs, one list per batch
+        """
+        return self.imap_batches(method, batched(inputs, batch_size), **kwargs)
+
+    def imap_batches(self, method: str, batches: Iterable[List[Any]], **kwargs) -> Iterator[List[Any]]:
+        """
+        Same as imap() for inputs that are already split into batches
+
+        Args:
+            method: name of the normalizer method, e.g. "normalize" or "normalize_line"
+            batches: lists of inputs, each list is sent to a worker at a time
+            kwargs: keyword arguments of the method, e.g. punct_post_process=True
+
+        Returns: iterator over lists of outputs, one list per batch
+        """
+        pending = deque()
+        try:
+            for batch in batches:
+                pending.append(self._executor.submit(_process_batch, method, batch, kwargs))
+                if len(pending) >= self.max_pending:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def map(self, method: str, inputs: Iterable[Any], batch_size: int = 1, **kwargs) -> List[Any]:
+        """
+        Applies the normalizer method to all inputs in the workers, see imap() for args description
+
+        Returns: list of outputs in the input order
+        """
+        return list(itertools.chain.from_iterable(self.imap(method, inputs, batch_size=batch_size, **kwargs)))
+
+    def memory_report(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns memory usage of the current process and of every started worker in MB, see memory_usage().
+        With share_memory=True the proportional set size (pss) of the workers is much smaller than their
+        resident size (rss), as the grammar pages are counted once for all processes.
+
+        Returns: memory usage by process, e.g. {"main": {...}, "worker 1234": {...}}, empty if memory usage is not
+            available on this platform
+        """
+        usage = memory_usage()
+        if usage is None:
+            return {}
+        report = {"main": usage}
+        # workers are started on demand by the executor
+        for pid in sorted(getattr(self._executor, "_processes", None) or {}):
+            try:
+                usage = memory_usage(pid)
+            except OSError:
+                continue
+            # None if the worker has exited
+            if usage is not None:
+                report[f"worker {pid}"] = usage
+        return report
+
+    def log_memory_report(self):
+        """
+        Logs memory usage of the current process and of the workers, see memory_report()
+        """
+        report = self.memory_report()
+        if not report:
+            logger.info("Memory usage report is skipped, /proc/<pid>/smaps_rollup is not available.")
+        for process, usage in report.items():
+            logger.info(f"{process}: " + ", ".join(f"{field} {value:.1f} MB" for field, value in usage.items()))
+
+    def close(self):
+        """
+        Shuts down the worker processes
+        """
+        self._executor.shutdown(wait=True)
+        if _shared_normalizers.pop(id(self), None) is not None and not _shared_normalizers:
+            gc.unfreeze()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
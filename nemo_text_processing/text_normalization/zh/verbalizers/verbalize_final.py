@@ -16,6 +16,7 @@ import os
 import pynini
 from pynini.lib import pynutil
 
+from nemo_text_processing.text_normalization.cache_utils import content_addressed_far_file
 from nemo_text_processing.text_normalization.zh.graph_utils import GraphFst, delete_space, generator_main
 from nemo_text_processing.text_normalization.zh.verbalizers.postprocessor import PostProcessor
 from nemo_text_processing.text_normalization.zh.verbalizers.verbalize import VerbalizeFst
@@ -32,6 +33,7 @@ class VerbalizeFinalFst(GraphFst):
         if cache_dir is not None and cache_dir != "None":
             os.makedirs(cache_dir, exist_ok=True)
             far_file = os.path.join(cache_dir, f"zh_tn_{deterministic}_deterministic_verbalizer.far")
+            far_file = content_addressed_far_file(far_file, __file__)
         if not overwrite_cache and far_file and os.path.exists(far_file):
             self.fst = pynini.Far(far_file, mode="r")["verbalize"]
         else:
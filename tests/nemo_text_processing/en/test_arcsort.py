@@ -0,0 +1,53 @@
+# Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import pywrapfst
+
+from nemo_text_processing.inverse_text_normalization.inverse_normalize import InverseNormalizer
+from nemo_text_processing.text_normalization.normalize import Normalizer
+
+from ..utils import CACHE_DIR, parse_test_case_file
+
+PROPERTIES = getattr(pywrapfst, "FstProperties", pywrapfst)
+
+
+def _is_ilabel_sorted(fst) -> bool:
+    return fst.properties(PROPERTIES.I_LABEL_SORTED, True) == PROPERTIES.I_LABEL_SORTED
+
+
+class TestArcsort:
+    normalizer_en = Normalizer(input_case='cased', lang='en', cache_dir=CACHE_DIR, overwrite_cache=False)
+    normalizer_en_unsorted = Normalizer(
+        input_case='cased', lang='en', cache_dir=CACHE_DIR, overwrite_cache=False, arcsort_grammars=False
+    )
+    inverse_normalizer_en = InverseNormalizer(lang='en', cache_dir=CACHE_DIR, overwrite_cache=False)
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_sorted_grammars(self):
+        for normalizer in [self.normalizer_en, self.inverse_normalizer_en]:
+            assert _is_ilabel_sorted(normalizer.tagger.fst)
+            assert _is_ilabel_sorted(normalizer.verbalizer.fst)
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "test_file",
+        ["en/data_text_normalization/test_cases_money.txt", "en/data_text_normalization/test_cases_date.txt"],
+    )
+    def test_same_output(self, test_file):
+        for written, _ in parse_test_case_file(test_file):
+            expected = self.normalizer_en_unsorted.normalize(written, punct_post_process=True)
+            assert self.normalizer_en.normalize(written, punct_post_process=True) == expected
@@ -0,0 +1,103 @@
+# Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import pytest
+
+from nemo_text_processing.inverse_text_normalization.inverse_normalize import InverseNormalizer
+from nemo_text_processing.text_normalization.normalize import Normalizer
+
+from ..utils import CACHE_DIR
+
+
+class TestAsync:
+    normalizer_en = Normalizer(input_case='cased', lang='en', cache_dir=CACHE_DIR, overwrite_cache=False)
+    inverse_normalizer_en = InverseNormalizer(lang='en', cache_dir=CACHE_DIR, overwrite_cache=False)
+    texts = ["It costs $20 on Jan 5.", "The meeting is at 10:30am.", "See you at 5.", "Hello world"]
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_anormalize_list(self, executor):
+        expected = [self.normalizer_en.normalize(text, punct_post_process=True) for text in self.texts]
+        async_normalizer = self.normalizer_en.start_async(executor=executor, max_workers=2, batch_window=0.05)
+        try:
+            outputs = asyncio.run(self.normalizer_en.anormalize_list(self.texts, punct_post_process=True))
+        finally:
+            self.normalizer_en.close_async()
+        assert outputs == expected
+        assert async_normalizer.num_requests == len(self.texts)
+        # concurrent requests are batched for worker processes, threads normalize every request separately
+        assert async_normalizer.num_batches == (1 if executor == "process" else 0)
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_request_error(self, executor):
+        async def _run():
+            requests = [self.normalizer_en.anormalize(text) for text in ["It costs $20.", None, "See you at 5."]]
+            return await asyncio.gather(*requests, return_exceptions=True)
+
+        self.normalizer_en.start_async(executor=executor, max_workers=2, batch_window=0.05)
+        try:
+            outputs = asyncio.run(_run())
+        finally:
+            self.normalizer_en.close_async()
+        # an error fails only its own request
+        assert outputs[0] == self.normalizer_en.normalize("It costs $20.")
+        assert isinstance(outputs[1], Exception)
+        assert outputs[2] == self.normalizer_en.normalize("See you at 5.")
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_thread_no_batch_window(self):
+        # a thread executor doesn't wait for other requests to join a batch
+        self.normalizer_en.start_async(executor="thread", batch_window=60.0)
+        try:
+            output = asyncio.run(self.normalizer_en.anormalize("It costs $20.", timeout=30.0))
+        finally:
+            self.normalizer_en.close_async()
+        assert output == self.normalizer_en.normalize("It costs $20.")
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_timeout_and_cancellation(self):
+        async def _run():
+            async_normalizer = self.normalizer_en.start_async(executor="process", max_workers=1, batch_window=1.0)
+            with pytest.raises(asyncio.TimeoutError):
+                await self.normalizer_en.anormalize("It costs $20.", timeout=0.01)
+
+            task = asyncio.ensure_future(self.normalizer_en.anormalize("It costs $20."))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            await asyncio.sleep(1.1)
+            # requests were dropped before their batch was submitted
+            return async_normalizer.num_batches
+
+        try:
+            assert asyncio.run(_run()) == 0
+        finally:
+            self.normalizer_en.close_async()
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_ainverse_normalize(self):
+        try:
+            output = asyncio.run(self.inverse_normalizer_en.ainverse_normalize("twenty dollars"))
+        finally:
+            self.inverse_normalizer_en.close_async()
+        assert output == self.inverse_normalizer_en.inverse_normalize("twenty dollars", verbose=False)
@@ -0,0 +1,151 @@
+# Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import pickle
+
+import pytest
+from parameterized import parameterized
+
+from nemo_text_processing.text_normalization import cache_utils
+from nemo_text_processing.text_normalization.cache_utils import (
+    LRUCache,
+    _file_stat,
+    _imported_files,
+    content_addressed_far_file,
+    grammar_fingerprint,
+    prune_stale_far_files,
+)
+from nemo_text_processing.text_normalization.normalize import Normalizer
+
+from ..utils import CACHE_DIR, parse_test_case_file
+
+
+class TestCache:
+    normalizer_en = Normalizer(
+        input_case='cased', lang='en', cache_dir=CACHE_DIR, overwrite_cache=False, post_process=True, cache_size=2
+    )
+
+    normalizer_en_token_cache = Normalizer(
+        input_case='cased',
+        lang='en',
+        cache_dir=CACHE_DIR,
+        overwrite_cache=False,
+        post_process=True,
+        token_cache_size=100,
+    )
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_lru_cache(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+        assert "b" not in cache
+        assert cache.get("b") is None
+        assert cache.info() == (1, 1, 1, 2, 2)
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_normalize_cache(self):
+        self.normalizer_en.clear_cache()
+        text = "It costs $20 on Jan 5."
+        expected = self.normalizer_en._normalize(text, punct_post_process=True)
+
+        assert self.normalizer_en.normalize(text, punct_post_process=True) == expected
+        assert self.normalizer_en.normalize(text, punct_post_process=True) == expected
+        info = self.normalizer_en.cache_info()
+        assert info.hits == 1 and info.misses == 1
+
+        # punctuation post-processing flags are part of the key
+        self.normalizer_en.normalize(text, punct_post_process=False)
+        self.normalizer_en.normalize("one more", punct_post_process=False)
+        info = self.normalizer_en.cache_info()
+        assert info.misses == 3 and info.evictions == 1 and info.currsize == 2
+
+    @parameterized.expand(
+        parse_test_case_file('en/data_text_normalization/test_cases_money.txt')
+        + parse_test_case_file('en/data_text_normalization/test_cases_date.txt')
+        + parse_test_case_file('en/data_text_normalization/test_cases_measure.txt')
+    )
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_norm_token_cache(self, test_input, _):
+        pred = self.normalizer_en_token_cache.normalize(test_input, verbose=False, punct_post_process=False)
+        # the reference normalizer doesn't memoize tokens
+        expected = self.normalizer_en._normalize(test_input, verbose=False, punct_post_process=False)
+        assert pred == expected, f"input: {test_input}"
+        assert len(self.normalizer_en_token_cache.token_cache) > 0
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_lru_cache_pickle(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache = pickle.loads(pickle.dumps(cache))
+        assert cache.get("a") == 1
+        cache.put("b", 2)
+        assert len(cache) == 2
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_grammar_fingerprint(self, tmp_path):
+        import nemo_text_processing.text_normalization.en.taggers.tokenize_and_classify as tagger
+        import nemo_text_processing.text_normalization.en.verbalizers.verbalize_final as verbalizer
+
+        whitelist = tmp_path / "whitelist.tsv"
+        whitelist.write_text("Dr.\tdoctor\n")
+        fingerprint = grammar_fingerprint(tagger.__file__, str(whitelist))
+        assert fingerprint == grammar_fingerprint(tagger.__file__, str(whitelist))
+        assert fingerprint != grammar_fingerprint(verbalizer.__file__, str(whitelist))
+
+        # whitelist content, not only its name, is part of the key
+        whitelist.write_text("Dr.\tdrive\n")
+        assert fingerprint != grammar_fingerprint(tagger.__file__, str(whitelist))
+
+        far_file = content_addressed_far_file(os.path.join("cache", "en_tn.far"), tagger.__file__)
+        assert far_file == os.path.join("cache", f"en_tn_{grammar_fingerprint(tagger.__file__)}.far")
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_imported_files_edit(self, tmp_path):
+        source_file = tmp_path / "grammar.py"
+        source_file.write_text("import os\n")
+        assert _imported_files(str(source_file), *_file_stat(str(source_file))) == []
+
+        # an import added by an edit is picked up, the result isn't cached by the path only
+        source_file.write_text("import os\nfrom nemo_text_processing.text_normalization import cache_utils\n")
+        assert cache_utils.__file__ in _imported_files(str(source_file), *_file_stat(str(source_file)))
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_prune_stale_far_files(self, tmp_path):
+        import nemo_text_processing.text_normalization.en.verbalizers.verbalize_final as verbalizer
+
+        stale = ["en_tn_verbalizer_0123456789abcdef.far", "en_tn_verbalizer_0123456789abcdef_numeric.far"]
+        kept = ["en_tn_verbalizer.far", "en_tn_verbalizer_extra_0123456789abcdef.far", "en_itn_0123456789abcdef.far"]
+        for name in stale + kept:
+            (tmp_path / name).write_text("")
+
+        far_file = content_addressed_far_file(str(tmp_path / "en_tn_verbalizer.far"), verbalizer.__file__)
+        assert sorted(os.listdir(tmp_path)) == sorted(kept)
+
+        # only files of previous grammar versions are removed
+        for name in stale:
+            (tmp_path / name).write_text("")
+        (tmp_path / os.path.basename(far_file)).write_text("")
+        assert sorted(prune_stale_far_files(far_file)) == sorted(str(tmp_path / name) for name in stale)
+        assert os.path.exists(far_file)
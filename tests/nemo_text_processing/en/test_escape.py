@@ -0,0 +1,35 @@
+# Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pynini
+import pytest
+
+from nemo_text_processing.text_normalization.normalize import escape
+
+
+class TestEscape:
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "text",
+        ["", "the meeting", 'tokens { name: "5" }', "see [1]", "a]b", "c:\\dir", "[\\]", "ü ñ $5"],
+    )
+    def test_escape(self, text):
+        assert escape(text) == pynini.escape(text)
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_escape_no_copy(self):
+        text = "".join(["tokens { name: ", '"five" }'])
+        assert escape(text) is text
@@ -0,0 +1,62 @@
+# Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from glob import glob
+
+import pytest
+
+from nemo_text_processing.text_normalization.normalize import Normalizer
+
+from ..utils import CACHE_DIR, parse_test_case_file
+
+
+class TestFastPath:
+    normalizer_en = Normalizer(
+        input_case='cased', lang='en', cache_dir=CACHE_DIR, overwrite_cache=False, post_process=True, fast_path=True
+    )
+    normalizer_en_no_fast_path = Normalizer(
+        input_case='cased', lang='en', cache_dir=CACHE_DIR, overwrite_cache=False, post_process=True, fast_path=False
+    )
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_fast_path(self):
+        assert self.normalizer_en.fast_path
+        assert not self.normalizer_en_no_fast_path.fast_path
+        assert self.normalizer_en.normalize("hello  world") == "hello world"
+        assert not self.normalizer_en._has_trigger_phrase(["hello", "world"])
+
+        # phrases that the grammars change are derived from the tagger, including multi-word whitelist entries
+        # and context-dependent rules
+        triggers = self.normalizer_en.tagger.plain_text_triggers
+        assert {"World War II", "St Mary"} <= triggers
+        assert self.normalizer_en._has_trigger_phrase("It was World War II then".split())
+        assert self.normalizer_en.normalize("It was World War II then") == "It was World War two then"
+        assert self.normalizer_en.normalize("St Mary") == "Saint Mary"
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_fast_path_test_cases(self):
+        test_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        test_files = sorted(glob(os.path.join(test_dir, "en/data_text_normalization/test_cases_*.txt")))
+        test_files = [os.path.relpath(f, test_dir) for f in test_files if not f.endswith("normalize_with_audio.txt")]
+        assert len(test_files) > 0
+
+        test_inputs = [test_input for f in test_files for test_input, _ in parse_test_case_file(f)]
+        for test_input in test_inputs:
+            for punct_post_process in [False, True]:
+                pred = self.normalizer_en.normalize(test_input, punct_post_process=punct_post_process)
+                expected = self.normalizer_en_no_fast_path.normalize(test_input, punct_post_process=punct_post_process)
+                assert pred == expected, f"input: {test_input}"
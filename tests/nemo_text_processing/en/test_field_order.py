@@ -0,0 +1,81 @@
+# Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from parameterized import parameterized
+
+from nemo_text_processing.inverse_text_normalization.inverse_normalize import InverseNormalizer
+from nemo_text_processing.text_normalization.normalize import Normalizer
+from nemo_text_processing.text_normalization.token_parser import order_fields
+
+from ..utils import CACHE_DIR, parse_test_case_file
+
+
+class TestFieldOrder:
+    inverse_normalizer_en_canonical = InverseNormalizer(
+        lang='en', cache_dir=CACHE_DIR, overwrite_cache=False, canonical_field_order=True
+    )
+    normalizer_en = Normalizer(input_case='cased', lang='en', cache_dir=CACHE_DIR, overwrite_cache=False)
+    normalizer_en_canonical = Normalizer(
+        input_case='cased', lang='en', cache_dir=CACHE_DIR, overwrite_cache=False, canonical_field_order=True
+    )
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_order_fields(self):
+        token = OrderedDict([("currency_maj", "dollars"), ("integer_part", "five"), ("unknown", "x")])
+        ordered = order_fields(token, ["integer_part", "currency_maj"])
+        assert [k for k, _ in ordered] == ["integer_part", "currency_maj", "unknown"]
+
+        token["preserve_order"] = True
+        assert order_fields(token, ["integer_part", "currency_maj"]) == list(token.items())
+
+    @parameterized.expand(
+        parse_test_case_file('en/data_inverse_text_normalization/test_cases_money.txt')
+        + parse_test_case_file('en/data_inverse_text_normalization/test_cases_time.txt')
+    )
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_denorm(self, test_input, expected):
+        pred = self.inverse_normalizer_en_canonical.inverse_normalize(test_input, verbose=False)
+        assert pred == expected, f"input: {test_input}"
+        assert self.inverse_normalizer_en_canonical.field_order_stats["fallback"] == 0
+
+    @parameterized.expand(
+        parse_test_case_file('en/data_text_normalization/test_cases_money.txt')
+        + parse_test_case_file('en/data_text_normalization/test_cases_date.txt')
+        + parse_test_case_file('en/data_text_normalization/test_cases_measure.txt')
+        + parse_test_case_file('en/data_text_normalization/test_cases_time.txt')
+    )
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_norm(self, test_input, _):
+        pred = self.normalizer_en_canonical.normalize(test_input, verbose=False)
+        expected = self.normalizer_en.normalize(test_input, verbose=False)
+        assert pred == expected, f"input: {test_input}"
+        assert self.normalizer_en_canonical.field_order_stats["fallback"] == 0
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_stats_concurrent(self):
+        normalizer = Normalizer(
+            input_case='cased', lang='en', cache_dir=CACHE_DIR, overwrite_cache=False, canonical_field_order=True
+        )
+        texts = ["It costs $5.", "The meeting is at 10:30 am.", "It weighs 12 kg."] * 20
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(normalizer.normalize, texts))
+        assert sum(normalizer.field_order_stats.values()) == len(texts)
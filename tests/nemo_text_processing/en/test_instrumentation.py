@@ -0,0 +1,103 @@
+# Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+
+import pytest
+
+from nemo_text_processing.inverse_text_normalization.inverse_normalize import InverseNormalizer
+from nemo_text_processing.text_normalization.instrumentation import Histogram, Instrumentation
+from nemo_text_processing.text_normalization.normalize import Normalizer
+
+from ..utils import CACHE_DIR
+
+
+class TestInstrumentation:
+    normalizer_en = Normalizer(input_case='cased', lang='en', cache_dir=CACHE_DIR, overwrite_cache=False)
+    inverse_normalizer_en = InverseNormalizer(lang='en', cache_dir=CACHE_DIR, overwrite_cache=False)
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_histogram(self):
+        histogram = Histogram([1, 10, 100])
+        for value in [0.5, 5, 5, 50, 500]:
+            histogram.add(value)
+        assert histogram.counts == [1, 2, 1, 1]
+        assert histogram.percentile(50) == 10
+        assert histogram.percentile(99) == 500
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_stage_timings(self):
+        traces = []
+        instrumentation = self.normalizer_en.instrument(Instrumentation(callback=traces.append, num_slowest=2))
+        try:
+            texts = ["It costs $20 on Jan 5.", "The meeting is at 10:30am.", "See you at 5."]
+            for text in texts:
+                expected = self.normalizer_en.normalize(text, punct_post_process=True)
+                assert self.normalizer_en._normalize_text(text, punct_post_process=True) == expected
+        finally:
+            self.normalizer_en.instrumentation = None
+
+        assert [trace.text for trace in traces] == texts
+        for trace in traces:
+            # nested stages are excluded, so the sum of the stages doesn't exceed the total time
+            assert sum(trace.timings.values()) <= trace.total
+            assert trace.counters["permutations"] >= 1
+            assert trace.counters["tag_lattice_states"] > 0
+
+        summary = instrumentation.summary()
+        assert summary["total_ms"]["count"] == len(texts)
+        for stage in ["find_tags", "select_tag", "parse", "find_verbalizer", "detokenize", "post_process_punct"]:
+            assert summary["timings_ms"][stage]["count"] == len(texts)
+        assert len(summary["slowest"]) == 2
+        assert summary["slowest"][0]["total_ms"] >= summary["slowest"][1]["total_ms"]
+
+        # statistics are not copied to worker processes
+        instrumentation = pickle.loads(pickle.dumps(instrumentation))
+        assert instrumentation.summary()["total_ms"]["count"] == 0
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_class_profile(self):
+        texts = ["It costs $20 on Jan 5.", "The meeting is at 10:30am on Jan 6."]
+        expected = self.normalizer_en.normalize_list(texts)
+        assert self.normalizer_en.normalize_list(texts, profile=True) == expected
+        assert self.normalizer_en.instrumentation is None
+
+        report = self.normalizer_en.class_profile
+        assert report["date"]["count"] == 2
+        assert report["money"]["count"] == 1
+        assert report["time"]["worst"][0]["text"] == texts[1]
+        # the most expensive classes first
+        totals = [stats["total_ms"] for stats in report.values()]
+        assert totals == sorted(totals, reverse=True)
+        for stats in report.values():
+            assert stats["permutations"] > 0
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_inverse_normalizer(self):
+        # InverseNormalizer shares the runtime state of Normalizer, see Normalizer._init_runtime_state()
+        traces = []
+        self.inverse_normalizer_en.instrument(Instrumentation(callback=traces.append))
+        try:
+            text = "it costs twenty dollars"
+            pred = self.inverse_normalizer_en.normalize(text, verbose=False, punct_post_process=True)
+        finally:
+            self.inverse_normalizer_en.instrumentation = None
+        assert pred == "it costs $20"
+        assert [trace.text for trace in traces] == [text]
+        assert traces[0].counters["permutations"] >= 1
+        assert "detokenize" in traces[0].timings
@@ -0,0 +1,79 @@
+# Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from parameterized import parameterized
+
+from nemo_text_processing.text_normalization.en.taggers.tokenize_and_classify_lazy import detect_groups
+from nemo_text_processing.text_normalization.normalize import Normalizer
+
+from ..utils import CACHE_DIR, parse_test_case_file
+
+
+class TestLazyTagger:
+    normalizer_en = Normalizer(input_case='cased', lang='en', cache_dir=CACHE_DIR, overwrite_cache=False)
+    normalizer_en_lazy = Normalizer(
+        input_case='cased', lang='en', cache_dir=CACHE_DIR, overwrite_cache=False, lazy_tagger=True
+    )
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_detect_groups(self):
+        assert detect_groups("Hello, world!") == frozenset()
+        assert detect_groups("It costs $5.") == {"numeric", "serial"}
+        assert detect_groups("½ of it") == {"numeric"}
+        assert detect_groups("B2") == {"numeric", "serial"}
+        assert detect_groups("see nvidia.com") == {"electronic"}
+        assert detect_groups("upgrade/update") == {"electronic", "serial"}
+        assert detect_groups("card ending in 8876") == {"electronic", "numeric", "serial"}
+        assert detect_groups("#mytext") == {"serial"}
+
+    @parameterized.expand(
+        parse_test_case_file('en/data_text_normalization/test_cases_money.txt')
+        + parse_test_case_file('en/data_text_normalization/test_cases_electronic.txt')
+        + parse_test_case_file('en/data_text_normalization/test_cases_serial.txt')
+        + parse_test_case_file('en/data_text_normalization/test_cases_whitelist.txt')
+        + parse_test_case_file('en/data_text_normalization/test_cases_word.txt')
+    )
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_norm(self, test_input, _):
+        pred = self.normalizer_en_lazy.normalize(test_input, verbose=False, punct_post_process=True)
+        expected = self.normalizer_en.normalize(test_input, verbose=False, punct_post_process=True)
+        assert pred == expected, f"input: {test_input}"
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_lazy_loading(self):
+        self.normalizer_en_lazy.normalize("Lazily loaded grammars keep containers small.")
+        assert frozenset() in self.normalizer_en_lazy.tagger.graphs
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_concurrent_loading(self, tmp_path):
+        normalizer = Normalizer(
+            input_case='cased', lang='en', cache_dir=str(tmp_path), overwrite_cache=False, lazy_tagger=True
+        )
+        texts = ["It costs $5.", "see nvidia.com", "#mytext", "Hello, world!"] * 4
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            preds = list(executor.map(normalizer.normalize, texts))
+        assert preds == [self.normalizer_en.normalize(text) for text in texts]
+
+        # combination graphs were written once, no temporary files are left
+        assert not [f for f in tmp_path.iterdir() if f.suffix == ".tmp"]
+        restored = pickle.loads(pickle.dumps(normalizer))
+        assert restored.normalize("It costs $5.") == preds[0]
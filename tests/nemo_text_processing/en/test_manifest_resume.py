@@ -0,0 +1,133 @@
+# Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import stat
+import tempfile
+
+import pytest
+
+from nemo_text_processing.text_normalization import cache_utils
+from nemo_text_processing.text_normalization.checkpoint_utils import ManifestCheckpoint, replace_file
+from nemo_text_processing.text_normalization.normalize import Normalizer
+
+from ..utils import CACHE_DIR, parse_test_case_file
+
+
+class TestManifestResume:
+    normalizer_en = Normalizer(input_case='cased', lang='en', cache_dir=CACHE_DIR, overwrite_cache=False)
+    test_inputs = [text for text, _ in parse_test_case_file('en/data_text_normalization/test_cases_money.txt')]
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_checkpoint(self, tmp_path):
+        checkpoint_dir = str(tmp_path / "checkpoint")
+        checkpoint = ManifestCheckpoint(checkpoint_dir, "abc")
+        with checkpoint.open_shard(0) as f:
+            f.write("a\n")
+        with pytest.raises(RuntimeError):
+            with checkpoint.open_shard(1) as f:
+                raise RuntimeError
+
+        assert ManifestCheckpoint(checkpoint_dir, "abc").completed == {0}
+        # shards of a different manifest or configuration are discarded
+        assert ManifestCheckpoint(checkpoint_dir, "xyz").completed == set()
+        assert not os.path.exists(checkpoint.shard_path(0))
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_replace_file_mode(self, tmp_path):
+        path = str(tmp_path / "manifest_normalized.json")
+        umask = os.umask(0o022)
+        try:
+            for expected_mode in [0o644, 0o640]:
+                fd, tmp_filename = tempfile.mkstemp(dir=str(tmp_path))
+                os.close(fd)
+                replace_file(tmp_filename, path)
+                assert stat.S_IMODE(os.stat(path).st_mode) == expected_mode
+                # the mode of an existing file is kept
+                os.chmod(path, 0o640)
+        finally:
+            os.umask(umask)
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_resume(self, tmp_path, monkeypatch):
+        manifest = tmp_path / "manifest.json"
+        with open(manifest, "w") as f:
+            for idx, text in enumerate(self.test_inputs):
+                f.write(json.dumps({"id": idx, "text": text}) + "\n")
+        output_filename = str(tmp_path / "manifest_normalized.json")
+        args = dict(n_jobs=1, punct_pre_process=False, punct_post_process=True, batch_size=2, resume=True)
+
+        num_calls = []
+        fail_after = [5]
+        normalize_line = self.normalizer_en.normalize_line
+
+        def _counting_normalize_line(line, **kwargs):
+            if len(num_calls) == fail_after[0]:
+                raise KeyboardInterrupt
+            num_calls.append(line)
+            return normalize_line(line, **kwargs)
+
+        monkeypatch.setattr(self.normalizer_en, "normalize_line", _counting_normalize_line)
+        with pytest.raises(KeyboardInterrupt):
+            self.normalizer_en.normalize_manifest(str(manifest), output_filename=output_filename, **args)
+        assert not os.path.exists(output_filename)
+
+        # the first 2 batches are complete, only the rest is normalized after the restart
+        num_calls.clear()
+        fail_after[0] = None
+        self.normalizer_en.normalize_manifest(str(manifest), output_filename=output_filename, **args)
+        assert len(num_calls) == len(self.test_inputs) - 4
+        assert not os.path.exists(f"{output_filename}.checkpoint")
+
+        with open(output_filename, "r") as f:
+            lines = [json.loads(line) for line in f]
+        assert [line["id"] for line in lines] == list(range(len(self.test_inputs)))
+        for line in lines:
+            assert line["normalized"] == self.normalizer_en.normalize(line["text"], punct_post_process=True)
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_resume_grammar_changed(self, tmp_path, monkeypatch):
+        manifest = tmp_path / "manifest.json"
+        with open(manifest, "w") as f:
+            for idx, text in enumerate(self.test_inputs[:6]):
+                f.write(json.dumps({"id": idx, "text": text}) + "\n")
+        output_filename = str(tmp_path / "manifest_normalized.json")
+        args = dict(n_jobs=1, punct_pre_process=False, punct_post_process=False, batch_size=2, resume=True)
+
+        num_calls = []
+        fail_after = [4]
+        normalize_line = self.normalizer_en.normalize_line
+
+        def _failing_normalize_line(line, **kwargs):
+            if len(num_calls) == fail_after[0]:
+                raise KeyboardInterrupt
+            num_calls.append(line)
+            return normalize_line(line, **kwargs)
+
+        monkeypatch.setattr(self.normalizer_en, "normalize_line", _failing_normalize_line)
+        with pytest.raises(KeyboardInterrupt):
+            self.normalizer_en.normalize_manifest(str(manifest), output_filename=output_filename, **args)
+
+        # an edit of the grammar sources or data discards shards of the interrupted run
+        sources_fingerprint = cache_utils._sources_fingerprint
+        monkeypatch.setattr(cache_utils, "_sources_fingerprint", lambda path: sources_fingerprint(path) + "edited")
+        num_calls.clear()
+        fail_after[0] = None
+        self.normalizer_en.normalize_manifest(str(manifest), output_filename=output_filename, **args)
+        assert len(num_calls) == 6
@@ -0,0 +1,153 @@
+# Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+
+import pynini
+import pytest
+
+from nemo_text_processing.text_normalization import cache_utils
+from nemo_text_processing.text_normalization.en.taggers.punctuation import PunctuationFst
+from nemo_text_processing.text_normalization.en.taggers.tokenize_and_classify import ClassifyFst, get_classify_tasks
+from nemo_text_processing.text_normalization.en.taggers.word import WordFst
+from nemo_text_processing.text_normalization.en.utils import get_abs_path
+from nemo_text_processing.text_normalization.parallel_build import (
+    ATTRIBUTES_KEY,
+    GRAPHS_CACHE_DIR,
+    GraphTask,
+    _load_graph,
+    build_graphs,
+    graph_cache_keys,
+)
+
+
+class TestParallelBuild:
+    # dict is a picklable builder that returns its arguments
+    tasks = {
+        "money": GraphTask(dict, {"decimal": "decimal", "cardinal": "cardinal"}, {"name": "money"}),
+        "decimal": GraphTask(dict, {"cardinal": "cardinal"}, {"name": "decimal"}),
+        "cardinal": GraphTask(dict, {}, {"name": "cardinal"}),
+        "punct": GraphTask(dict, {}, {"name": "punct"}),
+    }
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    @pytest.mark.parametrize("n_jobs", [1, 2])
+    def test_build_graphs(self, n_jobs):
+        graphs = build_graphs(self.tasks, n_jobs=n_jobs)
+        assert set(graphs) == set(self.tasks)
+        assert graphs["money"]["decimal"] == {"name": "decimal", "cardinal": {"name": "cardinal"}}
+        assert graphs["money"]["cardinal"] == {"name": "cardinal"}
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_circular_dependency(self):
+        tasks = dict(self.tasks, cardinal=GraphTask(dict, {"money": "money"}, {}))
+        with pytest.raises(ValueError):
+            build_graphs(tasks)
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_parallel_classify(self):
+        sequential = ClassifyFst(input_case="cased", deterministic=True, n_jobs=1)
+        parallel = ClassifyFst(input_case="cased", deterministic=True, n_jobs=2)
+        assert sequential.fst.num_states() == parallel.fst.num_states()
+        num_arcs = [sum(fst.num_arcs(state) for state in fst.states()) for fst in [sequential.fst, parallel.fst]]
+        assert num_arcs[0] == num_arcs[1]
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_graph_cache_keys(self, tmp_path):
+        whitelist = tmp_path / "whitelist.tsv"
+        whitelist.write_text("Dr.\tdoctor\n")
+        tasks = dict(self.tasks, whitelist=GraphTask(dict, {}, {"input_file": str(whitelist)}))
+        keys = graph_cache_keys(tasks)
+
+        # a whitelist edit invalidates only the whitelist grammar
+        whitelist.write_text("Dr.\tdrive\n")
+        new_keys = graph_cache_keys(tasks)
+        assert [name for name in tasks if keys[name] != new_keys[name]] == ["whitelist"]
+
+        # dependents of a changed grammar are invalidated too
+        tasks["cardinal"] = GraphTask(dict, {}, {"name": "new cardinal"})
+        new_keys = graph_cache_keys(tasks)
+        assert sorted(name for name in tasks if keys[name] != new_keys[name]) == [
+            "cardinal",
+            "decimal",
+            "money",
+            "whitelist",
+        ]
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "data_file,expected",
+        [
+            ("data/whitelist/tts.tsv", ["measure", "range", "whitelist"]),
+            (
+                "data/number/teen.tsv",
+                ["cardinal", "date", "decimal", "electronic", "fraction", "measure", "money", "ordinal", "range"]
+                + ["serial", "time"],
+            ),
+        ],
+    )
+    def test_graph_cache_keys_data_files(self, data_file, expected, monkeypatch):
+        tasks = get_classify_tasks(input_case="cased")
+        keys = graph_cache_keys(tasks)
+
+        # a data file edit invalidates only the grammars that load it and their dependents,
+        # the edit is simulated by changing the hash of the file content
+        path = get_abs_path(data_file)
+        file_digest = cache_utils._file_digest
+        monkeypatch.setattr(
+            cache_utils, "_file_digest", lambda p, *args: file_digest(p, *args) + (b"edited" if p == path else b"")
+        )
+        new_keys = graph_cache_keys(tasks)
+        assert sorted(name for name in tasks if keys[name] != new_keys[name]) == expected
+
+        monkeypatch.undo()
+        assert graph_cache_keys(tasks) == keys
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_graph_cache(self, tmp_path):
+        tasks = {
+            "punct": GraphTask(PunctuationFst, {}, {"deterministic": True}),
+            "word": GraphTask(WordFst, {"punctuation": "punct"}, {"deterministic": True}),
+            "accep": GraphTask(pynini.accep, {}, {"astring": "abc"}),
+        }
+        graphs = build_graphs(tasks, cache_dir=str(tmp_path))
+        cache_files = sorted(os.listdir(tmp_path / GRAPHS_CACHE_DIR))
+        assert [f.rsplit("_", 1)[0] for f in cache_files] == ["accep", "punct", "word"]
+        assert all(f.endswith(".far") for f in cache_files)
+
+        restored = build_graphs(tasks, cache_dir=str(tmp_path))
+        assert isinstance(restored["word"], WordFst)
+        assert restored["punct"].punct_marks == graphs["punct"].punct_marks
+        assert restored["punct"].far_path == graphs["punct"].far_path
+        assert restored["word"].fst.num_states() == graphs["word"].fst.num_states()
+        assert restored["accep"].string() == "abc"
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_graph_cache_foreign_class(self, tmp_path):
+        # only grammar classes of the package are restored from the cache
+        cache_file = str(tmp_path / "graph.far")
+        far = pynini.Far(cache_file, mode="w")
+        far[ATTRIBUTES_KEY] = pynini.accep(
+            pynini.escape(json.dumps({"class": "os:system", "values": {}, "paths": {}}))
+        )
+        far.close()
+        assert _load_graph(cache_file) is None
@@ -0,0 +1,49 @@
+# Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from nemo_text_processing.text_normalization.data_loader_utils import post_process_punct
+
+
+class TestPostProcessPunct:
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "input, normalized_text, expected",
+        [
+            ("12 test' example", "twelve test 'example", "twelve test' example"),
+            ('(5) items: "a", "b".', '( five ) items : "a" , "b" .', '(five) items: "a", "b".'),
+            ("no punctuation", "no punctuation", "no punctuation"),
+            ("", "", ""),
+        ],
+    )
+    def test_post_process_punct(self, input, normalized_text, expected):
+        assert post_process_punct(input=input, normalized_text=normalized_text) == expected
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_unicode_punct(self):
+        input = "«Hello» , he said — «bye»"
+        normalized_text = "« Hello » , he said — « bye »"
+        assert post_process_punct(input=input, normalized_text=normalized_text) == normalized_text
+        assert post_process_punct(input=input, normalized_text=normalized_text, add_unicode_punct=True) == input
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_long_input(self):
+        input = " ".join(["hello, \"world\" (it's) 12 test' example."] * 2000)
+        normalized_text = input.replace("12", "twelve").replace("' example", " 'example")
+        expected = input.replace("12", "twelve")
+        assert post_process_punct(input=input, normalized_text=normalized_text) == expected
@@ -15,6 +15,7 @@
 import pytest
 
 from nemo_text_processing.text_normalization.normalize import Normalizer
+from nemo_text_processing.text_normalization.preprocessing_utils import merge_semiotic_spans
 
 from ..utils import CACHE_DIR
 
@@ -40,3 +41,28 @@ class TestTextSentenceSplit:
         for s, gt in zip(sentences, gt_sentences):
             print(s, gt)
         assert gt_sentences == sentences
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_normalize_document(self):
+        text = "He paid $123 for this desk. It weighs 5 kg; it arrived on Jan. 5, 2020 at 10am."
+        gt = (
+            "He paid one hundred and twenty three dollars for this desk. It weighs five kilograms; "
+            "it arrived on january fifth, twenty twenty at ten AM."
+        )
+        assert self.normalizer_en.normalize_document(text) == gt
+        assert self.normalizer_en.normalize_document(text, max_window_len=30) == gt
+        assert self.normalizer_en.normalize_document("") == ""
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_normalize_document_keeps_semiotic_spans(self):
+        text = "We met at 12:30 pm and paid $5 million for the old house by the river at 12 : 30 pm"
+        pieces = ["at 12", ":", "30 pm", "and", "paid $5", "million", "for"]
+        assert merge_semiotic_spans(pieces) == ["at 12 : 30 pm", "and", "paid $5 million", "for"]
+        expected = (
+            "We met at twelve thirty PM and paid five million dollars for the old house by the river "
+            "at twelve: thirty pm"
+        )
+        assert self.normalizer_en.normalize(text) == expected
+        assert self.normalizer_en.normalize_document(text, max_window_len=6) == expected
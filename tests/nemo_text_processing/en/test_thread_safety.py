@@ -0,0 +1,53 @@
+# Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from nemo_text_processing.text_normalization.normalize import Normalizer
+from nemo_text_processing.utils.logging import logger
+
+from ..utils import CACHE_DIR, parse_test_case_file
+
+
+class TestThreadSafety:
+    normalizer_en = Normalizer(input_case='cased', lang='en', cache_dir=CACHE_DIR, overwrite_cache=False)
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_concurrent_normalize(self):
+        texts = [written for written, _ in parse_test_case_file('en/data_text_normalization/test_cases_money.txt')]
+        texts += [written for written, _ in parse_test_case_file('en/data_text_normalization/test_cases_date.txt')]
+        expected = [self.normalizer_en.normalize(text, punct_post_process=True) for text in texts]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            # every text is normalized several times by different threads
+            outputs = list(
+                executor.map(lambda text: self.normalizer_en.normalize(text, punct_post_process=True), texts * 4)
+            )
+        assert outputs == expected * 4
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_logger_level_unchanged(self):
+        level = logger.level
+        logger.setLevel(logging.WARNING)
+        try:
+            self.normalizer_en.normalize("It costs $5.", verbose=True)
+            self.normalizer_en.normalize("It costs $5.", verbose=False)
+            assert logger.level == logging.WARNING
+        finally:
+            logger.setLevel(level)
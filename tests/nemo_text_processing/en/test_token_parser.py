@@ -0,0 +1,70 @@
+# Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pynini
+import pytest
+
+from nemo_text_processing.text_normalization.normalize import Normalizer
+from nemo_text_processing.text_normalization.token_parser import FastTokenParser, TokenParser
+
+from ..utils import CACHE_DIR, parse_test_case_file
+
+
+def _parse(parser, text):
+    try:
+        parser(text)
+        return parser.parse()
+    except Exception as e:
+        return type(e)
+
+
+class TestTokenParser:
+    normalizer_en = Normalizer(input_case='cased', lang='en', cache_dir=CACHE_DIR, overwrite_cache=False)
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "text",
+        [
+            'tokens { money { integer_part: "twenty" currency_maj: "dollars" } } tokens { name: "left" }',
+            'tokens { date { month: "may" day: "five" preserve_order: true } }  tokens { name: "}" } ',
+            'tokens { name: "" } tokens{name:"a \\" b" }',
+            'tokens { measure { cardinal { integer: "two" } units: "kilograms" } }',
+            # malformed texts, the same error is raised
+            'tokens { name: "left" ',
+            'tokens { name: "left"}',
+            'tokens { preserve_order: "true" }',
+            'tokens { name: true }',
+            'tokens',
+            '',
+        ],
+    )
+    def test_same_output(self, text):
+        assert _parse(FastTokenParser(), text) == _parse(TokenParser(), text)
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "test_file",
+        [
+            "en/data_text_normalization/test_cases_date.txt",
+            "en/data_text_normalization/test_cases_money.txt",
+            "en/data_text_normalization/test_cases_measure.txt",
+            "en/data_text_normalization/test_cases_electronic.txt",
+        ],
+    )
+    def test_tagged_test_cases(self, test_file):
+        for written, _ in parse_test_case_file(test_file):
+            tagged_text = Normalizer.select_tag(self.normalizer_en.find_tags(pynini.escape(written)))
+            assert _parse(FastTokenParser(), tagged_text) == _parse(TokenParser(), tagged_text)
@@ -0,0 +1,129 @@
+# Copyright (c) 2024, NVIDIA CORPORATION & AFFILIATES.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pytest
+
+from nemo_text_processing.text_normalization import worker_pool
+from nemo_text_processing.text_normalization.normalize import Normalizer
+
+from ..utils import CACHE_DIR, parse_test_case_file
+
+
+class TestWorkerPool:
+    normalizer_en = Normalizer(input_case='cased', lang='en', cache_dir=CACHE_DIR, overwrite_cache=False)
+    test_inputs = [text for text, _ in parse_test_case_file('en/data_text_normalization/test_cases_money.txt')]
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_normalize_list(self):
+        expected = [self.normalizer_en.normalize(text, punct_post_process=True) for text in self.test_inputs]
+        self.normalizer_en.start_pool(n_jobs=2, max_pending=3)
+        try:
+            # the same workers are reused across calls
+            for batch_size in [1, 7]:
+                pred = self.normalizer_en.normalize_list(
+                    self.test_inputs, punct_post_process=True, batch_size=batch_size
+                )
+                assert pred == expected
+        finally:
+            self.normalizer_en.close_pool()
+        assert self.normalizer_en.pool is None
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_normalize_manifest(self, tmp_path):
+        manifest = tmp_path / "manifest.json"
+        with open(manifest, "w") as f:
+            for idx, text in enumerate(self.test_inputs):
+                f.write(json.dumps({"id": idx, "text": text}) + "\n")
+
+        output_filename = str(tmp_path / "manifest_normalized.json")
+        self.normalizer_en.start_pool(n_jobs=2)
+        try:
+            self.normalizer_en.normalize_manifest(
+                str(manifest),
+                n_jobs=1,
+                punct_pre_process=False,
+                punct_post_process=True,
+                batch_size=5,
+                output_filename=output_filename,
+            )
+        finally:
+            self.normalizer_en.close_pool()
+
+        with open(output_filename, "r") as f:
+            lines = [json.loads(line) for line in f]
+        assert [line["id"] for line in lines] == list(range(len(self.test_inputs)))
+        for line in lines:
+            assert line["normalized"] == self.normalizer_en.normalize(line["text"], punct_post_process=True)
+
+    @pytest.mark.parametrize("n_jobs", [1, 2])
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_normalize_manifest_streaming(self, tmp_path, n_jobs):
+        manifest = tmp_path / "manifest.json"
+        with open(manifest, "w") as f:
+            for idx, text in enumerate(self.test_inputs):
+                f.write(json.dumps({"id": idx, "text": text}) + "\n")
+
+        self.normalizer_en.normalize_manifest(
+            str(manifest),
+            n_jobs=n_jobs,
+            punct_pre_process=False,
+            punct_post_process=True,
+            batch_size=3,
+            max_pending=2,
+        )
+
+        # only the input and the output manifests are left, temporary files are removed
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["manifest.json", "manifest_normalized.json"]
+        with open(tmp_path / "manifest_normalized.json", "r") as f:
+            lines = [json.loads(line) for line in f]
+        assert [line["id"] for line in lines] == list(range(len(self.test_inputs)))
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_shared_memory(self):
+        expected = [self.normalizer_en.normalize(text, punct_post_process=True) for text in self.test_inputs]
+        pool = self.normalizer_en.start_pool(n_jobs=2, share_memory=True)
+        try:
+            pred = self.normalizer_en.normalize_list(self.test_inputs, punct_post_process=True, batch_size=3)
+            assert pred == expected
+            report = pool.memory_report()
+        finally:
+            self.normalizer_en.close_pool()
+
+        workers = [process for process in report if process.startswith("worker")]
+        assert len(workers) > 0
+        for process in workers:
+            assert report[process]["pss"] <= report[process]["rss"]
+            assert report[process]["shared"] > 0
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_memory_report_unavailable(self, monkeypatch):
+        def missing_smaps(*args, **kwargs):
+            raise FileNotFoundError
+
+        # e.g. macOS or Linux kernels older than 4.14
+        monkeypatch.setattr(worker_pool, "open", missing_smaps, raising=False)
+        assert worker_pool.memory_usage() is None
+        pool = self.normalizer_en.start_pool(n_jobs=1)
+        try:
+            assert pool.memory_report() == {}
+            pool.log_memory_report()
+        finally:
+            self.normalizer_en.close_pool()
@@ -0,0 +1,269 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import glob
+import json
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import tempfile
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from typing import Any, Dict, List, Optional
+
+import pynini
+
+from nemo_text_processing.utils.logging import logger
+
+# This script benchmarks TN and ITN runtime for every language with a ClassifyFst:
+#   - cold start: normalizer creation with grammar build (empty .far cache)
+#   - warm start: normalizer creation with grammars restored from the .far cache
+#   - per-sentence latency percentiles and throughput on the test_cases_*.txt inputs and on synthetic long inputs
+# Start times are measured in fresh processes, so that imports and in-process caches don't affect them.
+#
+#   python benchmark.py --languages en de --modes tn itn --output_file=benchmark.json
+
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "nemo_text_processing")
+TESTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "tests", "nemo_text_processing")
+# benchmark modes: grammar package and test data directory
+MODES = {
+    "tn": ("text_normalization", "data_text_normalization"),
+    "itn": ("inverse_text_normalization", "data_inverse_text_normalization"),
+    "tn_audio": ("text_normalization", "data_text_normalization"),
+}
+PERCENTILES = [50, 95, 99]
+
+
+def get_languages(mode: str) -> List[str]:
+    """
+    Returns languages with a ClassifyFst tagger for the mode
+
+    Args:
+        mode: one of MODES
+    """
+    pattern = os.path.join(PACKAGE_DIR, MODES[mode][0], "*", "taggers", "tokenize_and_classify.py")
+    return sorted(os.path.basename(os.path.dirname(os.path.dirname(path))) for path in glob.glob(pattern))
+
+
+def create_normalizer(mode: str, lang: str, cache_dir: str, input_case: str) -> Any:
+    """
+    Creates normalizer of the mode
+
+    Args:
+        mode: one of MODES
+        lang: language code, e.g. "en"
+        cache_dir: path to a dir with .far grammar files
+        input_case: input capitalization
+    """
+    if mode == "tn":
+        from nemo_text_processing.text_normalization.normalize import Normalizer
+
+        return Normalizer(input_case=input_case, lang=lang, cache_dir=cache_dir)
+    elif mode == "itn":
+        from nemo_text_processing.inverse_text_normalization.inverse_normalize import InverseNormalizer
+
+        return InverseNormalizer(input_case=input_case, lang=lang, cache_dir=cache_dir)
+    else:
+        from nemo_text_processing.text_normalization.normalize_with_audio import NormalizerWithAudio
+
+        return NormalizerWithAudio(input_case=input_case, lang=lang, cache_dir=cache_dir)
+
+
+def _start_time(mode: str, lang: str, cache_dir: str, input_case: str) -> float:
+    """
+    Returns normalizer creation time in seconds, runs in a fresh process
+    """
+    start_time = perf_counter()
+    create_normalizer(mode, lang, cache_dir, input_case)
+    return perf_counter() - start_time
+
+
+def measure_start_time(mode: str, lang: str, cache_dir: str, input_case: str) -> float:
+    """
+    Returns normalizer creation time in seconds measured in a fresh process
+
+    Args:
+        mode: one of MODES
+        lang: language code, e.g. "en"
+        cache_dir: path to a dir with .far grammar files
+        input_case: input capitalization
+    """
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        return executor.submit(_start_time, mode, lang, cache_dir, input_case).result()
+
+
+def load_inputs(mode: str, lang: str, max_inputs: Optional[int] = None) -> List[str]:
+    """
+    Returns inputs of the test_cases_*.txt files of the language
+
+    Args:
+        mode: one of MODES
+        lang: language code, e.g. "en"
+        max_inputs: maximum number of inputs to return, all inputs by default
+    """
+    inputs = []
+    for path in sorted(glob.glob(os.path.join(TESTS_DIR, lang, MODES[mode][1], "test_cases_*.txt"))):
+        # lists normalization options rather than input~output pairs
+        if os.path.basename(path) == "test_cases_normalize_with_audio.txt":
+            continue
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                text = line.strip("\n").split("~")[0].strip()
+                if text:
+                    inputs.append(text)
+    return inputs[:max_inputs] if max_inputs else inputs
+
+
+def make_long_inputs(inputs: List[str], num_inputs: int, num_words: int, seed: int = 0) -> List[str]:
+    """
+    Returns synthetic long inputs made of random test inputs
+
+    Args:
+        inputs: test inputs
+        num_inputs: number of long inputs
+        num_words: minimum number of words of every long input
+        seed: random seed
+    """
+    if not inputs:
+        return []
+    rng = random.Random(seed)
+    long_inputs = []
+    for _ in range(num_inputs):
+        words = []
+        while len(words) < num_words:
+            words.extend(rng.choice(inputs).split())
+        long_inputs.append(" ".join(words))
+    return long_inputs
+
+
+def measure_latency(normalizer: Any, mode: str, inputs: List[str], warmup: int = 5) -> Dict[str, float]:
+    """
+    Returns latency percentiles in milliseconds and throughput in sentences per second
+
+    Args:
+        normalizer: normalizer to benchmark
+        mode: one of MODES
+        inputs: inputs to normalize
+        warmup: number of inputs to normalize before measuring
+    """
+    # punctuation post-processing is only defined for text normalization
+    kwargs = {} if mode == "itn" else {"punct_post_process": True}
+    if mode == "tn_audio":
+        kwargs["n_tagged"] = 10
+
+    for text in inputs[:warmup]:
+        normalizer.normalize(text, **kwargs)
+
+    latencies = []
+    for text in inputs:
+        start_time = perf_counter()
+        normalizer.normalize(text, **kwargs)
+        latencies.append(perf_counter() - start_time)
+
+    latencies.sort()
+    result = {"num_inputs": len(inputs), "sentences_per_sec": round(len(latencies) / sum(latencies), 2)}
+    for p in PERCENTILES:
+        idx = min(len(latencies) - 1, int(round(p / 100 * (len(latencies) - 1))))
+        result[f"p{p}_ms"] = round(latencies[idx] * 1000, 3)
+    return result
+
+
+def benchmark(mode: str, lang: str, args) -> Dict[str, Any]:
+    """
+    Runs all benchmarks of the mode and language
+
+    Args:
+        mode: one of MODES
+        lang: language code, e.g. "en"
+        args: command line arguments
+    """
+    result = {"mode": mode, "language": lang}
+    cache_dir = tempfile.mkdtemp(prefix=f"benchmark_{mode}_{lang}_")
+    try:
+        try:
+            result["cold_start_secs"] = round(measure_start_time(mode, lang, cache_dir, args.input_case), 3)
+            result["warm_start_secs"] = round(measure_start_time(mode, lang, cache_dir, args.input_case), 3)
+            normalizer = create_normalizer(mode, lang, cache_dir, args.input_case)
+        except Exception as e:
+            # only construction failures are skipped, e.g. tn_audio needs non-deterministic grammars that most
+            # languages don't have
+            logger.warning(f"Skipping {mode} benchmark for {lang}, the normalizer can't be created: {e!r}")
+            result["error"] = repr(e)
+            return result
+
+        inputs = load_inputs(mode, lang, args.max_inputs)
+        datasets = {
+            "test_cases": inputs,
+            "long": make_long_inputs(inputs, args.num_long_inputs, args.long_input_words, seed=args.seed),
+        }
+        result["latency"] = {
+            name: measure_latency(normalizer, mode, texts, warmup=args.warmup)
+            for name, texts in datasets.items()
+            if texts
+        }
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    return result
+
+
+def parse_args():
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--languages", help="languages to benchmark, by default all languages of the mode", nargs="+", default=None
+    )
+    parser.add_argument("--modes", help="modes to benchmark", nargs="+", choices=list(MODES), default=["tn", "itn"])
+    parser.add_argument(
+        "--input_case", help="input capitalization", choices=["lower_cased", "cased"], default="cased", type=str
+    )
+    parser.add_argument("--max_inputs", help="maximum number of test inputs per language", default=None, type=int)
+    parser.add_argument("--num_long_inputs", help="number of synthetic long inputs", default=20, type=int)
+    parser.add_argument("--long_input_words", help="number of words of synthetic long inputs", default=200, type=int)
+    parser.add_argument("--warmup", help="number of inputs to normalize before measuring", default=5, type=int)
+    parser.add_argument("--seed", help="random seed of synthetic long inputs", default=0, type=int)
+    parser.add_argument(
+        "--output_file", help="path to .json report, by default the report is printed", default=None, type=str
+    )
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    results = []
+    for mode in args.modes:
+        languages = get_languages(mode)
+        for lang in args.languages or languages:
+            if lang not in languages:
+                logger.warning(f"{lang} doesn't have {mode} grammars, skipping")
+                continue
+            logger.info(f"Benchmarking {mode} for {lang}")
+            results.append(benchmark(mode, lang, args))
+
+    report = {
+        "pynini_version": pynini.__version__,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    }
+    if args.output_file:
+        with open(args.output_file, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Benchmark results were written to {args.output_file}")
+    else:
+        print(json.dumps(report, indent=2))
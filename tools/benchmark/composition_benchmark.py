@@ -0,0 +1,124 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+import shutil
+import tempfile
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Any, Dict, List
+
+import pynini
+from benchmark import load_inputs, measure_latency
+
+from nemo_text_processing.inverse_text_normalization.inverse_normalize import InverseNormalizer
+from nemo_text_processing.text_normalization.normalize import Normalizer
+from nemo_text_processing.utils.logging import logger
+
+# This script compares per-sentence latency of normalizers with unsorted grammars and with grammars arc-sorted
+# by input label at load time (see Normalizer.sort_grammars()) on the test_cases_*.txt inputs, and checks that
+# the outputs are the same:
+#
+#   python composition_benchmark.py --languages en --modes tn itn --output_file=composition.json
+
+
+def create_normalizer(mode: str, lang: str, cache_dir: str, input_case: str, arcsort_grammars: bool) -> Normalizer:
+    """
+    Creates normalizer of the mode
+
+    Args:
+        mode: "tn" or "itn"
+        lang: language code, e.g. "en"
+        cache_dir: path to a dir with .far grammar files
+        input_case: input capitalization
+        arcsort_grammars: whether to sort arcs of the grammars
+    """
+    normalizer_cls = Normalizer if mode == "tn" else InverseNormalizer
+    return normalizer_cls(input_case=input_case, lang=lang, cache_dir=cache_dir, arcsort_grammars=arcsort_grammars)
+
+
+def measure_tagging(normalizer: Normalizer, inputs: List[str]) -> float:
+    """
+    Returns mean tagging time (composition with the tagger and shortest path) in milliseconds per sentence
+
+    Args:
+        normalizer: normalizer
+        inputs: inputs to tag
+    """
+    start_time = perf_counter()
+    for text in inputs:
+        Normalizer.select_tag(normalizer.find_tags(pynini.escape(text)))
+    return round((perf_counter() - start_time) * 1000 / len(inputs), 3)
+
+
+def benchmark(mode: str, lang: str, args) -> Dict[str, Any]:
+    """
+    Compares unsorted and sorted grammars of the mode and language
+
+    Args:
+        mode: "tn" or "itn"
+        lang: language code, e.g. "en"
+        args: command line arguments
+    """
+    result = {"mode": mode, "language": lang}
+    inputs = load_inputs(mode, lang, args.max_inputs)
+    cache_dir = tempfile.mkdtemp(prefix=f"composition_{mode}_{lang}_")
+    # punctuation post-processing is only defined for text normalization
+    kwargs = {"punct_post_process": True} if mode == "tn" else {}
+    try:
+        outputs = {}
+        for name, arcsort_grammars in [("unsorted", False), ("arcsorted", True)]:
+            normalizer = create_normalizer(mode, lang, cache_dir, args.input_case, arcsort_grammars)
+            result[name] = measure_latency(normalizer, mode, inputs, warmup=args.warmup)
+            result[name]["tagging_ms"] = measure_tagging(normalizer, inputs)
+            outputs[name] = [normalizer.normalize(text, **kwargs) for text in inputs]
+        result["speedup_p50"] = round(result["unsorted"]["p50_ms"] / result["arcsorted"]["p50_ms"], 2)
+        result["num_different_outputs"] = sum(a != b for a, b in zip(outputs["unsorted"], outputs["arcsorted"]))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    return result
+
+
+def parse_args():
+    parser = ArgumentParser()
+    parser.add_argument("--languages", help="languages to benchmark", nargs="+", default=["en"])
+    parser.add_argument("--modes", help="modes to benchmark", nargs="+", choices=["tn", "itn"], default=["tn", "itn"])
+    parser.add_argument(
+        "--input_case", help="input capitalization", choices=["lower_cased", "cased"], default="cased", type=str
+    )
+    parser.add_argument("--max_inputs", help="maximum number of test inputs per language", default=None, type=int)
+    parser.add_argument("--warmup", help="number of inputs to normalize before measuring", default=5, type=int)
+    parser.add_argument(
+        "--output_file", help="path to .json report, by default the report is printed", default=None, type=str
+    )
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    results = []
+    for mode in args.modes:
+        for lang in args.languages:
+            logger.info(f"Benchmarking {mode} composition for {lang}")
+            results.append(benchmark(mode, lang, args))
+
+    report = {"pynini_version": pynini.__version__, "results": results}
+    if args.output_file:
+        with open(args.output_file, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Benchmark results were written to {args.output_file}")
+    else:
+        print(json.dumps(report, indent=2))
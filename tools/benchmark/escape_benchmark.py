@@ -0,0 +1,143 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+import random
+import timeit
+import tracemalloc
+from argparse import ArgumentParser
+from typing import Any, Callable, Dict, List, Tuple
+
+import pynini
+from token_parser_benchmark import make_tagged_sentences
+
+from nemo_text_processing.text_normalization.normalize import SPACE_DUP, escape
+from nemo_text_processing.utils.logging import logger
+
+# This script compares the string handling of Normalizer.normalize() around the FST operations before and after
+# conditional escaping and list accumulation of the verbalized splits on long synthetic sentences: escaping of
+# the input and of the tagged permutations, and the assembly of the output. It reports allocated memory and time
+# per sentence and checks that the outputs are the same:
+#
+#   python escape_benchmark.py --num_words 100 1000
+
+WORDS = ["the", "meeting", "starts", "at", "ten", "thirty", "a m", "on", "january", "fifth", "twenty", "dollars"]
+# verbalized splits of a sentence, see Normalizer._split_tokens_to_reduce_number_of_permutations()
+WORDS_PER_SPLIT = 3
+
+
+def make_sentences(num_sentences: int, num_words: int, seed: int = 0) -> List[Tuple[str, List[str], List[str]]]:
+    """
+    Returns synthetic sentences with their tagged splits and verbalized splits
+
+    Args:
+        num_sentences: number of sentences
+        num_words: number of words of every sentence
+        seed: random seed
+    """
+    rng = random.Random(seed)
+    sentences = []
+    for tagged in make_tagged_sentences(num_sentences, num_words // WORDS_PER_SPLIT or 1, seed=seed):
+        words = [rng.choice(WORDS) for _ in range(num_words)]
+        splits = [" ".join(words[i : i + WORDS_PER_SPLIT]) for i in range(0, num_words, WORDS_PER_SPLIT)]
+        sentences.append((" ".join(words), tagged.split(" tokens ")[: len(splits)], splits))
+    return sentences
+
+
+def assemble_concat(text: str, tagged_splits: List[str], splits: List[str]) -> Tuple[str, str]:
+    """
+    String handling before the change: every text is escaped, the output is concatenated
+    """
+    text = pynini.escape(text)
+    output = ""
+    for tagged_text, split in zip(tagged_splits, splits):
+        tagged_text = pynini.escape(tagged_text)
+        output += ' ' + split
+    return text, SPACE_DUP.sub(' ', output[1:])
+
+
+def assemble_join(text: str, tagged_splits: List[str], splits: List[str]) -> Tuple[str, str]:
+    """
+    String handling after the change: only texts with brackets or backslashes are escaped, the output is joined
+    """
+    text = escape(text)
+    outputs = []
+    for tagged_text, split in zip(tagged_splits, splits):
+        tagged_text = escape(tagged_text)
+        outputs.append(split)
+    output = ' '.join(outputs)
+    if '  ' in output:
+        output = SPACE_DUP.sub(' ', output)
+    return text, output
+
+
+def measure_memory(fn: Callable, sentences: List[Tuple[str, List[str], List[str]]]) -> float:
+    """
+    Returns mean memory in bytes allocated on top of the inputs while processing a sentence
+
+    Args:
+        fn: string handling function
+        sentences: sentences with their tagged and verbalized splits
+    """
+    total = 0
+    for sentence in sentences:
+        tracemalloc.start()
+        fn(*sentence)
+        total += tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return round(total / len(sentences), 1)
+
+
+def compare(num_words: int, num_sentences: int, repeat: int, seed: int) -> Dict[str, Any]:
+    """
+    Compares both functions on sentences of the given length
+
+    Args:
+        num_words: number of words of every sentence
+        num_sentences: number of sentences
+        repeat: number of repetitions, the best time is reported
+        seed: random seed
+    """
+    sentences = make_sentences(num_sentences, num_words, seed=seed)
+    if [assemble_concat(*x) for x in sentences] != [assemble_join(*x) for x in sentences]:
+        raise ValueError(f"Outputs differ on sentences of {num_words} words")
+
+    result = {"num_words": num_words, "num_sentences": num_sentences}
+    for name, fn in [("concat", assemble_concat), ("join", assemble_join)]:
+        secs = min(timeit.repeat(lambda: [fn(*x) for x in sentences], number=1, repeat=repeat))
+        result[f"{name}_us"] = round(secs * 1e6 / num_sentences, 2)
+        result[f"{name}_peak_bytes"] = measure_memory(fn, sentences)
+    return result
+
+
+def parse_args():
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--num_words", help="numbers of words of synthetic sentences", nargs="+", default=[100, 1000], type=int
+    )
+    parser.add_argument("--num_sentences", help="number of synthetic sentences per size", default=100, type=int)
+    parser.add_argument("--repeat", help="number of repetitions, the best time is reported", default=5, type=int)
+    parser.add_argument("--seed", help="random seed of synthetic sentences", default=0, type=int)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    results = []
+    for num_words in args.num_words:
+        logger.info(f"Benchmarking sentences of {num_words} words")
+        results.append(compare(num_words, args.num_sentences, args.repeat, args.seed))
+    print(json.dumps(results, indent=2))
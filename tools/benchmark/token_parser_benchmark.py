@@ -0,0 +1,145 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+import random
+import timeit
+from argparse import ArgumentParser
+from typing import Any, Dict, List
+
+from nemo_text_processing.text_normalization.token_parser import FastTokenParser, TokenParser
+from nemo_text_processing.utils.logging import logger
+
+# This script compares TokenParser and FastTokenParser on tagged sentences, i.e. tagger outputs, and checks that
+# both parsers return the same tokens:
+#
+#   python token_parser_benchmark.py --num_words 10 100 1000
+#
+# By default the tagged sentences are synthetic, use --lang to tag the test_cases_*.txt inputs with the TN tagger
+# (requires pynini), or --input_file to parse tagged sentences from a file, one per line.
+
+TAGGED_TOKENS = [
+    'tokens { name: "the" }',
+    'tokens { name: "meeting" }',
+    'tokens { name: "," }',
+    'tokens { cardinal { integer: "twenty three" } }',
+    'tokens { money { integer_part: "five" fractional_part: "fifty" currency_maj: "dollars" } }',
+    'tokens { date { month: "january" day: "fifth" year: "twenty twenty four" preserve_order: true } }',
+    'tokens { time { hours: "ten" minutes: "thirty" suffix: "a m" } }',
+    'tokens { measure { cardinal { integer: "twelve" } units: "kilograms" } }',
+    'tokens { electronic { username: "cdf" domain: "abc.edu" } }',
+]
+
+
+def make_tagged_sentences(num_sentences: int, num_words: int, seed: int = 0) -> List[str]:
+    """
+    Returns synthetic tagged sentences made of random tagged tokens
+
+    Args:
+        num_sentences: number of sentences
+        num_words: number of tokens of every sentence
+        seed: random seed
+    """
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(TAGGED_TOKENS) for _ in range(num_words)) for _ in range(num_sentences)]
+
+
+def tag_test_cases(lang: str, max_inputs: int = None) -> List[str]:
+    """
+    Returns tagged test_cases_*.txt inputs of the language
+
+    Args:
+        lang: language code, e.g. "en"
+        max_inputs: maximum number of inputs to tag
+    """
+    import pynini
+    from benchmark import load_inputs
+
+    from nemo_text_processing.text_normalization.normalize import Normalizer
+
+    normalizer = Normalizer(input_case="cased", lang=lang)
+    return [
+        Normalizer.select_tag(normalizer.find_tags(pynini.escape(text)))
+        for text in load_inputs("tn", lang, max_inputs)
+    ]
+
+
+def parse_all(parser: Any, sentences: List[str]) -> List[List[dict]]:
+    """
+    Parses all tagged sentences
+
+    Args:
+        parser: TokenParser or FastTokenParser
+        sentences: tagged sentences
+    """
+    tokens = []
+    for sentence in sentences:
+        parser(sentence)
+        tokens.append(parser.parse())
+    return tokens
+
+
+def compare(name: str, sentences: List[str], repeat: int) -> Dict[str, Any]:
+    """
+    Returns parsing time of both parsers in milliseconds per sentence and the speedup
+
+    Args:
+        name: name of the dataset
+        sentences: tagged sentences
+        repeat: number of repetitions, the best time is reported
+    """
+    if parse_all(TokenParser(), sentences) != parse_all(FastTokenParser(), sentences):
+        raise ValueError(f"TokenParser and FastTokenParser outputs differ on {name}")
+
+    result = {"dataset": name, "num_sentences": len(sentences)}
+    for parser in [TokenParser(), FastTokenParser()]:
+        secs = min(timeit.repeat(lambda: parse_all(parser, sentences), number=1, repeat=repeat))
+        result[f"{type(parser).__name__}_ms"] = round(secs * 1000 / len(sentences), 4)
+    result["speedup"] = round(result["TokenParser_ms"] / result["FastTokenParser_ms"], 2)
+    return result
+
+
+def parse_args():
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--num_words", help="numbers of tokens of synthetic sentences", nargs="+", default=[10, 100, 1000], type=int
+    )
+    parser.add_argument("--num_sentences", help="number of synthetic sentences per size", default=100, type=int)
+    parser.add_argument("--lang", help="language of the test inputs to tag", default=None, type=str)
+    parser.add_argument("--max_inputs", help="maximum number of test inputs to tag", default=None, type=int)
+    parser.add_argument("--input_file", help="path to a file with tagged sentences", default=None, type=str)
+    parser.add_argument("--repeat", help="number of repetitions, the best time is reported", default=5, type=int)
+    parser.add_argument("--seed", help="random seed of synthetic sentences", default=0, type=int)
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    datasets = {
+        f"synthetic_{num_words}_tokens": make_tagged_sentences(args.num_sentences, num_words, seed=args.seed)
+        for num_words in args.num_words
+    }
+    if args.lang:
+        datasets[f"{args.lang}_test_cases"] = tag_test_cases(args.lang, args.max_inputs)
+    if args.input_file:
+        with open(args.input_file, "r", encoding="utf-8") as f:
+            datasets[args.input_file] = [line.strip() for line in f if line.strip()]
+
+    results = []
+    for name, sentences in datasets.items():
+        logger.info(f"Parsing {name}")
+        results.append(compare(name, sentences, args.repeat))
+    print(json.dumps(results, indent=2))
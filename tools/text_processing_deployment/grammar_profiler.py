@@ -0,0 +1,229 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import functools
+import importlib
+import inspect
+import json
+import pkgutil
+import sys
+import time
+from argparse import ArgumentParser
+from contextlib import contextmanager
+from typing import Any, Dict, List
+
+import pynini
+import pywrapfst
+
+from nemo_text_processing.utils.logging import logger
+
+# This script builds TN or ITN grammars of a language from scratch (the .far cache is not used) and reports build time
+# and size of every sub-grammar (GraphFst), e.g. to track grammar bloat and build time regressions across releases:
+#
+#   python grammar_profiler.py --language=en --grammars=tn_grammars --output_file=en_tn_profile.json
+#
+# Build time of a sub-grammar includes build time of the sub-grammars created by it (see "depth" of the records),
+# but not the time spent on profiling them.
+
+PACKAGE = "nemo_text_processing"
+GRAMMAR_PACKAGES = {"tn_grammars": "text_normalization", "itn_grammars": "inverse_text_normalization"}
+# reported FST properties
+PROPERTIES = ["ACCEPTOR", "I_DETERMINISTIC", "O_DETERMINISTIC", "EPSILONS", "I_EPSILONS", "O_EPSILONS", "CYCLIC"]
+
+
+def import_grammars(grammars: str, language: str):
+    """
+    Imports all modules of the language package so that all GraphFst subclasses are loaded before profiling
+
+    Args:
+        grammars: "tn_grammars" or "itn_grammars"
+        language: language code, e.g. "en"
+    """
+    package = importlib.import_module(f"{PACKAGE}.{GRAMMAR_PACKAGES[grammars]}.{language}")
+    for module in pkgutil.walk_packages(package.__path__, prefix=f"{package.__name__}."):
+        try:
+            importlib.import_module(module.name)
+        except ImportError as e:
+            logger.warning(f"Skipping {module.name}: {e}")
+
+
+def graph_classes() -> List[type]:
+    """
+    Returns loaded GraphFst subclasses of the package that define their own constructor
+    """
+    classes = []
+    for name, module in list(sys.modules.items()):
+        if not name.startswith(f"{PACKAGE}.") or module is None:
+            continue
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if (
+                cls.__module__ == name
+                and cls.__name__ != "GraphFst"
+                and "__init__" in cls.__dict__
+                and any(base.__name__ == "GraphFst" for base in cls.__mro__)
+            ):
+                classes.append(cls)
+    return classes
+
+
+def fst_stats(fst: "pynini.FstLike", optimize: bool = True) -> Dict[str, Any]:
+    """
+    Returns size and properties of the FST
+
+    Args:
+        fst: FST
+        optimize: set to True to measure optimize() time of a copy of the FST
+    """
+    flags = getattr(pywrapfst, "FstProperties", pywrapfst)
+    stats = {
+        "states": fst.num_states(),
+        "arcs": sum(fst.num_arcs(state) for state in fst.states()),
+        "bytes": len(fst.write_to_string()),
+    }
+    for name in PROPERTIES:
+        flag = getattr(flags, name)
+        stats[name.lower()] = fst.properties(flag, True) == flag
+    if optimize:
+        start_time = time.time()
+        fst.copy().optimize()
+        stats["optimize_secs"] = round(time.time() - start_time, 4)
+    return stats
+
+
+@contextmanager
+def profile_graphs(records: List[Dict[str, Any]], optimize: bool = True):
+    """
+    Wraps constructors of all loaded GraphFst subclasses to record build time and FST stats of every created
+    sub-grammar, the constructors are restored on exit
+
+    Args:
+        records: list to append the records to
+        optimize: set to True to measure optimize() time of every sub-grammar
+    """
+    # instances being built with the time spent on profiling of the sub-grammars they created
+    building = []
+    originals = {}
+
+    def _wrap(init):
+        @functools.wraps(init)
+        def _profiled_init(self, *args, **kwargs):
+            # constructors of the base classes are called for the same instance
+            if any(frame[0] is self for frame in building):
+                return init(self, *args, **kwargs)
+            depth = len(building)
+            frame = [self, 0.0]
+            building.append(frame)
+            start_time = time.time()
+            try:
+                init(self, *args, **kwargs)
+            finally:
+                building.pop()
+            build_time = time.time() - start_time - frame[1]
+
+            start_time = time.time()
+            record = {
+                "name": type(self).__name__,
+                "module": type(self).__module__,
+                "kind": getattr(self, "kind", None),
+                "depth": depth,
+                "build_secs": round(build_time, 4),
+            }
+            fst = getattr(self, "fst", None)
+            if isinstance(fst, pynini.Fst):
+                record.update(fst_stats(fst, optimize=optimize))
+            records.append(record)
+            # profiling time is excluded from build time of the parent sub-grammars
+            for parent_frame in building:
+                parent_frame[1] += frame[1] + time.time() - start_time
+
+        return _profiled_init
+
+    for cls in graph_classes():
+        originals[cls] = cls.__dict__["__init__"]
+        cls.__init__ = _wrap(originals[cls])
+    try:
+        yield records
+    finally:
+        for cls, init in originals.items():
+            cls.__init__ = init
+
+
+def build_grammars(grammars: str, language: str, input_case: str, whitelist: str = None):
+    """
+    Builds tagger, verbalizer and post-processing grammars of the language without the .far cache
+
+    Args:
+        grammars: "tn_grammars" or "itn_grammars"
+        language: language code, e.g. "en"
+        input_case: input capitalization
+        whitelist: path to a file with whitelist replacements
+    """
+    if grammars == "tn_grammars":
+        from nemo_text_processing.text_normalization.normalize import Normalizer
+
+        Normalizer(input_case=input_case, lang=language, cache_dir=None, whitelist=whitelist)
+    else:
+        from nemo_text_processing.inverse_text_normalization.inverse_normalize import InverseNormalizer
+
+        InverseNormalizer(input_case=input_case, lang=language, cache_dir=None, whitelist=whitelist)
+
+
+def parse_args():
+    parser = ArgumentParser()
+    parser.add_argument("--language", help="language", default="en", type=str)
+    parser.add_argument(
+        "--grammars", help="grammars to profile", choices=["tn_grammars", "itn_grammars"], type=str, required=True
+    )
+    parser.add_argument(
+        "--input_case", help="input capitalization", choices=["lower_cased", "cased"], default="cased", type=str
+    )
+    parser.add_argument(
+        "--whitelist",
+        help="Path to a file with with whitelist replacements. If None, the default file will be used.",
+        default=None,
+        type=lambda x: None if x == "None" else x,
+    )
+    parser.add_argument(
+        "--skip_optimize", help="set to True to skip measuring optimize() time of sub-grammars", action="store_true"
+    )
+    parser.add_argument(
+        "--output_file", help="path to .json report, by default the report is printed", default=None, type=str
+    )
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    import_grammars(args.grammars, args.language)
+    records = []
+    start_time = time.time()
+    with profile_graphs(records, optimize=not args.skip_optimize):
+        build_grammars(args.grammars, args.language, args.input_case, args.whitelist)
+
+    report = {
+        "language": args.language,
+        "grammars": args.grammars,
+        "input_case": args.input_case,
+        "pynini_version": pynini.__version__,
+        "total_secs": round(time.time() - start_time, 4),
+        "graphs": records,
+    }
+    if args.output_file:
+        with open(args.output_file, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Profile of {len(records)} grammars was written to {args.output_file}")
+    else:
+        print(json.dumps(report, indent=2))